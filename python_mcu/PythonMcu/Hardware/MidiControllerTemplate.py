@@ -63,6 +63,11 @@ class MidiControllerTemplate:
 
         self._show_overlay = [False, False]
 
+        # LCD changes are sent right away unless an update interval
+        # has been set (see "set_lcd_update_interval()")
+        self._collect_lcd_updates = False
+        self._lcd_dirty = False
+
         self._log('Initialising MIDI ports...', True)
         self._midi_input_name = midi_input_name
         self._midi_output_name = midi_output_name
@@ -131,15 +136,24 @@ class MidiControllerTemplate:
         return self.meter_bridge_available
 
     # --- MIDI processing ---
+    def get_midi_connection(self):
+        return self.midi
+
     def process_midi_input(self):
         self.midi.process_input_buffer()
 
-    def receive_midi(self, status, message):
+    def receive_midi(self, status, message, timestamp=None):
         message_string = ['status %02X: ' % status]
         for byte in message:
             message_string.append('%02X' % byte)
         self._log(' '.join(message_string))
 
+    def burst(self):
+        """
+        context manager that sends all MIDI messages within in one go
+        """
+        return self.midi.burst()
+
     def send_midi_control_change(self, channel, cc_number, cc_value):
         self.midi.send_control_change(channel, cc_number, cc_value)
 
@@ -167,6 +181,21 @@ class MidiControllerTemplate:
         else:
             self.interconnector.register_control(mcu_command, midi_switch, midi_switch)
 
+    def register_controls(self, layout):
+        """
+        layout: list of (mcu_command, midi_switch) or (mcu_command,
+        midi_switch, midi_led) tuples; "mcu_command" None withdraws
+        the control
+        """
+        controls = []
+        for control in layout:
+            if len(control) == 3 and control[2]:
+                controls.append(control)
+            else:
+                controls.append((control[0], control[1], control[1]))
+
+        self.interconnector.register_controls(controls)
+
     def withdraw_control(self, midi_switch):
         self.interconnector.withdraw_control(midi_switch)
 
@@ -189,7 +218,10 @@ class MidiControllerTemplate:
             position += 1
 
         if update:
-            self.update_lcd()
+            if self._collect_lcd_updates:
+                self._lcd_dirty = True
+            else:
+                self.update_lcd()
 
     def set_led(self, internal_id, led_status):
         pass
@@ -235,11 +267,16 @@ class MidiControllerTemplate:
     def set_peak_level(self, meter_id, meter_level):
         if meter_level == 0x0F:
             self._log('Meter #%d overload NOT cleared.' % meter_id)
-        elif meter_level == 0x0F:
+        elif meter_level == 0x0E:
             self._log('Meter #%d NOT set to overload.' % meter_id)
         else:
             self._log('Meter #%d NOT set to %03d%%.' % (meter_id, meter_level * 10))
 
+    def set_peak_hold(self, meter_id, peak_level):
+        # meters are decayed by Python MCU; controllers that can
+        # display held peaks may override this
+        pass
+
     def fader_moved(self, fader_id, fader_position):
         self._log('Hardware fader #%d NOT moved to position %04d.' % (fader_id, fader_position))
 
@@ -253,6 +290,23 @@ class MidiControllerTemplate:
         self._log('Hardware LEDs NOT set to "off".')
 
     # --- LCD and menu handling
+    def set_lcd_update_interval(self, interval, add_timer):
+        """
+        interval: minimum time (in seconds) between LCD updates; when
+        set, LCD changes are collected and sent by "flush_lcd()",
+        which is registered using "add_timer(interval, callback)"
+        (0 updates the LCD right away)
+        """
+        self._collect_lcd_updates = interval > 0
+
+        if self._collect_lcd_updates:
+            add_timer(interval, self.flush_lcd)
+
+    def flush_lcd(self, _now=None):
+        if self._lcd_dirty:
+            self._lcd_dirty = False
+            self.update_lcd()
+
     def update_lcd(self):
         pass
 
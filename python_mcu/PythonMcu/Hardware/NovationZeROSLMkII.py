@@ -42,6 +42,9 @@ class NovationZeROSLMkII(MidiControllerTemplate):
     # MIDI device ID and initialisation of Novation ZeRO SL Mkii
     MIDI_DEVICE_ID = [0x03, 0x03, 0x12, 0x00, 0x04, 0x00]
 
+    # start of SysEx messages sent by the controller
+    _MIDI_SYSEX_HEADER = bytes([0xF0] + MIDI_MANUFACTURER_ID + MIDI_DEVICE_ID)
+
     # MIDI channel of controller
     _MIDI_DEVICE_CHANNEL = 0
 
@@ -77,6 +80,9 @@ class NovationZeROSLMkII(MidiControllerTemplate):
     _MIDI_CC_LED_AUTOMAP_FX = 0x4B
     _MIDI_CC_LED_AUTOMAP_MIXER = 0x4D
 
+    # LED states are unknown after connecting, so they are sent again
+    _LED_UNKNOWN = 0xFF
+
     _MODE_TRACK_OFF = 0
     _MODE_TRACK_MUTE_SOLO = 1
     _MODE_TRACK_RECORD_READY_FUNCTION = 2
@@ -103,6 +109,12 @@ class NovationZeROSLMkII(MidiControllerTemplate):
 
         self._lcd_strings = ['', '']
 
+        # characters sent to the four LCD blocks ("None": unknown)
+        self._lcd_blocks = [None] * 4
+
+        # values sent to the controller's LEDs, indexed by CC number
+        self._led_states = bytearray([self._LED_UNKNOWN]) * 128
+
         self._vpot_modes = [0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00]
         self._vpot_positions = [0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00]
 
@@ -113,6 +125,10 @@ class NovationZeROSLMkII(MidiControllerTemplate):
 
         self._is_connected = False
 
+        # initialised by set_interconnector()
+        self._cc_handlers = None
+        self._cc_handlers_global_view = None
+
     @staticmethod
     def get_usage_hint():
         return 'Connect the controller\'s USB port to your computer ' + \
@@ -121,21 +137,29 @@ class NovationZeROSLMkII(MidiControllerTemplate):
     def _log(self, message, repaint=False):
         self.callback_log('[Novation ZeRO SL MkII]  ' + message, repaint)
 
+    def set_interconnector(self, host):
+        MidiControllerTemplate.set_interconnector(self, host)
+        self._build_cc_handlers()
+
     # --- initialisation ---
     def connect(self):
         MidiControllerTemplate.connect(self)
         self._is_connected = True
 
+        self._invalidate_leds()
+        self._invalidate_lcd()
+
         self.set_lcd_directly(0, 'Novation ZeRO SL MkII:  initialising...')
         self.set_lcd_directly(1, 'Mackie Host Control:    connecting...')
 
-        self._enter_ableton_mode()
+        with self.burst():
+            self._enter_ableton_mode()
 
-        # select "track" mode ("Mute" + "Solo")
-        self._mode_track = self._MODE_TRACK_MUTE_SOLO
-        self._restore_previous_mode()
+            # select "track" mode ("Mute" + "Solo")
+            self._mode_track = self._MODE_TRACK_MUTE_SOLO
+            self._restore_previous_mode()
 
-        self.set_lcd_directly(0, 'Novation ZeRO SL MkII:  initialised.')
+            self.set_lcd_directly(0, 'Novation ZeRO SL MkII:  initialised.')
 
         self._log('Connected.', True)
 
@@ -155,14 +179,16 @@ class NovationZeROSLMkII(MidiControllerTemplate):
     def go_online(self):
         MidiControllerTemplate.go_online(self)
 
-        self.set_lcd_directly(0, 'Novation ZeRO SL MkII:  initialised.')
-        self.set_lcd_directly(1, 'Mackie Host Control:    online.')
+        with self.burst():
+            self.set_lcd_directly(0, 'Novation ZeRO SL MkII:  initialised.')
+            self.set_lcd_directly(1, 'Mackie Host Control:    online.')
 
     def go_offline(self):
         MidiControllerTemplate.go_offline(self)
 
-        self.set_lcd_directly(0, 'Novation ZeRO SL MkII:  initialised.')
-        self.set_lcd_directly(1, 'Mackie Host Control:    offline.')
+        with self.burst():
+            self.set_lcd_directly(0, 'Novation ZeRO SL MkII:  initialised.')
+            self.set_lcd_directly(1, 'Mackie Host Control:    offline.')
 
     def _enter_ableton_mode(self):
         self._log('Entering "Ableton" mode...', True)
@@ -170,7 +196,7 @@ class NovationZeROSLMkII(MidiControllerTemplate):
         self.send_midi_sysex([0x01, 0x01])
 
         # clear all LEDs and switch off "transport" mode
-        self.send_midi_control_change(cc_number=self._MIDI_CC_CLEAR_ALL_LEDS, cc_value=0x00)
+        self._clear_all_leds()
         self.send_midi_control_change(cc_number=self._MIDI_CC_BUTTON_MODE_TRANSPORT, cc_value=0x00)
 
     def _leave_ableton_mode(self):
@@ -180,33 +206,39 @@ class NovationZeROSLMkII(MidiControllerTemplate):
         self.send_midi_sysex([0x01, 0x00])
 
         # clear all LEDs and switch off "transport" mode
-        self.send_midi_control_change(cc_number=self._MIDI_CC_CLEAR_ALL_LEDS, cc_value=0x00)
+        self._clear_all_leds()
         self.send_midi_control_change(cc_number=self._MIDI_CC_BUTTON_MODE_TRANSPORT, cc_value=0x00)
 
     # --- MIDI processing ---
-    def receive_midi(self, status, message):
+    def receive_midi(self, status, message, timestamp=None):
         if (message[0] == 0xF0) and (message[-1] == 0xF7):
-            if (message[1:4] == self.MIDI_MANUFACTURER_ID) and (message[4:10] == self.MIDI_DEVICE_ID):
-                sysex_message = message[10:-1]
+            # Automap status: F0 <header> 01 <online> F7
+            if len(message) == 13 and message[10] == 0x01 and message.startswith(self._MIDI_SYSEX_HEADER):
+                automap_online = message[11]
 
-                if sysex_message == [1, 0]:
+                if automap_online == 0x00:
                     self._leave_ableton_mode()
 
                     self._mode_automap = True
                     self._is_connected = False
-                elif sysex_message == [1, 1]:
+                elif automap_online == 0x01:
                     if self._mode_automap:
                         self._mode_automap = False
                         self._is_connected = True
 
-                        self._enter_ableton_mode()
+                        with self.burst():
+                            self._enter_ableton_mode()
 
-                        self._restore_previous_mode()
-                        self._restore_vpots()
+                            self._restore_previous_mode()
+                            self._restore_vpots()
 
-                        # force update of LCD
-                        self._lcd_strings = ['', '']
-                        self.update_lcd()
+                            # "Automap" has used the LEDs, encoder rings
+                            # and displays, too
+                            self.interconnector.repaint_hardware_controller()
+
+                            # force update of LCD
+                            self._invalidate_lcd()
+                            self.update_lcd()
 
             # all MIDI SysEx messages handled (including invalid
             # ones), so quit processing here
@@ -215,64 +247,77 @@ class NovationZeROSLMkII(MidiControllerTemplate):
         if not self._is_connected:
             return
 
-        cc_selector = {
-            self._MIDI_CC_FADERS: 'self.interconnector.move_fader_7bit(0, %d)',
-            self._MIDI_CC_FADERS + 1: 'self.interconnector.move_fader_7bit(1, %d)',
-            self._MIDI_CC_FADERS + 2: 'self.interconnector.move_fader_7bit(2, %d)',
-            self._MIDI_CC_FADERS + 3: 'self.interconnector.move_fader_7bit(3, %d)',
-            self._MIDI_CC_FADERS + 4: 'self.interconnector.move_fader_7bit(4, %d)',
-            self._MIDI_CC_FADERS + 5: 'self.interconnector.move_fader_7bit(5, %d)',
-            self._MIDI_CC_FADERS + 6: 'self.interconnector.move_fader_7bit(6, %d)',
-            self._MIDI_CC_FADERS + 7: 'self.interconnector.move_fader_7bit(7, %d)',
-            self._MIDI_CC_ENCODERS: 'self.interconnector.move_vpot_raw(0, %d)',
-            self._MIDI_CC_ENCODERS + 1: 'self.interconnector.move_vpot_raw(1, %d)',
-            self._MIDI_CC_ENCODERS + 2: 'self.interconnector.move_vpot_raw(2, %d)',
-            self._MIDI_CC_ENCODERS + 3: 'self.interconnector.move_vpot_raw(3, %d)',
-            self._MIDI_CC_ENCODERS + 4: 'self.interconnector.move_vpot_raw(4, %d)',
-            self._MIDI_CC_ENCODERS + 5: 'self.interconnector.move_vpot_raw(5, %d)',
-            self._MIDI_CC_ENCODERS + 6: 'self.interconnector.move_vpot_raw(6, %d)',
-            self._MIDI_CC_ENCODERS + 7: 'self.interconnector.move_vpot_raw(7, %d)',
-            self._MIDI_CC_CONTROL_PEDAL: 'self.on_control_pedal(%d & 0x01)',
-            self._MIDI_CC_BUTTON_BANK_UP: 'self._change_mode_edit(%d & 0x01)',
-            self._MIDI_CC_BUTTON_BANK_DOWN: 'self._change_mode_track(%d & 0x01)',
-            self._MIDI_CC_BUTTONS_RIGHT_BOTTOM: 'self._change_mode_bank(%d & 0x01)',
-            self._MIDI_CC_BUTTONS_RIGHT_BOTTOM + 1: 'self._change_mode_automation(%d & 0x01)',
-            self._MIDI_CC_BUTTONS_RIGHT_BOTTOM + 2: 'self._change_mode_global_view(%d & 0x01)',
-            self._MIDI_CC_BUTTONS_RIGHT_BOTTOM + 3: 'self._change_mode_utility(%d & 0x01)',
-            self._MIDI_CC_BUTTON_MODE_TRANSPORT: 'self._change_mode_transport(%d & 0x01)',
-        }
-
-        # make sure that no submenu disturbs toggling the "Global
-        # View" mode
-        if self._mode_other == self._MODE_OTHER_GLOBAL_VIEW:
-            del cc_selector[self._MIDI_CC_BUTTONS_RIGHT_BOTTOM + 1]
-
         if status == (MidiConnection.CONTROL_CHANGE + self._MIDI_DEVICE_CHANNEL):
-            cc_number = message[1]
-            cc_value = message[2]
-
-            if cc_number in cc_selector:
-                eval(cc_selector[cc_number] % cc_value)
-            elif cc_number == 0x6B:
-                # this controller change message is sent on entering
-                # and leaving "Automap" mode and can be probably
-                # ignored
-                pass
+            # make sure that no submenu disturbs toggling the "Global
+            # View" mode
+            if self._mode_other == self._MODE_OTHER_GLOBAL_VIEW:
+                (cc_handler, argument) = self._cc_handlers_global_view[message[1]]
             else:
-                internal_id = 'cc%d' % cc_number
-                status = cc_value & 0x01
-                key_processed = self.interconnector.keypress(internal_id, status)
-
-                if not key_processed:
-                    message_string = ['status %02X: ' % status]
-                    for byte in message:
-                        message_string.append('%02X' % byte)
-                    self._log(' '.join(message_string))
+                (cc_handler, argument) = self._cc_handlers[message[1]]
+
+            cc_handler(argument, message[2])
         else:
-            message_string = ['status %02X: ' % status]
-            for byte in message:
-                message_string.append('%02X' % byte)
-            self._log(' '.join(message_string))
+            self._log_midi(status, message)
+
+    def _log_midi(self, status, message):
+        message_string = ['status %02X: ' % status]
+        for byte in message:
+            message_string.append('%02X' % byte)
+        self._log(' '.join(message_string))
+
+    def _build_cc_handlers(self):
+        """
+        map every controller number to a (method, argument) tuple; the
+        method is called with the argument and the controller value
+        """
+        interconnector = self.interconnector
+
+        # unknown controllers are passed on as key presses ("cc8",
+        # "cc9" and so on)
+        self._cc_handlers = []
+        for cc_number in range(128):
+            self._cc_handlers.append((self._keypress_cc, 'cc%d' % cc_number))
+
+        for channel in range(8):
+            self._cc_handlers[self._MIDI_CC_FADERS + channel] = (interconnector.move_fader_7bit, channel)
+            self._cc_handlers[self._MIDI_CC_ENCODERS + channel] = (interconnector.move_vpot_raw, channel)
+
+        for (cc_number, method) in (
+                (self._MIDI_CC_CONTROL_PEDAL, self.on_control_pedal),
+                (self._MIDI_CC_BUTTON_BANK_UP, self._change_mode_edit),
+                (self._MIDI_CC_BUTTON_BANK_DOWN, self._change_mode_track),
+                (self._MIDI_CC_BUTTONS_RIGHT_BOTTOM, self._change_mode_bank),
+                (self._MIDI_CC_BUTTONS_RIGHT_BOTTOM + 1, self._change_mode_automation),
+                (self._MIDI_CC_BUTTONS_RIGHT_BOTTOM + 2, self._change_mode_global_view),
+                (self._MIDI_CC_BUTTONS_RIGHT_BOTTOM + 3, self._change_mode_utility),
+                (self._MIDI_CC_BUTTON_MODE_TRANSPORT, self._change_mode_transport)):
+            self._cc_handlers[cc_number] = (self._press_mode_button, method)
+
+        # this controller change message is sent on entering and
+        # leaving "Automap" mode and can be probably ignored
+        self._cc_handlers[0x6B] = (self._ignore_cc, None)
+
+        # in "Global View" mode, the "automation" button is registered
+        # as an MCU key
+        cc_number = self._MIDI_CC_BUTTONS_RIGHT_BOTTOM + 1
+        self._cc_handlers_global_view = list(self._cc_handlers)
+        self._cc_handlers_global_view[cc_number] = (self._keypress_cc, 'cc%d' % cc_number)
+
+    def _press_mode_button(self, method, cc_value):
+        # mode changes register lots of controls, so send resulting
+        # LED updates in one go
+        with self.burst():
+            method(cc_value & 0x01)
+
+    def _keypress_cc(self, internal_id, cc_value):
+        key_processed = self.interconnector.keypress(internal_id, cc_value & 0x01)
+
+        if not key_processed:
+            self._log('%s: %02X NOT registered.' % (internal_id, cc_value))
+
+    @staticmethod
+    def _ignore_cc(_argument, _cc_value):
+        pass
 
     def send_midi_control_change(self, channel=None, cc_number=None, cc_value=None):
         if not self._is_connected:
@@ -308,6 +353,20 @@ class NovationZeROSLMkII(MidiControllerTemplate):
 
         self.interconnector.register_control(mcu_command, midi_switch_cc, midi_led_cc)
 
+    def register_controls(self, layout):
+        controls = []
+        for control in layout:
+            midi_switch_cc = 'cc%d' % control[1]
+
+            if len(control) == 3 and control[2]:
+                midi_led_cc = 'cc%d' % control[2]
+            else:
+                midi_led_cc = midi_switch_cc
+
+            controls.append((control[0], midi_switch_cc, midi_led_cc))
+
+        self.interconnector.register_controls(controls)
+
     def withdraw_control(self, midi_switch):
         midi_switch_cc = 'cc%d' % midi_switch
 
@@ -343,6 +402,12 @@ class NovationZeROSLMkII(MidiControllerTemplate):
 
                 self._update_lcd_raw(line, hex_codes)
 
+    def _invalidate_lcd(self):
+        # contents of the controller's LCD are unknown (for example
+        # after leaving "Automap" mode), so send everything again
+        self._lcd_strings = ['', '']
+        self._lcd_blocks = [None] * 4
+
     def _update_lcd_raw(self, line, hex_codes):
         """
         send hex codes of 72 bytes to controller LCD
@@ -355,28 +420,38 @@ class NovationZeROSLMkII(MidiControllerTemplate):
 
         assert len(hex_codes) == 72
 
+        # convert illegal characters to asterisk
+        lcd_block = bytearray(
+            hex_code if 0x20 <= hex_code <= 0x7F else 0x2A
+            for hex_code in hex_codes
+        )
+
+        # both display blocks of a row show the same characters:
+        # * 0x01  -->  top row (left controller block)
+        # * 0x02  -->  top row (right controller block)
+        # * 0x03  -->  bottom row (left controller block)
+        # * 0x04  -->  bottom row (right controller block)
         line %= 2
         if line == 0:
-            display_line = 1
+            display_lines = (1, 2)
         else:
-            display_line = 3
-        sysex_data = [0x02, 0x01, 0x00, display_line, 0x04]
+            display_lines = (3, 4)
 
-        # convert string
-        for hex_code in hex_codes:
-            # convert illegal characters to asterisk
-            if (hex_code < 0x20) or (hex_code > 0x7F):
-                hex_code = 0x2A
-            sysex_data.append(hex_code)
+        for display_line in display_lines:
+            self._update_lcd_block(display_line, lcd_block)
 
-        self.send_midi_sysex(sysex_data)
+    def _update_lcd_block(self, display_line, lcd_block):
+        # skip display blocks that already show these characters
+        lcd_block = bytes(lcd_block)
+        if lcd_block == self._lcd_blocks[display_line - 1]:
+            return
 
-        # update second display page as well:
-        # * 0x01  -->  top row (left controller block)
-        # * 0x02  -->  top row (right controller block)
-        # * 0x03  -->  bottom row (left controller block)
-        # * 0x04  -->  bottom row (right controller block)
-        sysex_data[3] += 1
+        self._lcd_blocks[display_line - 1] = lcd_block
+
+        # the third byte is documented as "00" only, so the whole
+        # display block is written
+        sysex_data = [0x02, 0x01, 0x00, display_line, 0x04]
+        sysex_data.extend(lcd_block)
 
         self.send_midi_sysex(sysex_data)
 
@@ -388,7 +463,7 @@ class NovationZeROSLMkII(MidiControllerTemplate):
         controller_id = int(internal_id[2:])
 
         if controller_type == 'cc':
-            MidiControllerTemplate.send_midi_control_change(self, self._MIDI_DEVICE_CHANNEL, controller_id, led_status)
+            self._set_led(controller_id, led_status)
         else:
             self._log('controller type "%s" unknown.' % controller_type)
 
@@ -396,8 +471,29 @@ class NovationZeROSLMkII(MidiControllerTemplate):
         if not self._is_connected:
             return
 
+        # skip LEDs that already show this status
+        if self._led_states[led_id] == led_status:
+            return
+
+        self._led_states[led_id] = led_status
         MidiControllerTemplate.send_midi_control_change(self, self._MIDI_DEVICE_CHANNEL, led_id, led_status)
 
+    def _invalidate_leds(self):
+        # LEDs may have been changed behind our back, so send them again
+        self._led_states[:] = bytes([self._LED_UNKNOWN]) * len(self._led_states)
+
+    def _clear_all_leds(self):
+        self.send_midi_control_change(cc_number=self._MIDI_CC_CLEAR_ALL_LEDS, cc_value=0x00)
+
+        # button LEDs are known to be off now; encoder rings are not
+        # documented to be cleared (and mode 0 is "wrap", not "off"),
+        # so they are sent again
+        led_states = self._led_states
+        encoder_leds = self._MIDI_CC_ENCODER_LIGHTS
+
+        led_states[:encoder_leds] = bytes(encoder_leds)
+        led_states[encoder_leds:] = bytes([self._LED_UNKNOWN]) * (len(led_states) - encoder_leds)
+
     def set_vpot_led_ring(self, vpot_id, vpot_center_led, vpot_mode, vpot_position):
         mode = None
         if vpot_mode == self.VPOT_MODE_WRAP:
@@ -416,7 +512,7 @@ class NovationZeROSLMkII(MidiControllerTemplate):
         self._set_led(self._MIDI_CC_ENCODER_LIGHTS + vpot_id, vpot_position)
 
     def all_leds_off(self):
-        self.send_midi_control_change(cc_number=self._MIDI_CC_CLEAR_ALL_LEDS, cc_value=0x00)
+        self._clear_all_leds()
 
     # --- pedal handling ---
     def on_control_pedal(self, status):
@@ -435,43 +531,45 @@ class NovationZeROSLMkII(MidiControllerTemplate):
         if status == 1:
             self._mode_track = self._MODE_TRACK_RECORD_READY_FUNCTION
 
-            self.register_control('record_ready_channel_1', self._MIDI_CC_BUTTONS_LEFT_TOP)
-            self.register_control('record_ready_channel_2', self._MIDI_CC_BUTTONS_LEFT_TOP + 1)
-            self.register_control('record_ready_channel_3', self._MIDI_CC_BUTTONS_LEFT_TOP + 2)
-            self.register_control('record_ready_channel_4', self._MIDI_CC_BUTTONS_LEFT_TOP + 3)
-            self.register_control('record_ready_channel_5', self._MIDI_CC_BUTTONS_LEFT_TOP + 4)
-            self.register_control('record_ready_channel_6', self._MIDI_CC_BUTTONS_LEFT_TOP + 5)
-            self.register_control('record_ready_channel_7', self._MIDI_CC_BUTTONS_LEFT_TOP + 6)
-            self.register_control('record_ready_channel_8', self._MIDI_CC_BUTTONS_LEFT_TOP + 7)
-
-            self.register_control('function_channel_1', self._MIDI_CC_BUTTONS_LEFT_BOTTOM)
-            self.register_control('function_channel_2', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 1)
-            self.register_control('function_channel_3', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 2)
-            self.register_control('function_channel_4', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 3)
-            self.register_control('function_channel_5', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 4)
-            self.register_control('function_channel_6', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 5)
-            self.register_control('function_channel_7', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 6)
-            self.register_control('function_channel_8', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 7)
+            self.register_controls([
+                ('record_ready_channel_1', self._MIDI_CC_BUTTONS_LEFT_TOP),
+                ('record_ready_channel_2', self._MIDI_CC_BUTTONS_LEFT_TOP + 1),
+                ('record_ready_channel_3', self._MIDI_CC_BUTTONS_LEFT_TOP + 2),
+                ('record_ready_channel_4', self._MIDI_CC_BUTTONS_LEFT_TOP + 3),
+                ('record_ready_channel_5', self._MIDI_CC_BUTTONS_LEFT_TOP + 4),
+                ('record_ready_channel_6', self._MIDI_CC_BUTTONS_LEFT_TOP + 5),
+                ('record_ready_channel_7', self._MIDI_CC_BUTTONS_LEFT_TOP + 6),
+                ('record_ready_channel_8', self._MIDI_CC_BUTTONS_LEFT_TOP + 7),
+                ('function_channel_1', self._MIDI_CC_BUTTONS_LEFT_BOTTOM),
+                ('function_channel_2', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 1),
+                ('function_channel_3', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 2),
+                ('function_channel_4', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 3),
+                ('function_channel_5', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 4),
+                ('function_channel_6', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 5),
+                ('function_channel_7', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 6),
+                ('function_channel_8', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 7)
+            ])
         else:
             self._mode_track = self._MODE_TRACK_MUTE_SOLO
 
-            self.register_control('mute_channel_1', self._MIDI_CC_BUTTONS_LEFT_TOP)
-            self.register_control('mute_channel_2', self._MIDI_CC_BUTTONS_LEFT_TOP + 1)
-            self.register_control('mute_channel_3', self._MIDI_CC_BUTTONS_LEFT_TOP + 2)
-            self.register_control('mute_channel_4', self._MIDI_CC_BUTTONS_LEFT_TOP + 3)
-            self.register_control('mute_channel_5', self._MIDI_CC_BUTTONS_LEFT_TOP + 4)
-            self.register_control('mute_channel_6', self._MIDI_CC_BUTTONS_LEFT_TOP + 5)
-            self.register_control('mute_channel_7', self._MIDI_CC_BUTTONS_LEFT_TOP + 6)
-            self.register_control('mute_channel_8', self._MIDI_CC_BUTTONS_LEFT_TOP + 7)
-
-            self.register_control('solo_channel_1', self._MIDI_CC_BUTTONS_LEFT_BOTTOM)
-            self.register_control('solo_channel_2', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 1)
-            self.register_control('solo_channel_3', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 2)
-            self.register_control('solo_channel_4', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 3)
-            self.register_control('solo_channel_5', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 4)
-            self.register_control('solo_channel_6', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 5)
-            self.register_control('solo_channel_7', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 6)
-            self.register_control('solo_channel_8', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 7)
+            self.register_controls([
+                ('mute_channel_1', self._MIDI_CC_BUTTONS_LEFT_TOP),
+                ('mute_channel_2', self._MIDI_CC_BUTTONS_LEFT_TOP + 1),
+                ('mute_channel_3', self._MIDI_CC_BUTTONS_LEFT_TOP + 2),
+                ('mute_channel_4', self._MIDI_CC_BUTTONS_LEFT_TOP + 3),
+                ('mute_channel_5', self._MIDI_CC_BUTTONS_LEFT_TOP + 4),
+                ('mute_channel_6', self._MIDI_CC_BUTTONS_LEFT_TOP + 5),
+                ('mute_channel_7', self._MIDI_CC_BUTTONS_LEFT_TOP + 6),
+                ('mute_channel_8', self._MIDI_CC_BUTTONS_LEFT_TOP + 7),
+                ('solo_channel_1', self._MIDI_CC_BUTTONS_LEFT_BOTTOM),
+                ('solo_channel_2', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 1),
+                ('solo_channel_3', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 2),
+                ('solo_channel_4', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 3),
+                ('solo_channel_5', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 4),
+                ('solo_channel_6', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 5),
+                ('solo_channel_7', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 6),
+                ('solo_channel_8', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 7)
+            ])
 
         self._set_led(self._MIDI_CC_BUTTON_BANK_DOWN, self._mode_track)
         self._set_led(self._MIDI_CC_BUTTON_BANK_UP, self._mode_edit)
@@ -489,45 +587,47 @@ class NovationZeROSLMkII(MidiControllerTemplate):
             )
             self.show_menu(1, menu_strings)
 
-            self.register_control('vselect_channel_1', self._MIDI_CC_BUTTONS_LEFT_TOP)
-            self.register_control('vselect_channel_2', self._MIDI_CC_BUTTONS_LEFT_TOP + 1)
-            self.register_control('vselect_channel_3', self._MIDI_CC_BUTTONS_LEFT_TOP + 2)
-            self.register_control('vselect_channel_4', self._MIDI_CC_BUTTONS_LEFT_TOP + 3)
-            self.register_control('vselect_channel_5', self._MIDI_CC_BUTTONS_LEFT_TOP + 4)
-            self.register_control('vselect_channel_6', self._MIDI_CC_BUTTONS_LEFT_TOP + 5)
-            self.register_control('vselect_channel_7', self._MIDI_CC_BUTTONS_LEFT_TOP + 6)
-            self.register_control('vselect_channel_8', self._MIDI_CC_BUTTONS_LEFT_TOP + 7)
-
-            self.register_control('select_channel_1', self._MIDI_CC_BUTTONS_LEFT_BOTTOM)
-            self.register_control('select_channel_2', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 1)
-            self.register_control('select_channel_3', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 2)
-            self.register_control('select_channel_4', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 3)
-            self.register_control('select_channel_5', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 4)
-            self.register_control('select_channel_6', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 5)
-            self.register_control('select_channel_7', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 6)
-            self.register_control('select_channel_8', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 7)
+            self.register_controls([
+                ('vselect_channel_1', self._MIDI_CC_BUTTONS_LEFT_TOP),
+                ('vselect_channel_2', self._MIDI_CC_BUTTONS_LEFT_TOP + 1),
+                ('vselect_channel_3', self._MIDI_CC_BUTTONS_LEFT_TOP + 2),
+                ('vselect_channel_4', self._MIDI_CC_BUTTONS_LEFT_TOP + 3),
+                ('vselect_channel_5', self._MIDI_CC_BUTTONS_LEFT_TOP + 4),
+                ('vselect_channel_6', self._MIDI_CC_BUTTONS_LEFT_TOP + 5),
+                ('vselect_channel_7', self._MIDI_CC_BUTTONS_LEFT_TOP + 6),
+                ('vselect_channel_8', self._MIDI_CC_BUTTONS_LEFT_TOP + 7),
+                ('select_channel_1', self._MIDI_CC_BUTTONS_LEFT_BOTTOM),
+                ('select_channel_2', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 1),
+                ('select_channel_3', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 2),
+                ('select_channel_4', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 3),
+                ('select_channel_5', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 4),
+                ('select_channel_6', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 5),
+                ('select_channel_7', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 6),
+                ('select_channel_8', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 7)
+            ])
         else:
             self._mode_edit = self._MODE_EDIT_VSELECT_ASSIGNMENT
 
             self.hide_menu(1)
 
-            self.register_control('vselect_channel_1', self._MIDI_CC_BUTTONS_LEFT_TOP)
-            self.register_control('vselect_channel_2', self._MIDI_CC_BUTTONS_LEFT_TOP + 1)
-            self.register_control('vselect_channel_3', self._MIDI_CC_BUTTONS_LEFT_TOP + 2)
-            self.register_control('vselect_channel_4', self._MIDI_CC_BUTTONS_LEFT_TOP + 3)
-            self.register_control('vselect_channel_5', self._MIDI_CC_BUTTONS_LEFT_TOP + 4)
-            self.register_control('vselect_channel_6', self._MIDI_CC_BUTTONS_LEFT_TOP + 5)
-            self.register_control('vselect_channel_7', self._MIDI_CC_BUTTONS_LEFT_TOP + 6)
-            self.register_control('vselect_channel_8', self._MIDI_CC_BUTTONS_LEFT_TOP + 7)
-
-            self.register_control('assignment_track', self._MIDI_CC_BUTTONS_LEFT_BOTTOM)
-            self.register_control('assignment_send', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 1)
-            self.register_control('assignment_pan_surround', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 2)
-            self.register_control('assignment_eq', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 3)
-            self.register_control('assignment_plug_in', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 4)
-            self.register_control('assignment_instrument', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 5)
-            self.register_control('user_switch_1', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 6)
-            self.register_control('user_switch_2', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 7)
+            self.register_controls([
+                ('vselect_channel_1', self._MIDI_CC_BUTTONS_LEFT_TOP),
+                ('vselect_channel_2', self._MIDI_CC_BUTTONS_LEFT_TOP + 1),
+                ('vselect_channel_3', self._MIDI_CC_BUTTONS_LEFT_TOP + 2),
+                ('vselect_channel_4', self._MIDI_CC_BUTTONS_LEFT_TOP + 3),
+                ('vselect_channel_5', self._MIDI_CC_BUTTONS_LEFT_TOP + 4),
+                ('vselect_channel_6', self._MIDI_CC_BUTTONS_LEFT_TOP + 5),
+                ('vselect_channel_7', self._MIDI_CC_BUTTONS_LEFT_TOP + 6),
+                ('vselect_channel_8', self._MIDI_CC_BUTTONS_LEFT_TOP + 7),
+                ('assignment_track', self._MIDI_CC_BUTTONS_LEFT_BOTTOM),
+                ('assignment_send', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 1),
+                ('assignment_pan_surround', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 2),
+                ('assignment_eq', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 3),
+                ('assignment_plug_in', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 4),
+                ('assignment_instrument', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 5),
+                ('user_switch_1', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 6),
+                ('user_switch_2', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 7)
+            ])
 
         self._set_led(self._MIDI_CC_BUTTON_BANK_DOWN, self._mode_track)
         self._set_led(self._MIDI_CC_BUTTON_BANK_UP, self._mode_edit)
@@ -544,33 +644,33 @@ class NovationZeROSLMkII(MidiControllerTemplate):
             )
             self.show_menu(1, menu_strings)
 
-            self.register_control('click', self._MIDI_CC_BUTTONS_LEFT_BOTTOM)
-            self.register_control('solo', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 1)
-            self.register_control('marker', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 2)
-            self.register_control('nudge', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 3)
-            self.register_control('smpte_beats', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 4)
-
-            self.withdraw_control(self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 5)
-
-            self.register_control('drop', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 6)
-            self.register_control('replace', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 7)
-
-            self.register_control('rewind', self._MIDI_CC_BUTTON_REWIND, self._MIDI_CC_BUTTONS_RIGHT_BOTTOM)
-            self.register_control('fast_forward', self._MIDI_CC_BUTTON_FAST_FORWARD,
-                                  self._MIDI_CC_BUTTONS_RIGHT_BOTTOM + 1)
-            self.register_control('stop', self._MIDI_CC_BUTTON_STOP, self._MIDI_CC_BUTTONS_RIGHT_BOTTOM + 2)
-            self.register_control('play', self._MIDI_CC_BUTTON_PLAY, self._MIDI_CC_BUTTONS_RIGHT_BOTTOM + 3)
-            self.register_control('cycle', self._MIDI_CC_BUTTON_CYCLE, self._MIDI_CC_BUTTONS_RIGHT_BOTTOM + 4)
-            self.register_control('record', self._MIDI_CC_BUTTON_RECORD, self._MIDI_CC_BUTTONS_RIGHT_BOTTOM + 5)
+            self.register_controls([
+                ('click', self._MIDI_CC_BUTTONS_LEFT_BOTTOM),
+                ('solo', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 1),
+                ('marker', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 2),
+                ('nudge', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 3),
+                ('smpte_beats', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 4),
+                (None, self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 5),
+                ('drop', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 6),
+                ('replace', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 7),
+                ('rewind', self._MIDI_CC_BUTTON_REWIND, self._MIDI_CC_BUTTONS_RIGHT_BOTTOM),
+                ('fast_forward', self._MIDI_CC_BUTTON_FAST_FORWARD, self._MIDI_CC_BUTTONS_RIGHT_BOTTOM + 1),
+                ('stop', self._MIDI_CC_BUTTON_STOP, self._MIDI_CC_BUTTONS_RIGHT_BOTTOM + 2),
+                ('play', self._MIDI_CC_BUTTON_PLAY, self._MIDI_CC_BUTTONS_RIGHT_BOTTOM + 3),
+                ('cycle', self._MIDI_CC_BUTTON_CYCLE, self._MIDI_CC_BUTTONS_RIGHT_BOTTOM + 4),
+                ('record', self._MIDI_CC_BUTTON_RECORD, self._MIDI_CC_BUTTONS_RIGHT_BOTTOM + 5)
+            ])
         else:
             self._mode_other = self._MODE_OTHER_OFF
 
-            self.withdraw_control(self._MIDI_CC_BUTTON_REWIND)
-            self.withdraw_control(self._MIDI_CC_BUTTON_FAST_FORWARD)
-            self.withdraw_control(self._MIDI_CC_BUTTON_STOP)
-            self.withdraw_control(self._MIDI_CC_BUTTON_PLAY)
-            self.withdraw_control(self._MIDI_CC_BUTTON_CYCLE)
-            self.withdraw_control(self._MIDI_CC_BUTTON_RECORD)
+            self.register_controls([
+                (None, self._MIDI_CC_BUTTON_REWIND),
+                (None, self._MIDI_CC_BUTTON_FAST_FORWARD),
+                (None, self._MIDI_CC_BUTTON_STOP),
+                (None, self._MIDI_CC_BUTTON_PLAY),
+                (None, self._MIDI_CC_BUTTON_CYCLE),
+                (None, self._MIDI_CC_BUTTON_RECORD)
+            ])
 
             self.hide_menu(1)
             self._restore_previous_mode()
@@ -591,19 +691,16 @@ class NovationZeROSLMkII(MidiControllerTemplate):
             )
             self.show_menu(1, menu_strings)
 
-            self.register_control(
-                'fader_banks_bank_left', self._MIDI_CC_BUTTONS_LEFT_BOTTOM)
-            self.register_control(
-                'fader_banks_channel_left', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 1)
-            self.register_control(
-                'fader_banks_channel_right', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 2)
-            self.register_control(
-                'fader_banks_bank_right', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 3)
-
-            self.withdraw_control(self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 4)
-            self.withdraw_control(self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 5)
-            self.withdraw_control(self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 6)
-            self.withdraw_control(self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 7)
+            self.register_controls([
+                ('fader_banks_bank_left', self._MIDI_CC_BUTTONS_LEFT_BOTTOM),
+                ('fader_banks_channel_left', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 1),
+                ('fader_banks_channel_right', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 2),
+                ('fader_banks_bank_right', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 3),
+                (None, self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 4),
+                (None, self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 5),
+                (None, self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 6),
+                (None, self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 7)
+            ])
         else:
             if self._mode_other != self._MODE_OTHER_BANK:
                 return
@@ -630,22 +727,16 @@ class NovationZeROSLMkII(MidiControllerTemplate):
             )
             self.show_menu(1, menu_strings)
 
-            self.register_control(
-                'automation_read_off', self._MIDI_CC_BUTTONS_LEFT_BOTTOM)
-            self.register_control(
-                'automation_write', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 1)
-            self.register_control(
-                'automation_trim', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 2)
-            self.register_control(
-                'automation_touch', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 3)
-            self.register_control(
-                'automation_latch', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 4)
-
-            self.withdraw_control(self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 5)
-            self.withdraw_control(self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 6)
-
-            self.register_control(
-                'group', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 7)
+            self.register_controls([
+                ('automation_read_off', self._MIDI_CC_BUTTONS_LEFT_BOTTOM),
+                ('automation_write', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 1),
+                ('automation_trim', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 2),
+                ('automation_touch', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 3),
+                ('automation_latch', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 4),
+                (None, self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 5),
+                (None, self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 6),
+                ('group', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 7)
+            ])
         else:
             if self._mode_other != self._MODE_OTHER_AUTOMATION:
                 return
@@ -672,25 +763,17 @@ class NovationZeROSLMkII(MidiControllerTemplate):
             )
             self.show_menu(1, menu_strings)
 
-            self.register_control(
-                'global_view_midi_tracks', self._MIDI_CC_BUTTONS_LEFT_BOTTOM)
-            self.register_control(
-                'global_view_inputs', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 1)
-            self.register_control(
-                'global_view_audio_tracks', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 2)
-            self.register_control(
-                'global_view_audio_instruments', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 3)
-            self.register_control(
-                'global_view_aux', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 4)
-            self.register_control(
-                'global_view_busses', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 5)
-            self.register_control(
-                'global_view_outputs', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 6)
-            self.register_control(
-                'global_view_user', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 7)
-
-            self.register_control(
-                'global_view', self._MIDI_CC_BUTTONS_RIGHT_BOTTOM + 1, self._MIDI_CC_LED_AUTOMAP_LEARN)
+            self.register_controls([
+                ('global_view_midi_tracks', self._MIDI_CC_BUTTONS_LEFT_BOTTOM),
+                ('global_view_inputs', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 1),
+                ('global_view_audio_tracks', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 2),
+                ('global_view_audio_instruments', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 3),
+                ('global_view_aux', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 4),
+                ('global_view_busses', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 5),
+                ('global_view_outputs', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 6),
+                ('global_view_user', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 7),
+                ('global_view', self._MIDI_CC_BUTTONS_RIGHT_BOTTOM + 1, self._MIDI_CC_LED_AUTOMAP_LEARN)
+            ])
         else:
             if self._mode_other != self._MODE_OTHER_GLOBAL_VIEW:
                 return
@@ -719,22 +802,16 @@ class NovationZeROSLMkII(MidiControllerTemplate):
             )
             self.show_menu(1, menu_strings)
 
-            self.register_control(
-                'utilities_enter', self._MIDI_CC_BUTTONS_LEFT_BOTTOM)
-            self.register_control(
-                'utilities_cancel', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 1)
-
-            self.withdraw_control(self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 2)
-
-            self.register_control(
-                'utilities_undo', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 3)
-
-            self.withdraw_control(self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 4)
-            self.withdraw_control(self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 5)
-            self.withdraw_control(self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 6)
-
-            self.register_control(
-                'utilities_save', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 7)
+            self.register_controls([
+                ('utilities_enter', self._MIDI_CC_BUTTONS_LEFT_BOTTOM),
+                ('utilities_cancel', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 1),
+                (None, self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 2),
+                ('utilities_undo', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 3),
+                (None, self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 4),
+                (None, self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 5),
+                (None, self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 6),
+                ('utilities_save', self._MIDI_CC_BUTTONS_LEFT_BOTTOM + 7)
+            ])
         else:
             if self._mode_other != self._MODE_OTHER_UTILITY:
                 return
@@ -757,44 +834,29 @@ class NovationZeROSLMkII(MidiControllerTemplate):
             else:
                 self._change_mode_edit(2)
 
-        self.register_control(
-            'shift', self._MIDI_CC_BUTTONS_RIGHT_TOP)
-        self.register_control(
-            'control', self._MIDI_CC_BUTTONS_RIGHT_TOP + 1)
-        self.register_control(
-            'command_alt', self._MIDI_CC_BUTTONS_RIGHT_TOP + 2)
-        self.register_control(
-            'option', self._MIDI_CC_BUTTONS_RIGHT_TOP + 3)
-        self.register_control(
-            'cursor_left', self._MIDI_CC_BUTTONS_RIGHT_TOP + 4)
-        self.register_control(
-            'cursor_right', self._MIDI_CC_BUTTONS_RIGHT_TOP + 5)
-        self.register_control(
-            'cursor_down', self._MIDI_CC_BUTTONS_RIGHT_TOP + 6)
-        self.register_control(
-            'cursor_up', self._MIDI_CC_BUTTONS_RIGHT_TOP + 7)
-
-        self.register_control(
-            'name_value', self._MIDI_CC_BUTTONS_RIGHT_BOTTOM + 4)
-        self.register_control(
-            'flip', self._MIDI_CC_BUTTONS_RIGHT_BOTTOM + 5)
-        self.register_control(
-            'scrub', self._MIDI_CC_BUTTONS_RIGHT_BOTTOM + 6)
-        self.register_control(
-            'zoom', self._MIDI_CC_BUTTONS_RIGHT_BOTTOM + 7)
-
-        self.register_control(
-            'global_view', self._MIDI_CC_LED_AUTOMAP_LEARN)
-        self.register_control(
-            'rude_solo', self._MIDI_CC_LED_AUTOMAP_VIEW)
-        self.register_control(
-            'relay_click', self._MIDI_CC_LED_AUTOMAP_USER)
-        self.register_control(
-            'beats', self._MIDI_CC_LED_AUTOMAP_FX)
+        self.register_controls([
+            ('shift', self._MIDI_CC_BUTTONS_RIGHT_TOP),
+            ('control', self._MIDI_CC_BUTTONS_RIGHT_TOP + 1),
+            ('command_alt', self._MIDI_CC_BUTTONS_RIGHT_TOP + 2),
+            ('option', self._MIDI_CC_BUTTONS_RIGHT_TOP + 3),
+            ('cursor_left', self._MIDI_CC_BUTTONS_RIGHT_TOP + 4),
+            ('cursor_right', self._MIDI_CC_BUTTONS_RIGHT_TOP + 5),
+            ('cursor_down', self._MIDI_CC_BUTTONS_RIGHT_TOP + 6),
+            ('cursor_up', self._MIDI_CC_BUTTONS_RIGHT_TOP + 7),
+            ('name_value', self._MIDI_CC_BUTTONS_RIGHT_BOTTOM + 4),
+            ('flip', self._MIDI_CC_BUTTONS_RIGHT_BOTTOM + 5),
+            ('scrub', self._MIDI_CC_BUTTONS_RIGHT_BOTTOM + 6),
+            ('zoom', self._MIDI_CC_BUTTONS_RIGHT_BOTTOM + 7),
+            ('global_view', self._MIDI_CC_LED_AUTOMAP_LEARN),
+            ('rude_solo', self._MIDI_CC_LED_AUTOMAP_VIEW),
+            ('relay_click', self._MIDI_CC_LED_AUTOMAP_USER),
+            ('beats', self._MIDI_CC_LED_AUTOMAP_FX)
+        ])
 
     def _restore_vpots(self):
-        for vpot_id in range(8):
-            self._set_led(
-                self._MIDI_CC_ENCODER_MODE + vpot_id, self._vpot_modes[vpot_id])
-            self._set_led(
-                self._MIDI_CC_ENCODER_LIGHTS + vpot_id, self._vpot_positions[vpot_id])
+        with self.burst():
+            for vpot_id in range(8):
+                self._set_led(
+                    self._MIDI_CC_ENCODER_MODE + vpot_id, self._vpot_modes[vpot_id])
+                self._set_led(
+                    self._MIDI_CC_ENCODER_LIGHTS + vpot_id, self._vpot_positions[vpot_id])
@@ -50,8 +50,8 @@ class NovationZeROSLMkIIMIDI(NovationZeROSLMkII):
     # --- MIDI processing ---
     @staticmethod
     def get_preferred_midi_input():
-        return MidiConnection.get_default_midi_input().decode('utf-8')
+        return MidiConnection.get_default_midi_input()
 
     @staticmethod
     def get_preferred_midi_output():
-        return MidiConnection.get_default_midi_output().decode('utf-8')
+        return MidiConnection.get_default_midi_output()
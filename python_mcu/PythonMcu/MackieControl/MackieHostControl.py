@@ -24,6 +24,7 @@ Thank you for using free software!
 
 """
 
+import functools
 import os
 import sys
 import time
@@ -32,6 +33,8 @@ if __name__ == "__main__":
     # allow "PythonMcu" package imports when executing this module
     sys.path.append('../../')
 
+from PythonMcu.MackieControl.McuMeterEngine import McuMeterEngine
+from PythonMcu.MackieControl.McuSurfaceState import McuSurfaceState
 from PythonMcu.Midi.MidiConnection import MidiConnection
 
 
@@ -50,6 +53,31 @@ class MackieHostControl:
     VPOT_CLOCKWISE = 0
     VPOT_COUNTER_CLOCKWISE = 1
 
+    # meter levels that arrive later than this (in seconds) have been
+    # superseded by the time they are processed and are dropped
+    METER_MAX_AGE = 0.1
+
+    # the host connection is handled by "update_connection()", which
+    # has to be called regularly (interval in seconds)
+    CONNECTION_TIMER_INTERVAL = 0.25
+
+    # seconds to wait for a "Host Connection Reply" before sending
+    # another "Host Connection Query"
+    CONNECTION_RETRY_INTERVAL = 2.0
+
+    # number of "Host Connection Query" retries; afterwards, the host
+    # has to send a "Device Query" to connect
+    CONNECTION_RETRIES = 5
+
+    # seconds between reminders while waiting for MIDI data
+    CONNECTION_WAIT_INTERVAL = 5.0
+
+    # states of the host connection
+    _CONNECTION_OFFLINE = 0
+    _CONNECTION_QUERYING = 1
+    _CONNECTION_WAITING = 2
+    _CONNECTION_ONLINE = 3
+
     _LED_SWITCH_CHANNEL_RECORD_READY = 0x00
     _LED_SWITCH_CHANNEL_SOLO = 0x08
 
@@ -124,6 +152,123 @@ class MackieHostControl:
     _LED_RUDE_SOLO = 0x73
     _LED_RELAY_CLICK = 0x76
 
+    # MCU command names --> switch IDs (note numbers)
+    _SWITCH_IDS = {
+        'record_ready_channel_1': _LED_SWITCH_CHANNEL_RECORD_READY,
+        'record_ready_channel_2': _LED_SWITCH_CHANNEL_RECORD_READY + 1,
+        'record_ready_channel_3': _LED_SWITCH_CHANNEL_RECORD_READY + 2,
+        'record_ready_channel_4': _LED_SWITCH_CHANNEL_RECORD_READY + 3,
+        'record_ready_channel_5': _LED_SWITCH_CHANNEL_RECORD_READY + 4,
+        'record_ready_channel_6': _LED_SWITCH_CHANNEL_RECORD_READY + 5,
+        'record_ready_channel_7': _LED_SWITCH_CHANNEL_RECORD_READY + 6,
+        'record_ready_channel_8': _LED_SWITCH_CHANNEL_RECORD_READY + 7,
+        'solo_channel_1': _LED_SWITCH_CHANNEL_SOLO,
+        'solo_channel_2': _LED_SWITCH_CHANNEL_SOLO + 1,
+        'solo_channel_3': _LED_SWITCH_CHANNEL_SOLO + 2,
+        'solo_channel_4': _LED_SWITCH_CHANNEL_SOLO + 3,
+        'solo_channel_5': _LED_SWITCH_CHANNEL_SOLO + 4,
+        'solo_channel_6': _LED_SWITCH_CHANNEL_SOLO + 5,
+        'solo_channel_7': _LED_SWITCH_CHANNEL_SOLO + 6,
+        'solo_channel_8': _LED_SWITCH_CHANNEL_SOLO + 7,
+        'mute_channel_1': _LED_SWITCH_CHANNEL_MUTE,
+        'mute_channel_2': _LED_SWITCH_CHANNEL_MUTE + 1,
+        'mute_channel_3': _LED_SWITCH_CHANNEL_MUTE + 2,
+        'mute_channel_4': _LED_SWITCH_CHANNEL_MUTE + 3,
+        'mute_channel_5': _LED_SWITCH_CHANNEL_MUTE + 4,
+        'mute_channel_6': _LED_SWITCH_CHANNEL_MUTE + 5,
+        'mute_channel_7': _LED_SWITCH_CHANNEL_MUTE + 6,
+        'mute_channel_8': _LED_SWITCH_CHANNEL_MUTE + 7,
+        'select_channel_1': _LED_SWITCH_CHANNEL_SELECT,
+        'select_channel_2': _LED_SWITCH_CHANNEL_SELECT + 1,
+        'select_channel_3': _LED_SWITCH_CHANNEL_SELECT + 2,
+        'select_channel_4': _LED_SWITCH_CHANNEL_SELECT + 3,
+        'select_channel_5': _LED_SWITCH_CHANNEL_SELECT + 4,
+        'select_channel_6': _LED_SWITCH_CHANNEL_SELECT + 5,
+        'select_channel_7': _LED_SWITCH_CHANNEL_SELECT + 6,
+        'select_channel_8': _LED_SWITCH_CHANNEL_SELECT + 7,
+        'vselect_channel_1': _LED_SWITCH_CHANNEL_VSELECT,
+        'vselect_channel_2': _LED_SWITCH_CHANNEL_VSELECT + 1,
+        'vselect_channel_3': _LED_SWITCH_CHANNEL_VSELECT + 2,
+        'vselect_channel_4': _LED_SWITCH_CHANNEL_VSELECT + 3,
+        'vselect_channel_5': _LED_SWITCH_CHANNEL_VSELECT + 4,
+        'vselect_channel_6': _LED_SWITCH_CHANNEL_VSELECT + 5,
+        'vselect_channel_7': _LED_SWITCH_CHANNEL_VSELECT + 6,
+        'vselect_channel_8': _LED_SWITCH_CHANNEL_VSELECT + 7,
+        'function_channel_1': _SWITCH_CHANNEL_FUNCTION,
+        'function_channel_2': _SWITCH_CHANNEL_FUNCTION + 1,
+        'function_channel_3': _SWITCH_CHANNEL_FUNCTION + 2,
+        'function_channel_4': _SWITCH_CHANNEL_FUNCTION + 3,
+        'function_channel_5': _SWITCH_CHANNEL_FUNCTION + 4,
+        'function_channel_6': _SWITCH_CHANNEL_FUNCTION + 5,
+        'function_channel_7': _SWITCH_CHANNEL_FUNCTION + 6,
+        'function_channel_8': _SWITCH_CHANNEL_FUNCTION + 7,
+        'assignment_track': _LED_SWITCH_ASSIGNMENT_TRACK,
+        'assignment_send': _LED_SWITCH_ASSIGNMENT_SEND,
+        'assignment_pan_surround': _LED_SWITCH_ASSIGNMENT_PAN_SURROUND,
+        'assignment_plug_in': _LED_SWITCH_ASSIGNMENT_PLUG_IN,
+        'assignment_eq': _LED_SWITCH_ASSIGNMENT_EQ,
+        'assignment_instrument': _LED_SWITCH_ASSIGNMENT_INSTRUMENT,
+        'fader_banks_bank_left': _SWITCH_FADER_BANKS_BANK_LEFT,
+        'fader_banks_bank_right': _SWITCH_FADER_BANKS_BANK_RIGHT,
+        'fader_banks_channel_left': _SWITCH_FADER_BANKS_CHANNEL_LEFT,
+        'fader_banks_channel_right': _SWITCH_FADER_BANKS_CHANNEL_RIGHT,
+        'flip': _LED_SWITCH_FLIP,
+        'global_view': _LED_SWITCH_GLOBAL_VIEW,
+        'name_value': _SWITCH_NAME_VALUE,
+        'smpte_beats': _SWITCH_SMPTE_BEATS,
+        'global_view_midi_tracks': _SWITCH_GLOBAL_VIEW_MIDI_TRACKS,
+        'global_view_inputs': _SWITCH_GLOBAL_VIEW_INPUTS,
+        'global_view_audio_tracks': _SWITCH_GLOBAL_VIEW_AUDIO_TRACKS,
+        'global_view_audio_instruments': _SWITCH_GLOBAL_VIEW_AUDIO_INSTRUMENTS,
+        'global_view_aux': _SWITCH_GLOBAL_VIEW_AUX,
+        'global_view_busses': _SWITCH_GLOBAL_VIEW_BUSSES,
+        'global_view_outputs': _SWITCH_GLOBAL_VIEW_OUTPUTS,
+        'global_view_user': _SWITCH_GLOBAL_VIEW_USER,
+        'shift': _SWITCH_SHIFT,
+        'option': _SWITCH_OPTION,
+        'control': _SWITCH_CONTROL,
+        'command_alt': _SWITCH_COMMAND_ALT,
+        'automation_read_off': _LED_SWITCH_AUTOMATION_READ_OFF,
+        'automation_write': _LED_SWITCH_AUTOMATION_WRITE,
+        'automation_trim': _LED_SWITCH_AUTOMATION_TRIM,
+        'automation_touch': _LED_SWITCH_AUTOMATION_TOUCH,
+        'automation_latch': _LED_SWITCH_AUTOMATION_LATCH,
+        'group': _LED_SWITCH_GROUP,
+        'utilities_save': _LED_SWITCH_UTILITIES_SAVE,
+        'utilities_undo': _LED_SWITCH_UTILITIES_UNDO,
+        'utilities_cancel': _SWITCH_UTILITIES_CANCEL,
+        'utilities_enter': _SWITCH_UTILITIES_ENTER,
+        'marker': _LED_SWITCH_MARKER,
+        'nudge': _LED_SWITCH_NUDGE,
+        'cycle': _LED_SWITCH_CYCLE,
+        'drop': _LED_SWITCH_DROP,
+        'replace': _LED_SWITCH_REPLACE,
+        'click': _LED_SWITCH_CLICK,
+        'solo': _LED_SWITCH_SOLO,
+        'rewind': _LED_SWITCH_REWIND,
+        'fast_forward': _LED_SWITCH_FAST_FORWARD,
+        'stop': _LED_SWITCH_STOP,
+        'play': _LED_SWITCH_PLAY,
+        'record': _LED_SWITCH_RECORD,
+        'cursor_up': _SWITCH_CURSOR_UP,
+        'cursor_down': _SWITCH_CURSOR_DOWN,
+        'cursor_left': _SWITCH_CURSOR_LEFT,
+        'cursor_right': _SWITCH_CURSOR_RIGHT,
+        'zoom': _LED_SWITCH_ZOOM,
+        'scrub': _LED_SWITCH_SCRUB,
+        'user_switch_1': _SWITCH_USER_SWITCH_A,
+        'user_switch_2': _SWITCH_USER_SWITCH_B,
+        'fader_touch_channel_1': _SWITCH_CHANNEL_FADER_TOUCH,
+        'fader_touch_channel_2': _SWITCH_CHANNEL_FADER_TOUCH + 1,
+        'fader_touch_channel_3': _SWITCH_CHANNEL_FADER_TOUCH + 2,
+        'fader_touch_channel_4': _SWITCH_CHANNEL_FADER_TOUCH + 3,
+        'fader_touch_channel_5': _SWITCH_CHANNEL_FADER_TOUCH + 4,
+        'fader_touch_channel_6': _SWITCH_CHANNEL_FADER_TOUCH + 5,
+        'fader_touch_channel_7': _SWITCH_CHANNEL_FADER_TOUCH + 6,
+        'fader_touch_channel_8': _SWITCH_CHANNEL_FADER_TOUCH + 7,
+        'fader_touch_master': _SWITCH_MASTER_FADER_TOUCH
+    }
+
     def __init__(self, mcu_model_id, mcu_connection, version_number, midi_input_name, midi_output_name, callback_log):
         self._callback_log = callback_log
 
@@ -143,6 +288,12 @@ class MackieHostControl:
 
         self._offline = True
 
+        # time-outs of the host connection are checked against this
+        # deadline (taken from "time.perf_counter()")
+        self._connection_state = self._CONNECTION_OFFLINE
+        self._connection_deadline = None
+        self._connection_retries = 0
+
         # Mackie Control model IDs:
         # * 0x10: Logic Control
         # * 0x11: Logic Control XT
@@ -165,6 +316,10 @@ class MackieHostControl:
 
         self._response_bytes = self._calculate_response_from_challenge(self._challenge_bytes)
 
+        # expected data of "Host Connection Reply" (SysEx messages
+        # are received as "bytes")
+        self._host_connection_reply = bytes(self._serial_number_bytes + self._response_bytes)
+
         # make sure that the version number consists of exactly 5
         # characters
         version_number = version_number.ljust(5)[0:5]
@@ -173,6 +328,17 @@ class MackieHostControl:
         for char in version_number:
             self._version_number_bytes.append(ord(char))
 
+        # everything the host has sent to the surface
+        self._surface_state = McuSurfaceState()
+
+        # meters are decayed by Python MCU, not by the host
+        self._meter_engine = McuMeterEngine(
+            McuSurfaceState.NUMBER_OF_CHANNELS, self._update_peak_level, self._update_peak_hold)
+
+        # handlers of incoming MIDI messages
+        self._led_handlers = {}
+        self._build_dispatch_tables()
+
     def _log(self, message, repaint=False):
         self._callback_log('[Mackie Host Control  ]  ' + message, repaint)
 
@@ -186,6 +352,8 @@ class MackieHostControl:
         self._display_timecode_available = self._hardware_controller.has_display_timecode()
         self._meter_bridge_available = self._hardware_controller.has_meter_bridge()
 
+        self._build_led_handlers()
+
     def unset_hardware_controller(self):
         self._hardware_controller = None
 
@@ -195,18 +363,18 @@ class MackieHostControl:
         self._display_timecode_available = False
         self._meter_bridge_available = False
 
+        self._build_led_handlers()
+
     def connect(self):
         self._log('Opening MIDI ports...')
         self._midi.connect(self._midi_input_name, self._midi_output_name)
 
         if self._mcu_connection == self.CHALLENGE_RESPONSE:
-            self._log('Sending "Host Connection Query"...', True)
-
-            sysex_message = [0x01]
-            sysex_message.extend(self._serial_number_bytes)
-            sysex_message.extend(self._challenge_bytes)
-            self.send_midi_sysex(sysex_message)
-
+            # the "Host Connection Reply" completes the connection,
+            # so retries are left to "update_connection()"
+            self._connection_retries = 0
+            self._set_connection_state(self._CONNECTION_QUERYING, self.CONNECTION_RETRY_INTERVAL)
+            self._send_host_connection_query()
             return
 
         # let's make sure the MIDI input buffer is empty
@@ -215,13 +383,62 @@ class MackieHostControl:
         if self._mcu_connection == self.WAIT_FOR_MIDI_DATA:
             self._log('Waiting for MIDI input from host...', True)
 
-            # wait for some MIDI input from the host (all data are
-            # left in the MIDI input buffer!)
-            while self._midi.buffer_is_empty():
-                time.sleep(0.1)
+            # the first MIDI message from the host completes the
+            # connection (see "_receive_first_midi_data()")
+            self._set_connection_state(self._CONNECTION_WAITING, self.CONNECTION_WAIT_INTERVAL)
+            return
 
         self.go_online()
 
+    def _set_connection_state(self, connection_state, timeout=None):
+        self._connection_state = connection_state
+
+        if timeout is None:
+            self._connection_deadline = None
+        else:
+            self._connection_deadline = time.perf_counter() + timeout
+
+        self._select_dispatch_tables()
+
+    def update_connection(self, now=None):
+        """
+        handle time-outs of the host connection; this never blocks, so
+        it can be called by the I/O engine's timers
+        """
+        if self._connection_deadline is None:
+            return
+
+        if now is None:
+            now = time.perf_counter()
+
+        if now < self._connection_deadline:
+            return
+
+        if self._connection_state == self._CONNECTION_QUERYING:
+            if self._connection_retries < self.CONNECTION_RETRIES:
+                self._connection_retries += 1
+                self._log('No reply from host (retry %d of %d).' % (
+                    self._connection_retries, self.CONNECTION_RETRIES))
+
+                self._send_host_connection_query()
+                self._connection_deadline = now + self.CONNECTION_RETRY_INTERVAL
+            else:
+                self._log('No reply from host.  Waiting for "Device Query"...', True)
+                self._connection_deadline = None
+        elif self._connection_state == self._CONNECTION_WAITING:
+            self._log('Still waiting for MIDI input from host...', True)
+            self._connection_deadline = now + self.CONNECTION_WAIT_INTERVAL
+        else:
+            self._connection_deadline = None
+
+    def _send_host_connection_query(self):
+        self._log('Sending "Host Connection Query"...', True)
+
+        sysex_message = [0x01]
+        sysex_message.extend(self._serial_number_bytes)
+        sysex_message.extend(self._challenge_bytes)
+        self.send_midi_sysex(sysex_message)
+
     def disconnect(self):
         self._log('Disconnecting...', True)
         self.go_offline()
@@ -229,8 +446,16 @@ class MackieHostControl:
         self._log('Closing MIDI ports...', True)
         self._midi.disconnect()
 
+    def get_mcu_model_id(self):
+        return self._mcu_model_id
+
+    def set_mcu_model_id(self, mcu_model_id):
+        self._mcu_model_id = mcu_model_id
+        self._build_dispatch_tables()
+
     def go_online(self):
         self._offline = False
+        self._set_connection_state(self._CONNECTION_ONLINE)
 
         if self._hardware_controller:
             self._hardware_controller.go_online()
@@ -239,6 +464,7 @@ class MackieHostControl:
 
     def go_offline(self):
         self._offline = True
+        self._set_connection_state(self._CONNECTION_OFFLINE)
 
         if self._hardware_controller:
             self._hardware_controller.go_offline()
@@ -291,6 +517,17 @@ class MackieHostControl:
             return 0x15
         return None
 
+    @staticmethod
+    def get_extender_model_id(model_id):
+        """
+        return the model ID of extenders (XT units) that go with a
+        main unit
+        """
+        if model_id in (0x10, 0x11):
+            return 0x11
+
+        return 0x15
+
     @staticmethod
     def get_preferred_mcu_model():
         return 'Mackie Control'
@@ -314,133 +551,359 @@ class MackieHostControl:
         return 'mcu'
 
     # --- MIDI processing ---
+    def get_midi_connection(self):
+        return self._midi
+
     def process_midi_input(self):
         self._midi.process_input_buffer()
 
-    def receive_midi(self, status, message):
-        if status == MidiConnection.SYSTEM_MESSAGE and message[0:5] == [0xF0, 0x00, 0x00, 0x66, self._mcu_model_id]:
-            if message[5:] == [0x00, 0xF7]:
-                self._log('Received "Device Query".')
-                self._log('Sending "Host Connection Query"...', True)
-
-                sysex_message = [0x01]
-                sysex_message.extend(self._serial_number_bytes)
-                sysex_message.extend(self._challenge_bytes)
-                self.send_midi_sysex(sysex_message)
-
-                return
-            if message[5] == 0x02:
-                self._log('Received "Host Connection Reply".')
-                if (message[6:13] == self._serial_number_bytes) and (message[13:17] == self._response_bytes):
-                    self._log('Sending "Host Connection Confirmation"...', True)
-
-                    sysex_message = [0x03]
-                    sysex_message.extend(self._serial_number_bytes)
-                    self.send_midi_sysex(sysex_message)
-
-                    self.go_online()
-                else:
-                    self._log('Sending "Host Connection Error"...')
-
-                    sysex_message = [0x04]
-                    sysex_message.extend(self._serial_number_bytes)
-                    self.send_midi_sysex(sysex_message)
-
-                    self._log('Sending "Host Connection Query"...', True)
-
-                    sysex_message = [0x01]
-                    sysex_message.extend(self._serial_number_bytes)
-                    sysex_message.extend(self._challenge_bytes)
-                    self.send_midi_sysex(sysex_message)
-
-                return
-            if message[5:] == [0x13, 0x00, 0x0F7]:
-                self._log('Received "Version Request".')
-                self._log('Sending "Version Reply"...', True)
-
-                sysex_message = [0x14]
-                sysex_message.extend(self._version_number_bytes)
-                self.send_midi_sysex(sysex_message)
-
-                return
-            if message[5:] == [0x0F, 0x7F, 0x0F7]:
-                self._log('Received "Go Offline".', True)
-                self.go_offline()
-
-                return
-            if message[5:] == [0x61, 0x0F7]:
-                self._log('Received "Faders To Minimum".', True)
-                self.faders_to_minimum()
-
-                return
-            if message[5:] == [0x62, 0x0F7]:
-                self._log('Received "All LEDs Off".', True)
-                self.all_leds_off()
-
-                return
-            if message[5:] == [0x63, 0x0F7]:
-                self._log('Received "Reset".', True)
-                self.reset()
-
-                return
-
-        # do not make this an "elif" clause, otherwise some MIDI SysEx
-        # messages won't get processed!
-        if not self.is_offline():
-            if status == MidiConnection.SYSTEM_MESSAGE and message[0:5] == [0xF0, 0x00, 0x00, 0x66, self._mcu_model_id]:
-                if message[5] == 0x12:
-                    if self._display_lcd_available:
-                        position = message[6]
-                        hex_codes = message[7:-1]
-
-                        self._hardware_controller.set_lcd(position, hex_codes)
-            elif status == MidiConnection.PITCH_WHEEL_CHANGE:
-                if self._automated_faders_available:
-                    fader_id = message[0] & 0x0F
-                    fader_position = (message[1] + (message[2] << 7)) >> 4
-                    self._hardware_controller.fader_moved(fader_id, fader_position)
-            elif status == MidiConnection.NOTE_ON_EVENT:
-                led_id = message[1]
-                led_status = 0  # off
-
-                if message[2] == 0x7F:
-                    led_status = 1  # on
-                elif message[2] == 0x01:
-                    led_status = 2  # flashing
-
-                self._set_led(led_id, led_status)
-            elif (status == MidiConnection.CONTROL_CHANGE) and ((message[1] & 0xF0) == 0x30):
-                vpot_id = message[1] & 0x0F
-                vpot_center_led = (message[2] & 0x40) >> 7
-                vpot_mode = (message[2] & 0x30) >> 4
-                vpot_position = message[2] & 0x0F
-                self._hardware_controller.set_vpot_led_ring(vpot_id, vpot_center_led, vpot_mode, vpot_position)
-            elif (status == MidiConnection.CONTROL_CHANGE) and ((message[1] & 0xF0) == 0x40):
-                position = message[1] & 0x0F
-                character_code = message[2]
-
-                if position < 10:
-                    if self._display_timecode_available:
-                        self._hardware_controller.set_display_timecode(position, character_code)
-                elif self._display_7seg_available:
-                    self._hardware_controller.set_display_7seg(position, character_code)
-            elif status == MidiConnection.CHANNEL_PRESSURE:
-                if self._meter_bridge_available:
-                    meter_id = (message[1] & 0x70) >> 4
-                    meter_level = message[1] & 0x0F
-                    self._hardware_controller.set_peak_level(meter_id, meter_level)
-            else:
-                output = 'status %02X: ' % status
-                for byte in message:
-                    output += '%02X ' % byte
+    def _build_dispatch_tables(self):
+        """
+        map status bytes and MCU SysEx commands to their handlers; has
+        to be called whenever the MCU model ID changes
+        """
+        self._sysex_header = bytes((0xF0, 0x00, 0x00, 0x66, self._mcu_model_id))
+
+        # SysEx commands that are handled whether online or not
+        self._offline_sysex_handlers = {
+            0x00: self._receive_device_query,
+            0x02: self._receive_host_connection_reply,
+            0x0F: self._receive_go_offline,
+            0x13: self._receive_version_request,
+            0x61: self._receive_faders_to_minimum,
+            0x62: self._receive_all_leds_off,
+            0x63: self._receive_reset
+        }
+
+        self._online_sysex_handlers = dict(self._offline_sysex_handlers)
+        self._online_sysex_handlers[0x12] = self._receive_lcd
+
+        self._offline_midi_handlers = {
+            MidiConnection.SYSTEM_MESSAGE: self._receive_sysex
+        }
 
-                self._log(output.strip())
+        # any MIDI message completes a "Wait for MIDI data" connection
+        self._waiting_midi_handlers = dict.fromkeys(
+            range(MidiConnection.NOTE_OFF_EVENT, MidiConnection.SYSTEM_MESSAGE + 0x10, 0x10),
+            self._receive_first_midi_data
+        )
+
+        self._online_midi_handlers = {
+            MidiConnection.SYSTEM_MESSAGE: self._receive_sysex,
+            MidiConnection.PITCH_WHEEL_CHANGE: self._receive_fader,
+            MidiConnection.NOTE_ON_EVENT: self._receive_led,
+            MidiConnection.CONTROL_CHANGE: self._receive_control_change,
+            MidiConnection.CHANNEL_PRESSURE: self._receive_meter
+        }
+
+        self._select_dispatch_tables()
+
+    def _select_dispatch_tables(self):
+        if not self._offline:
+            self._midi_handlers = self._online_midi_handlers
+            self._sysex_handlers = self._online_sysex_handlers
+        elif self._connection_state == self._CONNECTION_WAITING:
+            self._midi_handlers = self._waiting_midi_handlers
+            self._sysex_handlers = self._offline_sysex_handlers
         else:
-            output = 'status %02X: ' % status
-            for byte in message:
-                output += '%02X ' % byte
+            self._midi_handlers = self._offline_midi_handlers
+            self._sysex_handlers = self._offline_sysex_handlers
+
+    def _build_led_handlers(self):
+        """
+        map LED IDs to the hardware controller's methods, which are
+        called with the LED status
+        """
+        self._led_handlers = {}
+
+        controller = self._hardware_controller
+        if not controller:
+            return
 
-            self._log(output.strip())
+        for channel in range(8):
+            self._led_handlers.update({
+                self._LED_SWITCH_CHANNEL_RECORD_READY + channel:
+                    functools.partial(controller.set_led_channel_record_ready, channel),
+                self._LED_SWITCH_CHANNEL_SOLO + channel: functools.partial(controller.set_led_channel_solo, channel),
+                self._LED_SWITCH_CHANNEL_MUTE + channel: functools.partial(controller.set_led_channel_mute, channel),
+                self._LED_SWITCH_CHANNEL_SELECT + channel:
+                    functools.partial(controller.set_led_channel_select, channel),
+                self._LED_SWITCH_CHANNEL_VSELECT + channel:
+                    functools.partial(controller.set_led_channel_vselect, channel)
+            })
+
+        self._led_handlers.update({
+                self._LED_SWITCH_ASSIGNMENT_TRACK: controller.set_led_assignment_track,
+                self._LED_SWITCH_ASSIGNMENT_SEND: controller.set_led_assignment_send,
+                self._LED_SWITCH_ASSIGNMENT_PAN_SURROUND: controller.set_led_assignment_pan_surround,
+                self._LED_SWITCH_ASSIGNMENT_PLUG_IN: controller.set_led_assignment_plug_in,
+                self._LED_SWITCH_ASSIGNMENT_EQ: controller.set_led_assignment_eq,
+                self._LED_SWITCH_ASSIGNMENT_INSTRUMENT: controller.set_led_assignment_instrument,
+                self._LED_SWITCH_FLIP: controller.set_led_flip,
+                self._LED_SWITCH_GLOBAL_VIEW: controller.set_led_global_view,
+                self._LED_SWITCH_AUTOMATION_READ_OFF: controller.set_led_automation_read_off,
+                self._LED_SWITCH_AUTOMATION_WRITE: controller.set_led_automation_write,
+                self._LED_SWITCH_AUTOMATION_TRIM: controller.set_led_automation_trim,
+                self._LED_SWITCH_AUTOMATION_TOUCH: controller.set_led_automation_touch,
+                self._LED_SWITCH_AUTOMATION_LATCH: controller.set_led_automation_latch,
+                self._LED_SWITCH_GROUP: controller.set_led_group,
+                self._LED_SWITCH_UTILITIES_SAVE: controller.set_led_utilities_save,
+                self._LED_SWITCH_UTILITIES_UNDO: controller.set_led_utilities_undo,
+                self._LED_SWITCH_MARKER: controller.set_led_marker,
+                self._LED_SWITCH_NUDGE: controller.set_led_nudge,
+                self._LED_SWITCH_CYCLE: controller.set_led_cycle,
+                self._LED_SWITCH_DROP: controller.set_led_drop,
+                self._LED_SWITCH_REPLACE: controller.set_led_replace,
+                self._LED_SWITCH_CLICK: controller.set_led_click,
+                self._LED_SWITCH_SOLO: controller.set_led_solo,
+                self._LED_SWITCH_REWIND: controller.set_led_rewind,
+                self._LED_SWITCH_FAST_FORWARD: controller.set_led_fast_forward,
+                self._LED_SWITCH_STOP: controller.set_led_stop,
+                self._LED_SWITCH_PLAY: controller.set_led_play,
+                self._LED_SWITCH_RECORD: controller.set_led_record,
+                self._LED_SWITCH_ZOOM: controller.set_led_zoom,
+                self._LED_SWITCH_SCRUB: controller.set_led_scrub,
+                self._LED_SMPTE: controller.set_led_smpte,
+                self._LED_BEATS: controller.set_led_beats,
+                self._LED_RUDE_SOLO: controller.set_led_rude_solo,
+                self._LED_RELAY_CLICK: controller.set_led_relay_click
+        })
+
+    def receive_midi(self, status, message, timestamp=None):
+        midi_handler = self._midi_handlers.get(status)
+
+        if midi_handler:
+            midi_handler(message, timestamp)
+        else:
+            self._log_midi(status, message)
+
+    def _log_midi(self, status, message):
+        output = 'status %02X: ' % status
+        for byte in message:
+            output += '%02X ' % byte
+
+        self._log(output.strip())
+
+    def _receive_sysex(self, message, _timestamp):
+        if len(message) < 7 or not message.startswith(self._sysex_header):
+            self._log_midi(MidiConnection.SYSTEM_MESSAGE, message)
+            return
+
+        sysex_handler = self._sysex_handlers.get(message[5])
+
+        if sysex_handler:
+            sysex_handler(message)
+        elif self._offline:
+            self._log_midi(MidiConnection.SYSTEM_MESSAGE, message)
+
+    def _receive_first_midi_data(self, message, timestamp):
+        self._log('Received MIDI input from host.')
+        self.go_online()
+
+        # now process the message like all that follow
+        self.receive_midi(message[0] & 0xF0, message, timestamp)
+
+    def _receive_device_query(self, message):
+        if len(message) != 7:
+            return
+
+        self._log('Received "Device Query".')
+        self._send_host_connection_query()
+
+    def _receive_host_connection_reply(self, message):
+        self._log('Received "Host Connection Reply".')
+        if message.startswith(self._host_connection_reply, 6):
+            self._log('Sending "Host Connection Confirmation"...', True)
+
+            sysex_message = [0x03]
+            sysex_message.extend(self._serial_number_bytes)
+            self.send_midi_sysex(sysex_message)
+
+            self.go_online()
+        else:
+            self._log('Sending "Host Connection Error"...')
+
+            sysex_message = [0x04]
+            sysex_message.extend(self._serial_number_bytes)
+            self.send_midi_sysex(sysex_message)
+
+            self._send_host_connection_query()
+
+    def _receive_version_request(self, message):
+        if len(message) != 8 or message[6] != 0x00:
+            return
+
+        self._log('Received "Version Request".')
+        self._log('Sending "Version Reply"...', True)
+
+        sysex_message = [0x14]
+        sysex_message.extend(self._version_number_bytes)
+        self.send_midi_sysex(sysex_message)
+
+    def _receive_go_offline(self, message):
+        if len(message) != 8 or message[6] != 0x7F:
+            return
+
+        self._log('Received "Go Offline".', True)
+        self.go_offline()
+
+    def _receive_faders_to_minimum(self, message):
+        if len(message) != 7:
+            return
+
+        self._log('Received "Faders To Minimum".', True)
+        self.faders_to_minimum()
+
+    def _receive_all_leds_off(self, message):
+        if len(message) != 7:
+            return
+
+        self._log('Received "All LEDs Off".', True)
+        self.all_leds_off()
+
+    def _receive_reset(self, message):
+        if len(message) != 7:
+            return
+
+        self._log('Received "Reset".', True)
+        self.reset()
+
+    def _receive_lcd(self, message):
+        position = message[6]
+
+        # pass characters without copying them
+        hex_codes = memoryview(message)[7:-1]
+
+        self._surface_state.set_lcd(position, hex_codes)
+
+        if self._display_lcd_available:
+            self._hardware_controller.set_lcd(position, hex_codes)
+
+    def _receive_fader(self, message, _timestamp):
+        fader_id = message[0] & 0x0F
+        fader_position = (message[1] + (message[2] << 7)) >> 4
+
+        if fader_id < McuSurfaceState.NUMBER_OF_FADERS:
+            self._surface_state.set_fader(fader_id, fader_position)
+
+        if self._automated_faders_available:
+            self._hardware_controller.fader_moved(fader_id, fader_position)
+
+    def _receive_led(self, message, _timestamp):
+        led_id = message[1]
+        led_status = 0  # off
+
+        if message[2] == 0x7F:
+            led_status = 1  # on
+        elif message[2] == 0x01:
+            led_status = 2  # flashing
+
+        self._surface_state.set_led(led_id, led_status)
+        self._set_led(led_id, led_status)
+
+    def _receive_control_change(self, message, _timestamp):
+        cc_type = message[1] & 0xF0
+
+        if cc_type == 0x30:
+            vpot_id = message[1] & 0x0F
+
+            if vpot_id < McuSurfaceState.NUMBER_OF_CHANNELS:
+                self._surface_state.set_vpot_ring(vpot_id, message[2])
+
+            self._update_vpot_led_ring(vpot_id, message[2])
+        elif cc_type == 0x40:
+            position = message[1] & 0x0F
+
+            if position < McuSurfaceState.NUMBER_OF_DIGITS:
+                self._surface_state.set_digit(position, message[2])
+
+            self._update_digit(position, message[2])
+        else:
+            self._log_midi(MidiConnection.CONTROL_CHANGE, message)
+
+    def _receive_meter(self, message, timestamp):
+        meter_id = (message[1] & 0x70) >> 4
+        meter_level = message[1] & 0x0F
+
+        # never drop changes of the overload state
+        if meter_level < 0x0E and timestamp is not None and \
+                time.perf_counter() - timestamp > self.METER_MAX_AGE:
+            return
+
+        self._meter_engine.set_level(meter_id, meter_level)
+
+    def decay_meters(self, now=None):
+        self._meter_engine.decay(now)
+
+    def _update_peak_level(self, meter_id, meter_level):
+        self._surface_state.set_meter(meter_id, meter_level)
+
+        if self._meter_bridge_available:
+            self._hardware_controller.set_peak_level(meter_id, meter_level)
+
+    def _update_peak_hold(self, meter_id, peak_level):
+        if self._meter_bridge_available:
+            self._hardware_controller.set_peak_hold(meter_id, peak_level)
+
+    def _update_vpot_led_ring(self, vpot_id, vpot_ring):
+        vpot_center_led = (vpot_ring & 0x40) >> 7
+        vpot_mode = (vpot_ring & 0x30) >> 4
+        vpot_position = vpot_ring & 0x0F
+        self._hardware_controller.set_vpot_led_ring(vpot_id, vpot_center_led, vpot_mode, vpot_position)
+
+    def _update_digit(self, position, character_code):
+        if position < 10:
+            if self._display_timecode_available:
+                self._hardware_controller.set_display_timecode(position, character_code)
+        elif self._display_7seg_available:
+            self._hardware_controller.set_display_7seg(position, character_code)
+
+    # --- surface state ---
+    def get_surface_state(self):
+        return self._surface_state
+
+    def repaint_hardware_controller(self):
+        """
+        send the complete surface state as last set by the host to the
+        hardware controller (for instance after "Automap" has
+        taken over the controller)
+        """
+        if self._offline or not self._hardware_controller:
+            return
+
+        unknown = McuSurfaceState.UNKNOWN
+        surface_state = self._surface_state
+
+        if self._display_lcd_available:
+            self._hardware_controller.set_lcd(0, memoryview(surface_state.get_lcd()))
+
+        for (led_id, led_status) in enumerate(surface_state.get_leds()):
+            if led_status != unknown and led_id in self._led_handlers:
+                self._led_handlers[led_id](led_status)
+
+        for (vpot_id, vpot_ring) in enumerate(surface_state.get_vpot_rings()):
+            if vpot_ring != unknown:
+                self._update_vpot_led_ring(vpot_id, vpot_ring)
+
+        for (position, character_code) in enumerate(surface_state.get_digits()):
+            if character_code != unknown:
+                self._update_digit(position, character_code)
+
+        if self._automated_faders_available:
+            for (fader_id, fader_position) in enumerate(surface_state.get_faders()):
+                if fader_position >= 0:
+                    self._hardware_controller.fader_moved(fader_id, fader_position)
+
+        if self._meter_bridge_available:
+            for (meter_id, meter_level) in enumerate(surface_state.get_meters()):
+                if meter_level != unknown:
+                    self._hardware_controller.set_peak_level(meter_id, meter_level)
+
+    def burst(self):
+        """
+        context manager that sends all MIDI messages within in one go
+        """
+        return self._midi.burst()
 
     def send_midi_sysex(self, data):
         assert isinstance(data, list)
@@ -480,6 +943,17 @@ class MackieHostControl:
 
         self._midi.send_pitch_wheel_change_7bit(fader_id, fader_value)
 
+    @staticmethod
+    def get_switch_id(mcu_command):
+        """
+        return the switch ID (note number) of an MCU command (such as
+        "play") or "None" if the command has no switch
+        """
+        return MackieHostControl._SWITCH_IDS.get(mcu_command)
+
+    def keypress_switch(self, switch_id, status):
+        self._key_pressed(status, switch_id)
+
     def _key_pressed(self, status, switch_id):
         if self.is_offline():
             return
@@ -489,477 +963,389 @@ class MackieHostControl:
         elif status == self.SWITCH_PRESSED:
             self._midi.send_note_on(switch_id, 0x7F)
         elif status == self.SWITCH_PRESSED_RELEASED:
-            self._midi.send_note_on(switch_id, 0x7F)
-            self._midi.send_note_on(switch_id, 0x00)
+            with self._midi.burst():
+                self._midi.send_note_on(switch_id, 0x7F)
+                self._midi.send_note_on(switch_id, 0x00)
         else:
             self._log('Illegal key press status 0x%02X on switch 0x%02X detected!' % (status, switch_id))
 
     def keypress_record_ready_channel(self, channel, status):
         # channel: 1 - 8
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_RECORD_READY + channel - 1)
+        self.keypress_switch(self._SWITCH_IDS['record_ready_channel_%d' % channel], status)
 
     def keypress_record_ready_channel_1(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_RECORD_READY)
+        self.keypress_switch(self._SWITCH_IDS['record_ready_channel_1'], status)
 
     def keypress_record_ready_channel_2(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_RECORD_READY + 1)
+        self.keypress_switch(self._SWITCH_IDS['record_ready_channel_2'], status)
 
     def keypress_record_ready_channel_3(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_RECORD_READY + 2)
+        self.keypress_switch(self._SWITCH_IDS['record_ready_channel_3'], status)
 
     def keypress_record_ready_channel_4(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_RECORD_READY + 3)
+        self.keypress_switch(self._SWITCH_IDS['record_ready_channel_4'], status)
 
     def keypress_record_ready_channel_5(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_RECORD_READY + 4)
+        self.keypress_switch(self._SWITCH_IDS['record_ready_channel_5'], status)
 
     def keypress_record_ready_channel_6(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_RECORD_READY + 5)
+        self.keypress_switch(self._SWITCH_IDS['record_ready_channel_6'], status)
 
     def keypress_record_ready_channel_7(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_RECORD_READY + 6)
+        self.keypress_switch(self._SWITCH_IDS['record_ready_channel_7'], status)
 
     def keypress_record_ready_channel_8(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_RECORD_READY + 7)
+        self.keypress_switch(self._SWITCH_IDS['record_ready_channel_8'], status)
 
     def keypress_solo_channel(self, channel, status):
         # channel: 1 - 8
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_SOLO + channel - 1)
+        self.keypress_switch(self._SWITCH_IDS['solo_channel_%d' % channel], status)
 
     def keypress_solo_channel_1(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_SOLO)
+        self.keypress_switch(self._SWITCH_IDS['solo_channel_1'], status)
 
     def keypress_solo_channel_2(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_SOLO + 1)
+        self.keypress_switch(self._SWITCH_IDS['solo_channel_2'], status)
 
     def keypress_solo_channel_3(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_SOLO + 2)
+        self.keypress_switch(self._SWITCH_IDS['solo_channel_3'], status)
 
     def keypress_solo_channel_4(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_SOLO + 3)
+        self.keypress_switch(self._SWITCH_IDS['solo_channel_4'], status)
 
     def keypress_solo_channel_5(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_SOLO + 4)
+        self.keypress_switch(self._SWITCH_IDS['solo_channel_5'], status)
 
     def keypress_solo_channel_6(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_SOLO + 5)
+        self.keypress_switch(self._SWITCH_IDS['solo_channel_6'], status)
 
     def keypress_solo_channel_7(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_SOLO + 6)
+        self.keypress_switch(self._SWITCH_IDS['solo_channel_7'], status)
 
     def keypress_solo_channel_8(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_SOLO + 7)
+        self.keypress_switch(self._SWITCH_IDS['solo_channel_8'], status)
 
     def keypress_mute_channel(self, channel, status):
         # channel: 1 - 8
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_MUTE + channel - 1)
+        self.keypress_switch(self._SWITCH_IDS['mute_channel_%d' % channel], status)
 
     def keypress_mute_channel_1(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_MUTE)
+        self.keypress_switch(self._SWITCH_IDS['mute_channel_1'], status)
 
     def keypress_mute_channel_2(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_MUTE + 1)
+        self.keypress_switch(self._SWITCH_IDS['mute_channel_2'], status)
 
     def keypress_mute_channel_3(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_MUTE + 2)
+        self.keypress_switch(self._SWITCH_IDS['mute_channel_3'], status)
 
     def keypress_mute_channel_4(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_MUTE + 3)
+        self.keypress_switch(self._SWITCH_IDS['mute_channel_4'], status)
 
     def keypress_mute_channel_5(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_MUTE + 4)
+        self.keypress_switch(self._SWITCH_IDS['mute_channel_5'], status)
 
     def keypress_mute_channel_6(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_MUTE + 5)
+        self.keypress_switch(self._SWITCH_IDS['mute_channel_6'], status)
 
     def keypress_mute_channel_7(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_MUTE + 6)
+        self.keypress_switch(self._SWITCH_IDS['mute_channel_7'], status)
 
     def keypress_mute_channel_8(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_MUTE + 7)
+        self.keypress_switch(self._SWITCH_IDS['mute_channel_8'], status)
 
     def keypress_select_channel(self, channel, status):
         # channel: 1 - 8
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_SELECT + channel - 1)
+        self.keypress_switch(self._SWITCH_IDS['select_channel_%d' % channel], status)
 
     def keypress_select_channel_1(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_SELECT)
+        self.keypress_switch(self._SWITCH_IDS['select_channel_1'], status)
 
     def keypress_select_channel_2(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_SELECT + 1)
+        self.keypress_switch(self._SWITCH_IDS['select_channel_2'], status)
 
     def keypress_select_channel_3(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_SELECT + 2)
+        self.keypress_switch(self._SWITCH_IDS['select_channel_3'], status)
 
     def keypress_select_channel_4(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_SELECT + 3)
+        self.keypress_switch(self._SWITCH_IDS['select_channel_4'], status)
 
     def keypress_select_channel_5(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_SELECT + 4)
+        self.keypress_switch(self._SWITCH_IDS['select_channel_5'], status)
 
     def keypress_select_channel_6(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_SELECT + 5)
+        self.keypress_switch(self._SWITCH_IDS['select_channel_6'], status)
 
     def keypress_select_channel_7(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_SELECT + 6)
+        self.keypress_switch(self._SWITCH_IDS['select_channel_7'], status)
 
     def keypress_select_channel_8(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_SELECT + 7)
+        self.keypress_switch(self._SWITCH_IDS['select_channel_8'], status)
 
     def keypress_vselect_channel(self, channel, status):
         # channel: 1 - 8
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_VSELECT + channel - 1)
+        self.keypress_switch(self._SWITCH_IDS['vselect_channel_%d' % channel], status)
 
     def keypress_vselect_channel_1(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_VSELECT)
+        self.keypress_switch(self._SWITCH_IDS['vselect_channel_1'], status)
 
     def keypress_vselect_channel_2(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_VSELECT + 1)
+        self.keypress_switch(self._SWITCH_IDS['vselect_channel_2'], status)
 
     def keypress_vselect_channel_3(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_VSELECT + 2)
+        self.keypress_switch(self._SWITCH_IDS['vselect_channel_3'], status)
 
     def keypress_vselect_channel_4(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_VSELECT + 3)
+        self.keypress_switch(self._SWITCH_IDS['vselect_channel_4'], status)
 
     def keypress_vselect_channel_5(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_VSELECT + 4)
+        self.keypress_switch(self._SWITCH_IDS['vselect_channel_5'], status)
 
     def keypress_vselect_channel_6(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_VSELECT + 5)
+        self.keypress_switch(self._SWITCH_IDS['vselect_channel_6'], status)
 
     def keypress_vselect_channel_7(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_VSELECT + 6)
+        self.keypress_switch(self._SWITCH_IDS['vselect_channel_7'], status)
 
     def keypress_vselect_channel_8(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CHANNEL_VSELECT + 7)
+        self.keypress_switch(self._SWITCH_IDS['vselect_channel_8'], status)
 
     def keypress_function_channel(self, channel, status):
         # channel: 1 - 8
-        self._key_pressed(status, self._SWITCH_CHANNEL_FUNCTION + channel - 1)
+        self.keypress_switch(self._SWITCH_IDS['function_channel_%d' % channel], status)
 
     def keypress_function_channel_1(self, status):
-        self._key_pressed(status, self._SWITCH_CHANNEL_FUNCTION)
+        self.keypress_switch(self._SWITCH_IDS['function_channel_1'], status)
 
     def keypress_function_channel_2(self, status):
-        self._key_pressed(status, self._SWITCH_CHANNEL_FUNCTION + 1)
+        self.keypress_switch(self._SWITCH_IDS['function_channel_2'], status)
 
     def keypress_function_channel_3(self, status):
-        self._key_pressed(status, self._SWITCH_CHANNEL_FUNCTION + 2)
+        self.keypress_switch(self._SWITCH_IDS['function_channel_3'], status)
 
     def keypress_function_channel_4(self, status):
-        self._key_pressed(status, self._SWITCH_CHANNEL_FUNCTION + 3)
+        self.keypress_switch(self._SWITCH_IDS['function_channel_4'], status)
 
     def keypress_function_channel_5(self, status):
-        self._key_pressed(status, self._SWITCH_CHANNEL_FUNCTION + 4)
+        self.keypress_switch(self._SWITCH_IDS['function_channel_5'], status)
 
     def keypress_function_channel_6(self, status):
-        self._key_pressed(status, self._SWITCH_CHANNEL_FUNCTION + 5)
+        self.keypress_switch(self._SWITCH_IDS['function_channel_6'], status)
 
     def keypress_function_channel_7(self, status):
-        self._key_pressed(status, self._SWITCH_CHANNEL_FUNCTION + 6)
+        self.keypress_switch(self._SWITCH_IDS['function_channel_7'], status)
 
     def keypress_function_channel_8(self, status):
-        self._key_pressed(status, self._SWITCH_CHANNEL_FUNCTION + 7)
+        self.keypress_switch(self._SWITCH_IDS['function_channel_8'], status)
 
     def keypress_assignment_track(self, status):
-        self._key_pressed(status, self._LED_SWITCH_ASSIGNMENT_TRACK)
+        self.keypress_switch(self._SWITCH_IDS['assignment_track'], status)
 
     def keypress_assignment_send(self, status):
-        self._key_pressed(status, self._LED_SWITCH_ASSIGNMENT_SEND)
+        self.keypress_switch(self._SWITCH_IDS['assignment_send'], status)
 
     def keypress_assignment_pan_surround(self, status):
-        self._key_pressed(status, self._LED_SWITCH_ASSIGNMENT_PAN_SURROUND)
+        self.keypress_switch(self._SWITCH_IDS['assignment_pan_surround'], status)
 
     def keypress_assignment_plug_in(self, status):
-        self._key_pressed(status, self._LED_SWITCH_ASSIGNMENT_PLUG_IN)
+        self.keypress_switch(self._SWITCH_IDS['assignment_plug_in'], status)
 
     def keypress_assignment_eq(self, status):
-        self._key_pressed(status, self._LED_SWITCH_ASSIGNMENT_EQ)
+        self.keypress_switch(self._SWITCH_IDS['assignment_eq'], status)
 
     def keypress_assignment_instrument(self, status):
-        self._key_pressed(status, self._LED_SWITCH_ASSIGNMENT_INSTRUMENT)
+        self.keypress_switch(self._SWITCH_IDS['assignment_instrument'], status)
 
     def keypress_fader_banks_bank_left(self, status):
-        self._key_pressed(status, self._SWITCH_FADER_BANKS_BANK_LEFT)
+        self.keypress_switch(self._SWITCH_IDS['fader_banks_bank_left'], status)
 
     def keypress_fader_banks_bank_right(self, status):
-        self._key_pressed(status, self._SWITCH_FADER_BANKS_BANK_RIGHT)
+        self.keypress_switch(self._SWITCH_IDS['fader_banks_bank_right'], status)
 
     def keypress_fader_banks_channel_left(self, status):
-        self._key_pressed(status, self._SWITCH_FADER_BANKS_CHANNEL_LEFT)
+        self.keypress_switch(self._SWITCH_IDS['fader_banks_channel_left'], status)
 
     def keypress_fader_banks_channel_right(self, status):
-        self._key_pressed(status, self._SWITCH_FADER_BANKS_CHANNEL_RIGHT)
+        self.keypress_switch(self._SWITCH_IDS['fader_banks_channel_right'], status)
 
     def keypress_flip(self, status):
-        self._key_pressed(status, self._LED_SWITCH_FLIP)
+        self.keypress_switch(self._SWITCH_IDS['flip'], status)
 
     def keypress_global_view(self, status):
-        self._key_pressed(status, self._LED_SWITCH_GLOBAL_VIEW)
+        self.keypress_switch(self._SWITCH_IDS['global_view'], status)
 
     def keypress_name_value(self, status):
-        self._key_pressed(status, self._SWITCH_NAME_VALUE)
+        self.keypress_switch(self._SWITCH_IDS['name_value'], status)
 
     def keypress_smpte_beats(self, status):
-        self._key_pressed(status, self._SWITCH_SMPTE_BEATS)
+        self.keypress_switch(self._SWITCH_IDS['smpte_beats'], status)
 
     def keypress_global_view_midi_tracks(self, status):
-        self._key_pressed(status, self._SWITCH_GLOBAL_VIEW_MIDI_TRACKS)
+        self.keypress_switch(self._SWITCH_IDS['global_view_midi_tracks'], status)
 
     def keypress_global_view_inputs(self, status):
-        self._key_pressed(status, self._SWITCH_GLOBAL_VIEW_INPUTS)
+        self.keypress_switch(self._SWITCH_IDS['global_view_inputs'], status)
 
     def keypress_global_view_audio_tracks(self, status):
-        self._key_pressed(status, self._SWITCH_GLOBAL_VIEW_AUDIO_TRACKS)
+        self.keypress_switch(self._SWITCH_IDS['global_view_audio_tracks'], status)
 
     def keypress_global_view_audio_instruments(self, status):
-        self._key_pressed(status, self._SWITCH_GLOBAL_VIEW_AUDIO_INSTRUMENTS)
+        self.keypress_switch(self._SWITCH_IDS['global_view_audio_instruments'], status)
 
     def keypress_global_view_aux(self, status):
-        self._key_pressed(status, self._SWITCH_GLOBAL_VIEW_AUX)
+        self.keypress_switch(self._SWITCH_IDS['global_view_aux'], status)
 
     def keypress_global_view_busses(self, status):
-        self._key_pressed(status, self._SWITCH_GLOBAL_VIEW_BUSSES)
+        self.keypress_switch(self._SWITCH_IDS['global_view_busses'], status)
 
     def keypress_global_view_outputs(self, status):
-        self._key_pressed(status, self._SWITCH_GLOBAL_VIEW_OUTPUTS)
+        self.keypress_switch(self._SWITCH_IDS['global_view_outputs'], status)
 
     def keypress_global_view_user(self, status):
-        self._key_pressed(status, self._SWITCH_GLOBAL_VIEW_USER)
+        self.keypress_switch(self._SWITCH_IDS['global_view_user'], status)
 
     def keypress_shift(self, status):
-        self._key_pressed(status, self._SWITCH_SHIFT)
+        self.keypress_switch(self._SWITCH_IDS['shift'], status)
 
     def keypress_option(self, status):
-        self._key_pressed(status, self._SWITCH_OPTION)
+        self.keypress_switch(self._SWITCH_IDS['option'], status)
 
     def keypress_control(self, status):
-        self._key_pressed(status, self._SWITCH_CONTROL)
+        self.keypress_switch(self._SWITCH_IDS['control'], status)
 
     def keypress_command_alt(self, status):
-        self._key_pressed(status, self._SWITCH_COMMAND_ALT)
+        self.keypress_switch(self._SWITCH_IDS['command_alt'], status)
 
     def keypress_automation_read_off(self, status):
-        self._key_pressed(status, self._LED_SWITCH_AUTOMATION_READ_OFF)
+        self.keypress_switch(self._SWITCH_IDS['automation_read_off'], status)
 
     def keypress_automation_write(self, status):
-        self._key_pressed(status, self._LED_SWITCH_AUTOMATION_WRITE)
+        self.keypress_switch(self._SWITCH_IDS['automation_write'], status)
 
     def keypress_automation_trim(self, status):
-        self._key_pressed(status, self._LED_SWITCH_AUTOMATION_TRIM)
+        self.keypress_switch(self._SWITCH_IDS['automation_trim'], status)
 
     def keypress_automation_touch(self, status):
-        self._key_pressed(status, self._LED_SWITCH_AUTOMATION_TOUCH)
+        self.keypress_switch(self._SWITCH_IDS['automation_touch'], status)
 
     def keypress_automation_latch(self, status):
-        self._key_pressed(status, self._LED_SWITCH_AUTOMATION_LATCH)
+        self.keypress_switch(self._SWITCH_IDS['automation_latch'], status)
 
     def keypress_group(self, status):
-        self._key_pressed(status, self._LED_SWITCH_GROUP)
+        self.keypress_switch(self._SWITCH_IDS['group'], status)
 
     def keypress_utilities_save(self, status):
-        self._key_pressed(status, self._LED_SWITCH_UTILITIES_SAVE)
+        self.keypress_switch(self._SWITCH_IDS['utilities_save'], status)
 
     def keypress_utilities_undo(self, status):
-        self._key_pressed(status, self._LED_SWITCH_UTILITIES_UNDO)
+        self.keypress_switch(self._SWITCH_IDS['utilities_undo'], status)
 
     def keypress_utilities_cancel(self, status):
-        self._key_pressed(status, self._SWITCH_UTILITIES_CANCEL)
+        self.keypress_switch(self._SWITCH_IDS['utilities_cancel'], status)
 
     def keypress_utilities_enter(self, status):
-        self._key_pressed(status, self._SWITCH_UTILITIES_ENTER)
+        self.keypress_switch(self._SWITCH_IDS['utilities_enter'], status)
 
     def keypress_marker(self, status):
-        self._key_pressed(status, self._LED_SWITCH_MARKER)
+        self.keypress_switch(self._SWITCH_IDS['marker'], status)
 
     def keypress_nudge(self, status):
-        self._key_pressed(status, self._LED_SWITCH_NUDGE)
+        self.keypress_switch(self._SWITCH_IDS['nudge'], status)
 
     def keypress_cycle(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CYCLE)
+        self.keypress_switch(self._SWITCH_IDS['cycle'], status)
 
     def keypress_drop(self, status):
-        self._key_pressed(status, self._LED_SWITCH_DROP)
+        self.keypress_switch(self._SWITCH_IDS['drop'], status)
 
     def keypress_replace(self, status):
-        self._key_pressed(status, self._LED_SWITCH_REPLACE)
+        self.keypress_switch(self._SWITCH_IDS['replace'], status)
 
     def keypress_click(self, status):
-        self._key_pressed(status, self._LED_SWITCH_CLICK)
+        self.keypress_switch(self._SWITCH_IDS['click'], status)
 
     def keypress_solo(self, status):
-        self._key_pressed(status, self._LED_SWITCH_SOLO)
+        self.keypress_switch(self._SWITCH_IDS['solo'], status)
 
     def keypress_rewind(self, status):
-        self._key_pressed(status, self._LED_SWITCH_REWIND)
+        self.keypress_switch(self._SWITCH_IDS['rewind'], status)
 
     def keypress_fast_forward(self, status):
-        self._key_pressed(status, self._LED_SWITCH_FAST_FORWARD)
+        self.keypress_switch(self._SWITCH_IDS['fast_forward'], status)
 
     def keypress_stop(self, status):
-        self._key_pressed(status, self._LED_SWITCH_STOP)
+        self.keypress_switch(self._SWITCH_IDS['stop'], status)
 
     def keypress_play(self, status):
-        self._key_pressed(status, self._LED_SWITCH_PLAY)
+        self.keypress_switch(self._SWITCH_IDS['play'], status)
 
     def keypress_record(self, status):
-        self._key_pressed(status, self._LED_SWITCH_RECORD)
+        self.keypress_switch(self._SWITCH_IDS['record'], status)
 
     def keypress_cursor_up(self, status):
-        self._key_pressed(status, self._SWITCH_CURSOR_UP)
+        self.keypress_switch(self._SWITCH_IDS['cursor_up'], status)
 
     def keypress_cursor_down(self, status):
-        self._key_pressed(status, self._SWITCH_CURSOR_DOWN)
+        self.keypress_switch(self._SWITCH_IDS['cursor_down'], status)
 
     def keypress_cursor_left(self, status):
-        self._key_pressed(status, self._SWITCH_CURSOR_LEFT)
+        self.keypress_switch(self._SWITCH_IDS['cursor_left'], status)
 
     def keypress_cursor_right(self, status):
-        self._key_pressed(status, self._SWITCH_CURSOR_RIGHT)
+        self.keypress_switch(self._SWITCH_IDS['cursor_right'], status)
 
     def keypress_zoom(self, status):
-        self._key_pressed(status, self._LED_SWITCH_ZOOM)
+        self.keypress_switch(self._SWITCH_IDS['zoom'], status)
 
     def keypress_scrub(self, status):
-        self._key_pressed(status, self._LED_SWITCH_SCRUB)
+        self.keypress_switch(self._SWITCH_IDS['scrub'], status)
 
     def keypress_user_switch(self, switch_number, status):
         # switch_number: 1 - 2
-        if switch_number == 1:
-            self._key_pressed(status, self._SWITCH_USER_SWITCH_A)
-        else:
-            self._key_pressed(status, self._SWITCH_USER_SWITCH_B)
+        self.keypress_switch(self._SWITCH_IDS['user_switch_%d' % switch_number], status)
 
     def keypress_user_switch_1(self, status):
-        self._key_pressed(status, self._SWITCH_USER_SWITCH_A)
+        self.keypress_switch(self._SWITCH_IDS['user_switch_1'], status)
 
     def keypress_user_switch_2(self, status):
-        self._key_pressed(status, self._SWITCH_USER_SWITCH_B)
+        self.keypress_switch(self._SWITCH_IDS['user_switch_2'], status)
 
     def keypress_fader_touch_channel(self, channel, status):
         # channel: 1 - 8
-        self._key_pressed(status, self._SWITCH_CHANNEL_FADER_TOUCH + channel - 1)
+        self.keypress_switch(self._SWITCH_IDS['fader_touch_channel_%d' % channel], status)
 
     def keypress_fader_touch_channel_1(self, status):
-        self._key_pressed(status, self._SWITCH_CHANNEL_FADER_TOUCH)
+        self.keypress_switch(self._SWITCH_IDS['fader_touch_channel_1'], status)
 
     def keypress_fader_touch_channel_2(self, status):
-        self._key_pressed(status, self._SWITCH_CHANNEL_FADER_TOUCH + 1)
+        self.keypress_switch(self._SWITCH_IDS['fader_touch_channel_2'], status)
 
     def keypress_fader_touch_channel_3(self, status):
-        self._key_pressed(status, self._SWITCH_CHANNEL_FADER_TOUCH + 2)
+        self.keypress_switch(self._SWITCH_IDS['fader_touch_channel_3'], status)
 
     def keypress_fader_touch_channel_4(self, status):
-        self._key_pressed(status, self._SWITCH_CHANNEL_FADER_TOUCH + 3)
+        self.keypress_switch(self._SWITCH_IDS['fader_touch_channel_4'], status)
 
     def keypress_fader_touch_channel_5(self, status):
-        self._key_pressed(status, self._SWITCH_CHANNEL_FADER_TOUCH + 4)
+        self.keypress_switch(self._SWITCH_IDS['fader_touch_channel_5'], status)
 
     def keypress_fader_touch_channel_6(self, status):
-        self._key_pressed(status, self._SWITCH_CHANNEL_FADER_TOUCH + 5)
+        self.keypress_switch(self._SWITCH_IDS['fader_touch_channel_6'], status)
 
     def keypress_fader_touch_channel_7(self, status):
-        self._key_pressed(status, self._SWITCH_CHANNEL_FADER_TOUCH + 6)
+        self.keypress_switch(self._SWITCH_IDS['fader_touch_channel_7'], status)
 
     def keypress_fader_touch_channel_8(self, status):
-        self._key_pressed(status, self._SWITCH_CHANNEL_FADER_TOUCH + 7)
+        self.keypress_switch(self._SWITCH_IDS['fader_touch_channel_8'], status)
 
     def keypress_fader_touch_master(self, status):
-        self._key_pressed(status, self._SWITCH_MASTER_FADER_TOUCH)
+        self.keypress_switch(self._SWITCH_IDS['fader_touch_master'], status)
 
     # --- commands from Mackie Control host ---
     def _set_led(self, led_id, status):
-        if self.is_offline():
-            return
+        led_handler = self._led_handlers.get(led_id)
 
-        selector = {
-            self._LED_SWITCH_CHANNEL_RECORD_READY: 'self._hardware_controller.set_led_channel_record_ready(0, status)',
-            self._LED_SWITCH_CHANNEL_RECORD_READY + 1:
-                'self._hardware_controller.set_led_channel_record_ready(1, status)',
-            self._LED_SWITCH_CHANNEL_RECORD_READY + 2:
-                'self._hardware_controller.set_led_channel_record_ready(2, status)',
-            self._LED_SWITCH_CHANNEL_RECORD_READY + 3:
-                'self._hardware_controller.set_led_channel_record_ready(3, status)',
-            self._LED_SWITCH_CHANNEL_RECORD_READY + 4:
-                'self._hardware_controller.set_led_channel_record_ready(4, status)',
-            self._LED_SWITCH_CHANNEL_RECORD_READY + 5:
-                'self._hardware_controller.set_led_channel_record_ready(5, status)',
-            self._LED_SWITCH_CHANNEL_RECORD_READY + 6:
-                'self._hardware_controller.set_led_channel_record_ready(6, status)',
-            self._LED_SWITCH_CHANNEL_RECORD_READY + 7:
-                'self._hardware_controller.set_led_channel_record_ready(7, status)',
-            self._LED_SWITCH_CHANNEL_SOLO: 'self._hardware_controller.set_led_channel_solo(0, status)',
-            self._LED_SWITCH_CHANNEL_SOLO + 1: 'self._hardware_controller.set_led_channel_solo(1, status)',
-            self._LED_SWITCH_CHANNEL_SOLO + 2: 'self._hardware_controller.set_led_channel_solo(2, status)',
-            self._LED_SWITCH_CHANNEL_SOLO + 3: 'self._hardware_controller.set_led_channel_solo(3, status)',
-            self._LED_SWITCH_CHANNEL_SOLO + 4: 'self._hardware_controller.set_led_channel_solo(4, status)',
-            self._LED_SWITCH_CHANNEL_SOLO + 5: 'self._hardware_controller.set_led_channel_solo(5, status)',
-            self._LED_SWITCH_CHANNEL_SOLO + 6: 'self._hardware_controller.set_led_channel_solo(6, status)',
-            self._LED_SWITCH_CHANNEL_SOLO + 7: 'self._hardware_controller.set_led_channel_solo(7, status)',
-            self._LED_SWITCH_CHANNEL_MUTE: 'self._hardware_controller.set_led_channel_mute(0, status)',
-            self._LED_SWITCH_CHANNEL_MUTE + 1: 'self._hardware_controller.set_led_channel_mute(1, status)',
-            self._LED_SWITCH_CHANNEL_MUTE + 2: 'self._hardware_controller.set_led_channel_mute(2, status)',
-            self._LED_SWITCH_CHANNEL_MUTE + 3: 'self._hardware_controller.set_led_channel_mute(3, status)',
-            self._LED_SWITCH_CHANNEL_MUTE + 4: 'self._hardware_controller.set_led_channel_mute(4, status)',
-            self._LED_SWITCH_CHANNEL_MUTE + 5: 'self._hardware_controller.set_led_channel_mute(5, status)',
-            self._LED_SWITCH_CHANNEL_MUTE + 6: 'self._hardware_controller.set_led_channel_mute(6, status)',
-            self._LED_SWITCH_CHANNEL_MUTE + 7: 'self._hardware_controller.set_led_channel_mute(7, status)',
-            self._LED_SWITCH_CHANNEL_SELECT: 'self._hardware_controller.set_led_channel_select(0, status)',
-            self._LED_SWITCH_CHANNEL_SELECT + 1: 'self._hardware_controller.set_led_channel_select(1, status)',
-            self._LED_SWITCH_CHANNEL_SELECT + 2: 'self._hardware_controller.set_led_channel_select(2, status)',
-            self._LED_SWITCH_CHANNEL_SELECT + 3: 'self._hardware_controller.set_led_channel_select(3, status)',
-            self._LED_SWITCH_CHANNEL_SELECT + 4: 'self._hardware_controller.set_led_channel_select(4, status)',
-            self._LED_SWITCH_CHANNEL_SELECT + 5: 'self._hardware_controller.set_led_channel_select(5, status)',
-            self._LED_SWITCH_CHANNEL_SELECT + 6: 'self._hardware_controller.set_led_channel_select(6, status)',
-            self._LED_SWITCH_CHANNEL_SELECT + 7: 'self._hardware_controller.set_led_channel_select(7, status)',
-            self._LED_SWITCH_CHANNEL_VSELECT: 'self._hardware_controller.set_led_channel_vselect(0, status)',
-            self._LED_SWITCH_CHANNEL_VSELECT + 1: 'self._hardware_controller.set_led_channel_vselect(1, status)',
-            self._LED_SWITCH_CHANNEL_VSELECT + 2: 'self._hardware_controller.set_led_channel_vselect(2, status)',
-            self._LED_SWITCH_CHANNEL_VSELECT + 3: 'self._hardware_controller.set_led_channel_vselect(3, status)',
-            self._LED_SWITCH_CHANNEL_VSELECT + 4: 'self._hardware_controller.set_led_channel_vselect(4, status)',
-            self._LED_SWITCH_CHANNEL_VSELECT + 5: 'self._hardware_controller.set_led_channel_vselect(5, status)',
-            self._LED_SWITCH_CHANNEL_VSELECT + 6: 'self._hardware_controller.set_led_channel_vselect(6, status)',
-            self._LED_SWITCH_CHANNEL_VSELECT + 7: 'self._hardware_controller.set_led_channel_vselect(7, status)',
-            self._LED_SWITCH_ASSIGNMENT_TRACK: 'self._hardware_controller.set_led_assignment_track(status)',
-            self._LED_SWITCH_ASSIGNMENT_SEND: 'self._hardware_controller.set_led_assignment_send(status)',
-            self._LED_SWITCH_ASSIGNMENT_PAN_SURROUND:
-                'self._hardware_controller.set_led_assignment_pan_surround(status)',
-            self._LED_SWITCH_ASSIGNMENT_PLUG_IN: 'self._hardware_controller.set_led_assignment_plug_in(status)',
-            self._LED_SWITCH_ASSIGNMENT_EQ: 'self._hardware_controller.set_led_assignment_eq(status)',
-            self._LED_SWITCH_ASSIGNMENT_INSTRUMENT: 'self._hardware_controller.set_led_assignment_instrument(status)',
-            self._LED_SWITCH_FLIP: 'self._hardware_controller.set_led_flip(status)',
-            self._LED_SWITCH_GLOBAL_VIEW: 'self._hardware_controller.set_led_global_view(status)',
-            self._LED_SWITCH_AUTOMATION_READ_OFF: 'self._hardware_controller.set_led_automation_read_off(status)',
-            self._LED_SWITCH_AUTOMATION_WRITE: 'self._hardware_controller.set_led_automation_write(status)',
-            self._LED_SWITCH_AUTOMATION_TRIM: 'self._hardware_controller.set_led_automation_trim(status)',
-            self._LED_SWITCH_AUTOMATION_TOUCH: 'self._hardware_controller.set_led_automation_touch(status)',
-            self._LED_SWITCH_AUTOMATION_LATCH: 'self._hardware_controller.set_led_automation_latch(status)',
-            self._LED_SWITCH_GROUP: 'self._hardware_controller.set_led_group(status)',
-            self._LED_SWITCH_UTILITIES_SAVE: 'self._hardware_controller.set_led_utilities_save(status)',
-            self._LED_SWITCH_UTILITIES_UNDO: 'self._hardware_controller.set_led_utilities_undo(status)',
-            self._LED_SWITCH_MARKER: 'self._hardware_controller.set_led_marker(status)',
-            self._LED_SWITCH_NUDGE: 'self._hardware_controller.set_led_nudge(status)',
-            self._LED_SWITCH_CYCLE: 'self._hardware_controller.set_led_cycle(status)',
-            self._LED_SWITCH_DROP: 'self._hardware_controller.set_led_drop(status)',
-            self._LED_SWITCH_REPLACE: 'self._hardware_controller.set_led_replace(status)',
-            self._LED_SWITCH_CLICK: 'self._hardware_controller.set_led_click(status)',
-            self._LED_SWITCH_SOLO: 'self._hardware_controller.set_led_solo(status)',
-            self._LED_SWITCH_REWIND: 'self._hardware_controller.set_led_rewind(status)',
-            self._LED_SWITCH_FAST_FORWARD: 'self._hardware_controller.set_led_fast_forward(status)',
-            self._LED_SWITCH_STOP: 'self._hardware_controller.set_led_stop(status)',
-            self._LED_SWITCH_PLAY: 'self._hardware_controller.set_led_play(status)',
-            self._LED_SWITCH_RECORD: 'self._hardware_controller.set_led_record(status)',
-            self._LED_SWITCH_ZOOM: 'self._hardware_controller.set_led_zoom(status)',
-            self._LED_SWITCH_SCRUB: 'self._hardware_controller.set_led_scrub(status)',
-            self._LED_SMPTE: 'self._hardware_controller.set_led_smpte(status)',
-            self._LED_BEATS: 'self._hardware_controller.set_led_beats(status)',
-            self._LED_RUDE_SOLO: 'self._hardware_controller.set_led_rude_solo(status)',
-            self._LED_RELAY_CLICK: 'self._hardware_controller.set_led_relay_click(status)'
-        }
-
-        if led_id in selector:
-            eval(selector[led_id])
+        if led_handler:
+            led_handler(status)
         else:
             led_status = 'off'
             if status == 1:
@@ -970,12 +1356,18 @@ class MackieHostControl:
             self._log('LED 0x%02X NOT implemented (%s).' % (led_id, led_status))
 
     def faders_to_minimum(self):
+        self._surface_state.faders_to_minimum()
+
         if self._hardware_controller:
             self._hardware_controller.faders_to_minimum()
 
     def all_leds_off(self):
+        self._surface_state.all_leds_off()
+
         if self._hardware_controller:
             self._hardware_controller.all_leds_off()
 
     def reset(self):
+        self._surface_state.reset()
+        self._meter_engine.reset()
         self.go_offline()
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+"""
+PythonMcu
+=========
+Mackie Host Controller written in Python
+Copyright (c) 2011 Martin Zuther (http://www.mzuther.de/)
+Copyright (c) 2021 Raphaël Doursenaud <rdoursenaud@free.fr>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Thank you for using free software!
+
+"""
+
+
+
+class McuMeterEngine:
+    __module__ = __name__
+    __doc__ = 'Decay and peak hold of Mackie Control meters'
+
+    # Mackie Control surfaces decay meters on their own by one step
+    # every 300 ms
+    DECAY_INTERVAL = 0.3
+
+    # number of decay intervals that peaks are held
+    PEAK_HOLD_TICKS = 5
+
+    MAXIMUM_LEVEL = 0x0C
+    SET_OVERLOAD = 0x0E
+    CLEAR_OVERLOAD = 0x0F
+
+    def __init__(self, number_of_meters, callback_level, callback_peak=None):
+        """
+        callback_level(meter_id, meter_level) is called whenever a
+        meter level or overload state changes; callback_peak(meter_id,
+        peak_level) whenever a held peak changes
+        """
+        self._number_of_meters = number_of_meters
+        self._callback_level = callback_level
+        self._callback_peak = callback_peak
+
+        self._levels = bytearray(number_of_meters)
+        self._peaks = bytearray(number_of_meters)
+        self._peak_hold_ticks = bytearray(number_of_meters)
+        self._overloads = bytearray(number_of_meters)
+
+        # values that have been passed on to the callbacks
+        self._sent_levels = bytearray(number_of_meters)
+        self._sent_peaks = bytearray(number_of_meters)
+
+    def reset(self):
+        for meter_id in range(self._number_of_meters):
+            self._levels[meter_id] = 0
+            self._peaks[meter_id] = 0
+            self._peak_hold_ticks[meter_id] = 0
+            self._overloads[meter_id] = 0
+
+            self._update(meter_id)
+
+    def set_level(self, meter_id, meter_level):
+        """
+        meter_level: value sent by the host (0x00 - 0x0C, 0x0E sets
+        and 0x0F clears overload)
+        """
+        if meter_level == self.SET_OVERLOAD or meter_level == self.CLEAR_OVERLOAD:
+            overload = int(meter_level == self.SET_OVERLOAD)
+
+            if self._overloads[meter_id] != overload:
+                self._overloads[meter_id] = overload
+                self._callback_level(meter_id, meter_level)
+
+            return
+
+        meter_level = min(meter_level, self.MAXIMUM_LEVEL)
+        self._levels[meter_id] = meter_level
+
+        if meter_level >= self._peaks[meter_id]:
+            self._peaks[meter_id] = meter_level
+            self._peak_hold_ticks[meter_id] = self.PEAK_HOLD_TICKS
+
+        self._update(meter_id)
+
+    def decay(self, _now=None):
+        """
+        decay all meters by one step (call every "DECAY_INTERVAL"
+        seconds)
+        """
+        levels = self._levels
+        peaks = self._peaks
+
+        # nothing to decay
+        if not any(peaks):
+            return
+
+        peak_hold_ticks = self._peak_hold_ticks
+
+        for meter_id in range(self._number_of_meters):
+            if levels[meter_id]:
+                levels[meter_id] -= 1
+
+            if peak_hold_ticks[meter_id]:
+                peak_hold_ticks[meter_id] -= 1
+            elif peaks[meter_id] > levels[meter_id]:
+                peaks[meter_id] -= 1
+
+            self._update(meter_id)
+
+    def get_level(self, meter_id):
+        return self._levels[meter_id]
+
+    def get_peak(self, meter_id):
+        return self._peaks[meter_id]
+
+    def _update(self, meter_id):
+        meter_level = self._levels[meter_id]
+
+        if meter_level != self._sent_levels[meter_id]:
+            self._sent_levels[meter_id] = meter_level
+            self._callback_level(meter_id, meter_level)
+
+        peak_level = self._peaks[meter_id]
+
+        if peak_level != self._sent_peaks[meter_id]:
+            self._sent_peaks[meter_id] = peak_level
+
+            if self._callback_peak:
+                self._callback_peak(meter_id, peak_level)
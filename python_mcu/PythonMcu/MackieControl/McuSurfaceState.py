@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+"""
+PythonMcu
+=========
+Mackie Host Controller written in Python
+Copyright (c) 2011 Martin Zuther (http://www.mzuther.de/)
+Copyright (c) 2021 Raphaël Doursenaud <rdoursenaud@free.fr>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Thank you for using free software!
+
+"""
+
+
+import array
+
+
+class McuSurfaceState:
+    __module__ = __name__
+    __doc__ = 'State of a Mackie Control surface as set by the host'
+
+    # marks values that have not been set by the host yet
+    UNKNOWN = 0xFF
+
+    LCD_SIZE = 112
+    NUMBER_OF_LEDS = 128
+    NUMBER_OF_CHANNELS = 8
+
+    # eight channel faders and master fader
+    NUMBER_OF_FADERS = 9
+
+    # ten digits of timecode display and two digits of assignment
+    # display
+    NUMBER_OF_DIGITS = 12
+
+    def __init__(self):
+        self._lcd = bytearray(self.LCD_SIZE)
+        self._leds = bytearray(self.NUMBER_OF_LEDS)
+        self._vpot_rings = bytearray(self.NUMBER_OF_CHANNELS)
+        self._meters = bytearray(self.NUMBER_OF_CHANNELS)
+        self._digits = bytearray(self.NUMBER_OF_DIGITS)
+
+        # fader positions (10 bit) or -1 if unknown
+        self._faders = array.array('h', [-1] * self.NUMBER_OF_FADERS)
+
+        self.reset()
+
+    def reset(self):
+        # arrays are changed in place, so that views on them stay valid
+        self._lcd[:] = b' ' * self.LCD_SIZE
+        self._leds[:] = bytes([self.UNKNOWN]) * self.NUMBER_OF_LEDS
+        self._vpot_rings[:] = bytes([self.UNKNOWN]) * self.NUMBER_OF_CHANNELS
+        self._meters[:] = bytes([self.UNKNOWN]) * self.NUMBER_OF_CHANNELS
+        self._digits[:] = bytes([self.UNKNOWN]) * self.NUMBER_OF_DIGITS
+
+        for fader_id in range(self.NUMBER_OF_FADERS):
+            self._faders[fader_id] = -1
+
+    # --- updates from host ---
+    def set_lcd(self, position, hex_codes):
+        # the LCD wraps around, just like the hardware
+        position %= self.LCD_SIZE
+        length = min(len(hex_codes), self.LCD_SIZE - position)
+
+        self._lcd[position:position + length] = hex_codes[:length]
+
+        if length < len(hex_codes):
+            self.set_lcd(0, hex_codes[length:])
+
+    def set_led(self, led_id, led_status):
+        self._leds[led_id] = led_status
+
+    def set_vpot_ring(self, vpot_id, vpot_ring):
+        """
+        vpot_ring: raw value of the MIDI message (center LED, mode and
+        position)
+        """
+        self._vpot_rings[vpot_id] = vpot_ring
+
+    def set_fader(self, fader_id, fader_position):
+        self._faders[fader_id] = fader_position
+
+    def set_meter(self, meter_id, meter_level):
+        self._meters[meter_id] = meter_level
+
+    def set_digit(self, position, character_code):
+        self._digits[position] = character_code
+
+    def all_leds_off(self):
+        self._leds[:] = bytes(self.NUMBER_OF_LEDS)
+
+    def faders_to_minimum(self):
+        for fader_id in range(self.NUMBER_OF_FADERS):
+            self._faders[fader_id] = 0
+
+    # --- queries (returned arrays must not be changed) ---
+    def get_lcd(self):
+        return self._lcd
+
+    def get_leds(self):
+        return self._leds
+
+    def get_vpot_rings(self):
+        return self._vpot_rings
+
+    def get_faders(self):
+        return self._faders
+
+    def get_meters(self):
+        return self._meters
+
+    def get_digits(self):
+        return self._digits
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+"""
+PythonMcu
+=========
+Mackie Host Controller written in Python
+Copyright (c) 2011 Martin Zuther (http://www.mzuther.de/)
+Copyright (c) 2021 Raphaël Doursenaud <rdoursenaud@free.fr>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Thank you for using free software!
+
+"""
+
+
+import array
+import time
+
+
+class McuFaderProcessor:
+    __module__ = __name__
+    __doc__ = 'Interpolation of 7-bit controller faders onto 14-bit Mackie Control faders'
+
+    # eight channel faders and the master fader
+    NUMBER_OF_FADERS = 9
+
+    MAXIMUM_POSITION = 0x3FFF
+
+    # interval between fader positions sent to the host (seconds)
+    DEFAULT_OUTPUT_INTERVAL = 0.01
+
+    # 7-bit values that arrive further apart than this are sent right
+    # away; closer values are ramped over the time that has passed
+    # since the previous value
+    MAXIMUM_RAMP_TIME = 0.1
+
+    def __init__(self, callback_move_fader, output_interval=DEFAULT_OUTPUT_INTERVAL):
+        """
+        callback_move_fader(fader_id, fader_position) is called with
+        14-bit fader positions; "update()" has to be called every
+        "output_interval" seconds
+        """
+        self._callback_move_fader = callback_move_fader
+        self._output_interval = output_interval
+
+        # -1: position unknown
+        self._positions = array.array('h', [-1] * self.NUMBER_OF_FADERS)
+        self._targets = array.array('h', [-1] * self.NUMBER_OF_FADERS)
+
+        # remaining steps and step size of running ramps
+        self._ramp_steps = array.array('h', [0] * self.NUMBER_OF_FADERS)
+        self._ramp_increments = array.array('d', [0.0] * self.NUMBER_OF_FADERS)
+        self._ramp_positions = array.array('d', [0.0] * self.NUMBER_OF_FADERS)
+
+        self._input_times = array.array('d', [0.0] * self.NUMBER_OF_FADERS)
+
+    def get_output_interval(self):
+        return self._output_interval
+
+    def get_position(self, fader_id):
+        return self._positions[fader_id]
+
+    def reset(self):
+        for fader_id in range(self.NUMBER_OF_FADERS):
+            self._positions[fader_id] = -1
+            self._targets[fader_id] = -1
+            self._ramp_steps[fader_id] = 0
+
+    def move_fader(self, fader_id, fader_position):
+        """
+        fader_position: 14-bit position (0x0000 - 0x3FFF), which is
+        sent right away
+        """
+        self._ramp_steps[fader_id] = 0
+        self._targets[fader_id] = fader_position
+        self._send(fader_id, fader_position)
+
+    def move_fader_7bit(self, fader_id, fader_value, timestamp=None):
+        """
+        fader_value: 7-bit position (0x00 - 0x7F), which is spread
+        over the full 14-bit range
+        """
+        if timestamp is None:
+            timestamp = time.perf_counter()
+
+        target = (fader_value << 7) | fader_value
+        elapsed = timestamp - self._input_times[fader_id]
+        self._input_times[fader_id] = timestamp
+
+        position = self._positions[fader_id]
+        self._targets[fader_id] = target
+
+        if target == position:
+            self._ramp_steps[fader_id] = 0
+            return
+
+        # a fader that starts moving (or has never moved) is sent
+        # right away
+        if position < 0 or elapsed > self.MAXIMUM_RAMP_TIME:
+            self._ramp_steps[fader_id] = 0
+            self._send(fader_id, target)
+            return
+
+        # spread the move over the time between the last two values,
+        # so that the fader arrives when the next value is expected
+        steps = max(1, round(elapsed / self._output_interval))
+
+        self._ramp_steps[fader_id] = steps
+        self._ramp_positions[fader_id] = position
+        self._ramp_increments[fader_id] = (target - position) / steps
+
+    def update(self, _now=None):
+        """
+        send the next position of every ramping fader
+        """
+        ramp_steps = self._ramp_steps
+        if not any(ramp_steps):
+            return
+
+        for fader_id in range(self.NUMBER_OF_FADERS):
+            steps = ramp_steps[fader_id]
+            if not steps:
+                continue
+
+            steps -= 1
+            ramp_steps[fader_id] = steps
+
+            if steps:
+                self._ramp_positions[fader_id] += self._ramp_increments[fader_id]
+                self._send(fader_id, round(self._ramp_positions[fader_id]))
+            else:
+                # end exactly on target
+                self._send(fader_id, self._targets[fader_id])
+
+    def _send(self, fader_id, fader_position):
+        if fader_position != self._positions[fader_id]:
+            self._positions[fader_id] = fader_position
+            self._callback_move_fader(fader_id, fader_position)
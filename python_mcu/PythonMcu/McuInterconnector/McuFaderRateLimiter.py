@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+"""
+PythonMcu
+=========
+Mackie Host Controller written in Python
+Copyright (c) 2011 Martin Zuther (http://www.mzuther.de/)
+Copyright (c) 2021 Raphaël Doursenaud <rdoursenaud@free.fr>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Thank you for using free software!
+
+"""
+
+
+import array
+import time
+
+
+class McuFaderRateLimiter:
+    __module__ = __name__
+    __doc__ = 'Rate limiter for fader positions sent to the host'
+
+    # eight channel faders and the master fader
+    NUMBER_OF_FADERS = 9
+
+    # fader positions per second and fader
+    DEFAULT_MAXIMUM_RATE = 50
+
+    def __init__(self, callback_move_fader, maximum_rate=DEFAULT_MAXIMUM_RATE):
+        """
+        callback_move_fader(fader_id, fader_position) is called at most
+        "maximum_rate" times per second and fader; "update()" has to
+        be called regularly (see "get_update_interval()"), so that the
+        last position of a fader is always sent
+        """
+        self._callback_move_fader = callback_move_fader
+        self._minimum_interval = 1.0 / maximum_rate
+
+        self._send_times = array.array('d', [float('-inf')] * self.NUMBER_OF_FADERS)
+
+        # -1: nothing pending
+        self._pending_positions = array.array('h', [-1] * self.NUMBER_OF_FADERS)
+
+    def get_update_interval(self):
+        return self._minimum_interval / 2.0
+
+    def reset(self):
+        for fader_id in range(self.NUMBER_OF_FADERS):
+            self._send_times[fader_id] = float('-inf')
+            self._pending_positions[fader_id] = -1
+
+    def move_fader(self, fader_id, fader_position, now=None):
+        if now is None:
+            now = time.perf_counter()
+
+        if now - self._send_times[fader_id] >= self._minimum_interval:
+            self._send(fader_id, fader_position, now)
+        else:
+            # only the latest position is kept
+            self._pending_positions[fader_id] = fader_position
+
+    def update(self, now=None):
+        """
+        send pending fader positions (trailing edge)
+        """
+        pending_positions = self._pending_positions
+        if max(pending_positions) < 0:
+            return
+
+        if now is None:
+            now = time.perf_counter()
+
+        for fader_id in range(self.NUMBER_OF_FADERS):
+            fader_position = pending_positions[fader_id]
+
+            if fader_position >= 0 and now - self._send_times[fader_id] >= self._minimum_interval:
+                self._send(fader_id, fader_position, now)
+
+    def _send(self, fader_id, fader_position, now):
+        self._pending_positions[fader_id] = -1
+        self._send_times[fader_id] = now
+        self._callback_move_fader(fader_id, fader_position)
@@ -24,6 +24,7 @@ Thank you for using free software!
 
 """
 
+import re
 import sys
 
 if __name__ == "__main__":
@@ -31,6 +32,14 @@ if __name__ == "__main__":
     sys.path.append('../../')
 
 from PythonMcu.MackieControl.MackieHostControl import MackieHostControl
+from PythonMcu.MackieControl.McuMeterEngine import McuMeterEngine
+from PythonMcu.McuInterconnector.McuFaderProcessor import McuFaderProcessor
+from PythonMcu.McuInterconnector.McuFaderRateLimiter import McuFaderRateLimiter
+from PythonMcu.McuInterconnector.McuUnitProxy import McuUnitProxy
+from PythonMcu.McuInterconnector.McuVpotAggregator import McuVpotAggregator
+from PythonMcu.Midi.MidiConnection import MidiConnection
+from PythonMcu.Midi.MidiIoEngine import MidiIoEngine
+from PythonMcu.Midi.MidiLatencyMonitor import MidiLatencyMonitor
 from PythonMcu.Tools.ApplicationConfiguration import ApplicationConfiguration
 
 # noinspection PyUnresolvedReferences
@@ -156,8 +165,46 @@ class McuInterconnector:
         'zoom',
     ]
 
+    # extenders (XT units) that may be emulated besides the main unit
+    MAXIMUM_EXTENDERS = 3
+
+    # MCU commands of channel strips, such as "mute_channel_1"
+    _CHANNEL_COMMAND = re.compile(r'^(\w+_channel)_(\d)$')
+
     def __init__(self, parent, mcu_model_id, mcu_connection, mcu_midi_input, mcu_midi_output, hardware_controller_class,
-                 controller_midi_input, controller_midi_output, callback_log):
+                 controller_midi_input, controller_midi_output, callback_log,
+                 midi_batch_size=MidiConnection.DEFAULT_READ_BATCH_SIZE, midi_latency=1,
+                 midi_output_interval=0, extender_midi_ports=(), channel_map=None,
+                 fader_output_interval=0, fader_maximum_rate=McuFaderRateLimiter.DEFAULT_MAXIMUM_RATE,
+                 vpot_window=20, vpot_acceleration=0.0, lcd_maximum_rate=30):
+        """
+        extender_midi_ports: list of (midi_input, midi_output) tuples,
+        one for each emulated extender (XT unit)
+
+        channel_map: (unit, channel) for each of the hardware
+        controller's eight channels (unit 0 is the main unit and units
+        1 to 3 are extenders); defaults to the channels of the main
+        unit
+
+        fader_output_interval: interval (in ms) at which 7-bit
+        controller faders are interpolated onto 14-bit host faders
+        (0 sends 7-bit values as they arrive); never shorter than the
+        interval given by "fader_maximum_rate"
+
+        fader_maximum_rate: fader positions sent to the host per second
+        and fader (0 sends all positions); the last position of a
+        fader is always sent
+
+        vpot_window: V-Pot ticks within this window (in ms) are sent
+        to the host as one message (0 sends every tick as it arrives)
+
+        vpot_acceleration: speeds up fast V-Pot spins (see
+        "McuVpotAggregator"; 0 disables acceleration)
+
+        lcd_maximum_rate: LCD updates sent to the hardware controller
+        per second; changes in between are collected (0 sends every
+        change)
+        """
         self._play_status = False
         self._callback_log = callback_log
         self.parent = parent
@@ -177,49 +224,270 @@ class McuInterconnector:
             mcu_midi_input, mcu_midi_output, callback_log
         )
 
+        # the main unit comes first
+        assert len(extender_midi_ports) <= self.MAXIMUM_EXTENDERS
+        extender_model_id = MackieHostControl.get_extender_model_id(mcu_model_id)
+
+        self._mackie_host_controls = [self._mackie_host_control]
+        for (extender_midi_input, extender_midi_output) in extender_midi_ports:
+            self._mackie_host_controls.append(MackieHostControl(
+                extender_model_id, mcu_connection, python_mcu_version,
+                extender_midi_input, extender_midi_output, callback_log
+            ))
+
+        if channel_map is None:
+            channel_map = [(0, channel) for channel in range(McuUnitProxy.NUMBER_OF_CHANNELS)]
+
+        self._init_channel_map(channel_map)
+
         # set this here so the hardware controller can notify the user
         # about the connection process
         self._hardware_controller.set_interconnector(self)
-        self._mackie_host_control.set_hardware_controller(self)
+
+        # MIDI input is read by one thread per MIDI connection (MIDI
+        # latency is given in milliseconds)
+        self._io_engine = MidiIoEngine(callback_log, midi_latency / 1000.0)
+
+        for midi_connection in self._get_midi_connections():
+            midi_connection.set_read_batch_size(midi_batch_size)
+            self._io_engine.add_connection(midi_connection)
+
+            # coalesce outgoing MIDI messages and send them once per
+            # output interval (given in milliseconds)
+            midi_connection.set_output_coalescing(midi_output_interval > 0)
+
+        if midi_output_interval > 0:
+            self._io_engine.add_timer(midi_output_interval / 1000.0, self._flush_midi_output)
+
+        # 7-bit controller faders are smoothed onto the 14-bit
+        # range of Mackie Control faders
+        if fader_output_interval > 0:
+            # interpolating faster than the rate limiter lets fader
+            # positions pass only produces positions that are dropped
+            if fader_maximum_rate > 0:
+                fader_output_interval = max(fader_output_interval, 1000.0 / fader_maximum_rate)
+
+            self._fader_processor = McuFaderProcessor(self._move_fader, fader_output_interval / 1000.0)
+            self._io_engine.add_timer(fader_output_interval / 1000.0, self._fader_processor.update)
+        else:
+            self._fader_processor = None
+
+        # keep fader sweeps from flooding the host
+        if fader_maximum_rate > 0:
+            self._fader_rate_limiter = McuFaderRateLimiter(self._send_fader, fader_maximum_rate)
+            self._io_engine.add_timer(
+                self._fader_rate_limiter.get_update_interval(), self._fader_rate_limiter.update)
+        else:
+            self._fader_rate_limiter = None
+
+        # fast V-Pot spins are sent as fewer messages with more ticks
+        if vpot_window > 0:
+            self._vpot_aggregator = McuVpotAggregator(self._send_vpot, vpot_window / 1000.0, vpot_acceleration)
+            self._io_engine.add_timer(vpot_window / 1000.0, self._vpot_aggregator.update)
+        else:
+            self._vpot_aggregator = None
+
+        # hosts send the LCD in many small pieces, so collect them
+        if lcd_maximum_rate > 0:
+            self._hardware_controller.set_lcd_update_interval(1.0 / lcd_maximum_rate, self._io_engine.add_timer)
+
+        # host connections are handled by the I/O engine, so the
+        # hardware controller is serviced while waiting for the host
+        for mackie_host_control in self._mackie_host_controls:
+            self._io_engine.add_timer(
+                MackieHostControl.CONNECTION_TIMER_INTERVAL, mackie_host_control.update_connection)
+            self._io_engine.add_timer(McuMeterEngine.DECAY_INTERVAL, mackie_host_control.decay_meters)
+
+        # latency from receiving a MIDI message to sending the
+        # resulting MIDI messages
+        self._latency_monitor = MidiLatencyMonitor()
+
+        # MCU command names --> (Mackie Host Control, switch ID)
+        self._switch_targets = {}
+        for command in self._MCU_COMMANDS:
+            self._switch_targets[command] = self._get_switch_target(command)
 
         self._led__hardware_to_mcu = {}
         self._led__mcu_to_hardware = {}
+        self._switch__hardware_to_mcu = {}
 
         self.withdraw_all_controls()
 
     def _log(self, message, repaint=False):
         self._callback_log('[MCU Interconnector   ]  ' + message, repaint)
 
+    def _init_channel_map(self, channel_map):
+        assert len(channel_map) == McuUnitProxy.NUMBER_OF_CHANNELS
+
+        # hardware channel --> (Mackie Host Control, channel)
+        self._channel_targets = []
+
+        # unit --> hardware channel of each of its channels
+        unit_channels = []
+        for _ in self._mackie_host_controls:
+            unit_channels.append([None] * McuUnitProxy.NUMBER_OF_CHANNELS)
+
+        for (hardware_channel, channel_target) in enumerate(channel_map):
+            if channel_target is None:
+                self._channel_targets.append(None)
+                continue
+
+            (unit, channel) = channel_target
+            self._channel_targets.append((self._mackie_host_controls[unit], channel))
+            unit_channels[unit][channel] = hardware_channel
+
+        for (unit, mackie_host_control) in enumerate(self._mackie_host_controls):
+            mackie_host_control.set_hardware_controller(McuUnitProxy(self, unit, unit_channels[unit]))
+
+    def _get_switch_target(self, mcu_command):
+        mackie_host_control = self._mackie_host_control
+
+        # channel strip switches are mapped like their channels
+        match = self._CHANNEL_COMMAND.match(mcu_command)
+        if match:
+            channel_target = self._channel_targets[int(match.group(2)) - 1]
+            if not channel_target:
+                return None
+
+            (mackie_host_control, channel) = channel_target
+            mcu_command = '%s_%d' % (match.group(1), channel + 1)
+
+        switch_id = MackieHostControl.get_switch_id(mcu_command)
+
+        # some MCU commands only have an LED
+        if switch_id is None:
+            return None
+
+        return (mackie_host_control, switch_id)
+
     # --- initialisation ---
     def connect(self):
         self._hardware_controller.connect()
-        self._mackie_host_control.connect()
+        self._flush_midi_output()
+
+        for mackie_host_control in self._mackie_host_controls:
+            mackie_host_control.connect()
+            self._flush_midi_output()
+
+        self._io_engine.start()
 
     def disconnect(self):
+        # process remaining MIDI input before closing MIDI ports
+        self._io_engine.stop()
+
+        self.log_latency_report()
+
         self.withdraw_all_controls()
 
-        self._mackie_host_control.disconnect()
+        for mackie_host_control in reversed(self._mackie_host_controls):
+            mackie_host_control.disconnect()
+
         self._hardware_controller.disconnect()
 
     def go_online(self):
         self._hardware_controller.go_online()
 
+    def repaint_hardware_controller(self):
+        """
+        restore LEDs, displays, faders and meters of the hardware
+        controller from the last state sent by the host
+        """
+        with self._hardware_controller.burst():
+            for mackie_host_control in self._mackie_host_controls:
+                mackie_host_control.repaint_hardware_controller()
+
+            # LEDs are only sent when the host changes them
+            self.update_all_leds()
+
     def go_offline(self):
         self._hardware_controller.go_offline()
 
+    def _get_midi_connections(self):
+        midi_connections = [self._hardware_controller.get_midi_connection()]
+
+        for mackie_host_control in self._mackie_host_controls:
+            midi_connections.append(mackie_host_control.get_midi_connection())
+
+        return midi_connections
+
+    def _flush_midi_output(self, _now=None):
+        for midi_connection in self._get_midi_connections():
+            midi_connection.flush_output()
+
     def process_midi_input(self):
         self._hardware_controller.process_midi_input()
-        self._mackie_host_control.process_midi_input()
+
+        for mackie_host_control in self._mackie_host_controls:
+            mackie_host_control.process_midi_input()
+
+    def get_latency_monitor(self):
+        return self._latency_monitor
+
+    def log_latency_report(self):
+        self._log('MIDI latency (ms):')
+
+        for line in self._latency_monitor.get_report():
+            self._log('  ' + line)
+
+        self._log('', True)
 
     # --- registration of MIDI controls ---
     def register_control(self, mcu_command, midi_switch, midi_led):
         self.withdraw_control(midi_switch)
+        self._assign_control(mcu_command, midi_switch, midi_led)
 
+        self._update_led(mcu_command)
+
+    def register_controls(self, layout):
+        """
+        apply a whole layout of (mcu_command, midi_switch, midi_led)
+        tuples at once ("mcu_command" None withdraws the control);
+        only LEDs that actually change are sent, and all of them in
+        one go
+        """
+        # LEDs as currently shown by the hardware controller
+        old_leds = {}
+        for (_, midi_switch, _) in layout:
+            mcu_command = self._led__hardware_to_mcu.get(midi_switch)
+
+            if mcu_command:
+                midi_led = self._led__mcu_to_hardware[mcu_command]['midi_led']
+                if midi_led:
+                    old_leds[midi_led] = self._led__mcu_to_hardware[mcu_command]['value']
+
+                self._unassign_control(midi_switch)
+
+        new_leds = {}
+        for (mcu_command, midi_switch, midi_led) in layout:
+            if mcu_command:
+                self._assign_control(mcu_command, midi_switch, midi_led)
+
+                if midi_led:
+                    new_leds[midi_led] = self._led__mcu_to_hardware[mcu_command]['value']
+
+        with self._hardware_controller.burst():
+            for (midi_led, status) in old_leds.items():
+                if status and midi_led not in new_leds:
+                    self._hardware_controller.set_led(midi_led, 0)
+
+            # LEDs of previously unassigned controls are in an unknown
+            # state, so they are always sent
+            for (midi_led, status) in new_leds.items():
+                if old_leds.get(midi_led) != status:
+                    self._hardware_controller.set_led(midi_led, status)
+
+    def _assign_control(self, mcu_command, midi_switch, midi_led):
         self._led__hardware_to_mcu[midi_switch] = mcu_command
+        self._switch__hardware_to_mcu[midi_switch] = self._switch_targets[mcu_command]
         self._led__mcu_to_hardware[mcu_command]['midi_switch'] = midi_switch
         self._led__mcu_to_hardware[mcu_command]['midi_led'] = midi_led
 
-        self._update_led(mcu_command)
+    def _unassign_control(self, midi_switch):
+        mcu_command = self._led__hardware_to_mcu.pop(midi_switch)
+
+        del self._switch__hardware_to_mcu[midi_switch]
+        self._led__mcu_to_hardware[mcu_command]['midi_switch'] = None
+        self._led__mcu_to_hardware[mcu_command]['midi_led'] = None
 
     def withdraw_control(self, midi_switch):
         if midi_switch in self._led__hardware_to_mcu:
@@ -229,19 +497,28 @@ class McuInterconnector:
             if midi_led:
                 self._hardware_controller.set_led(midi_led, 0)
 
-            del self._led__hardware_to_mcu[midi_switch]
-            self._led__mcu_to_hardware[mcu_command]['midi_switch'] = None
-            self._led__mcu_to_hardware[mcu_command]['midi_led'] = None
+            self._unassign_control(midi_switch)
+
+    def update_all_leds(self):
+        """
+        send the LEDs of all registered controls again (for example
+        when the hardware controller has been used by other software)
+        """
+        with self._hardware_controller.burst():
+            for mcu_command in self._led__hardware_to_mcu.values():
+                self._update_led(mcu_command)
 
     def withdraw_all_controls(self):
-        for _, mcu_command in self._led__hardware_to_mcu.items():
-            midi_led = self._led__mcu_to_hardware[mcu_command]['midi_led']
+        with self._hardware_controller.burst():
+            for _, mcu_command in self._led__hardware_to_mcu.items():
+                midi_led = self._led__mcu_to_hardware[mcu_command]['midi_led']
 
-            if midi_led:
-                self._hardware_controller.set_led(midi_led, 0)
+                if midi_led:
+                    self._hardware_controller.set_led(midi_led, 0)
 
         self._led__hardware_to_mcu = {}
         self._led__mcu_to_hardware = {}
+        self._switch__hardware_to_mcu = {}
 
         for command in self._MCU_COMMANDS:
             self._led__mcu_to_hardware[command] = {
@@ -252,17 +529,26 @@ class McuInterconnector:
 
     # --- MCU Interconnector commands ---
     def keypress(self, internal_id, status):
-        if internal_id in self._led__hardware_to_mcu:
-            mcu_command = self._led__hardware_to_mcu[internal_id]
-            self.keypress_unregistered(mcu_command, status)
+        if internal_id in self._switch__hardware_to_mcu:
+            self._press_switch(self._switch__hardware_to_mcu[internal_id], status)
+            self._latency_monitor.record('key')
             return True
 
         return False
 
+    def keypress_unregistered(self, mcu_command, status):
+        if mcu_command not in self._switch_targets:
+            self._log('MCU command "%s" NOT known.' % mcu_command)
+            return
+
+        self._press_switch(self._switch_targets[mcu_command], status)
+
     @staticmethod
-    def keypress_unregistered(mcu_command, status):
-        command = 'self._mackie_host_control.keypress_%s(%d)' % (mcu_command, status)
-        eval(command)
+    def _press_switch(switch_target, status):
+        # some MCU commands only have an LED (or are not mapped)
+        if switch_target:
+            (mackie_host_control, switch_id) = switch_target
+            mackie_host_control.keypress_switch(switch_id, status)
 
     def _set_led(self, mcu_command, status):
         if self._led__mcu_to_hardware[mcu_command]['value'] != status:
@@ -270,6 +556,7 @@ class McuInterconnector:
 
             if self._led__mcu_to_hardware[mcu_command]['midi_switch']:
                 self._update_led(mcu_command)
+                self._latency_monitor.record('led')
 
     def _update_led(self, mcu_command):
         if self._led__mcu_to_hardware[mcu_command]['midi_switch']:
@@ -295,17 +582,68 @@ class McuInterconnector:
     def has_meter_bridge(self):
         return self._hardware_controller.has_meter_bridge()
 
+    def _get_channel_target(self, channel):
+        # master fader and other controls beyond the channel strips
+        # belong to the main unit
+        if channel >= McuUnitProxy.NUMBER_OF_CHANNELS:
+            return (self._mackie_host_control, channel)
+
+        return self._channel_targets[channel]
+
     def move_fader(self, fader_id, fader_value):
-        self._mackie_host_control.move_fader(fader_id, fader_value)
+        if self._fader_processor:
+            self._fader_processor.move_fader(fader_id, fader_value)
+        else:
+            self._move_fader(fader_id, fader_value)
 
     def move_fader_7bit(self, fader_id, fader_value):
-        self._mackie_host_control.move_fader_7bit(fader_id, fader_value)
+        if self._fader_processor:
+            self._fader_processor.move_fader_7bit(
+                fader_id, fader_value, MidiConnection.get_event_timestamp())
+        else:
+            # same as sending the 7-bit value as both LSB and MSB
+            self._move_fader(fader_id, (fader_value << 7) | fader_value)
+
+    def _move_fader(self, fader_id, fader_value):
+        if self._fader_rate_limiter:
+            self._fader_rate_limiter.move_fader(fader_id, fader_value)
+        else:
+            self._send_fader(fader_id, fader_value)
+
+    def _send_fader(self, fader_id, fader_value):
+        channel_target = self._get_channel_target(fader_id)
+        if channel_target:
+            channel_target[0].move_fader(channel_target[1], fader_value)
+
+        # fader moves that have been delayed by the fader processor or
+        # rate limiter are sent from a timer and thus not recorded
+        self._latency_monitor.record('fader')
 
     def move_vpot(self, vpot_id, direction, number_of_ticks):
-        self._mackie_host_control.move_vpot(vpot_id, direction, number_of_ticks)
+        if self._vpot_aggregator:
+            self._vpot_aggregator.move_vpot(
+                vpot_id, direction == MackieHostControl.VPOT_COUNTER_CLOCKWISE, number_of_ticks)
+            self._latency_monitor.record('vpot')
+            return
+
+        channel_target = self._get_channel_target(vpot_id)
+        if channel_target:
+            channel_target[0].move_vpot(channel_target[1], direction, number_of_ticks)
+            self._latency_monitor.record('vpot')
 
     def move_vpot_raw(self, vpot_id, vpot_movement):
-        self._mackie_host_control.move_vpot_raw(vpot_id, vpot_movement)
+        if self._vpot_aggregator:
+            self._vpot_aggregator.move_vpot_raw(vpot_id, vpot_movement)
+            self._latency_monitor.record('vpot')
+            return
+
+        self._send_vpot(vpot_id, vpot_movement)
+        self._latency_monitor.record('vpot')
+
+    def _send_vpot(self, vpot_id, vpot_movement):
+        channel_target = self._get_channel_target(vpot_id)
+        if channel_target:
+            channel_target[0].move_vpot_raw(channel_target[1], vpot_movement)
 
     # --- Mackie Control Unit commands ---
     def fader_moved(self, fader_id, fader_position):
@@ -314,6 +652,9 @@ class McuInterconnector:
     def set_peak_level(self, meter_id, meter_level):
         self._hardware_controller.set_peak_level(meter_id, meter_level)
 
+    def set_peak_hold(self, meter_id, peak_level):
+        self._hardware_controller.set_peak_hold(meter_id, peak_level)
+
     def set_display_7seg(self, position, character_code):
         self._hardware_controller.set_display_7seg(position, character_code)
 
@@ -325,6 +666,7 @@ class McuInterconnector:
 
     def set_lcd(self, position, hex_codes):
         self._hardware_controller.set_lcd(position, hex_codes)
+        self._latency_monitor.record('lcd')
 
     def set_led_channel_record_ready(self, channel, status):
         # channel: 0 - 7
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+"""
+PythonMcu
+=========
+Mackie Host Controller written in Python
+Copyright (c) 2011 Martin Zuther (http://www.mzuther.de/)
+Copyright (c) 2021 Raphaël Doursenaud <rdoursenaud@free.fr>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Thank you for using free software!
+
+"""
+
+
+
+class McuUnitProxy:
+    __module__ = __name__
+    __doc__ = 'Hardware controller as seen by a single Mackie Control unit'
+
+    NUMBER_OF_CHANNELS = 8
+
+    # the LCD of hardware controllers holds eight channel strips of
+    # seven characters on each of its two lines
+    _LCD_LINE_LENGTH = 56
+    _LCD_STRIP_LENGTH = 7
+
+    def __init__(self, interconnector, unit_index, hardware_channels):
+        """
+        hardware_channels: hardware channel for each of the unit's
+        eight channels ("None" if a channel is not mapped)
+
+        Unit 0 is the main unit; it also receives everything that is
+        not tied to a channel (transport, displays, global LEDs).
+        Other units (extenders) only drive their mapped channels.
+        """
+        assert len(hardware_channels) == self.NUMBER_OF_CHANNELS
+
+        self._interconnector = interconnector
+        self._unit_index = unit_index
+        self._hardware_channels = tuple(hardware_channels)
+
+        self._is_main_unit = (unit_index == 0)
+        self._is_identity = self._is_main_unit and \
+            self._hardware_channels == tuple(range(self.NUMBER_OF_CHANNELS))
+
+    def __getattr__(self, name):
+        # forward everything that is not tied to a channel (this is
+        # only called for attributes that have not been found)
+        if self._is_main_unit or name.startswith('has_'):
+            return getattr(self._interconnector, name)
+
+        return self._ignore
+
+    @staticmethod
+    def _ignore(*_args):
+        pass
+
+    def get_unit_index(self):
+        return self._unit_index
+
+    def get_hardware_channel(self, channel):
+        if channel >= self.NUMBER_OF_CHANNELS:
+            return None
+
+        return self._hardware_channels[channel]
+
+    # --- channel strips ---
+    def fader_moved(self, fader_id, fader_position):
+        # master fader
+        if fader_id >= self.NUMBER_OF_CHANNELS:
+            if self._is_main_unit:
+                self._interconnector.fader_moved(fader_id, fader_position)
+            return
+
+        hardware_channel = self._hardware_channels[fader_id]
+        if hardware_channel is not None:
+            self._interconnector.fader_moved(hardware_channel, fader_position)
+
+    def set_peak_level(self, meter_id, meter_level):
+        hardware_channel = self._hardware_channels[meter_id]
+        if hardware_channel is not None:
+            self._interconnector.set_peak_level(hardware_channel, meter_level)
+
+    def set_peak_hold(self, meter_id, peak_level):
+        hardware_channel = self._hardware_channels[meter_id]
+        if hardware_channel is not None:
+            self._interconnector.set_peak_hold(hardware_channel, peak_level)
+
+    def set_vpot_led_ring(self, vpot_id, vpot_center_led, vpot_mode, vpot_position):
+        hardware_channel = self.get_hardware_channel(vpot_id)
+        if hardware_channel is not None:
+            self._interconnector.set_vpot_led_ring(hardware_channel, vpot_center_led, vpot_mode, vpot_position)
+
+    def set_led_channel_record_ready(self, channel, status):
+        hardware_channel = self._hardware_channels[channel]
+        if hardware_channel is not None:
+            self._interconnector.set_led_channel_record_ready(hardware_channel, status)
+
+    def set_led_channel_solo(self, channel, status):
+        hardware_channel = self._hardware_channels[channel]
+        if hardware_channel is not None:
+            self._interconnector.set_led_channel_solo(hardware_channel, status)
+
+    def set_led_channel_mute(self, channel, status):
+        hardware_channel = self._hardware_channels[channel]
+        if hardware_channel is not None:
+            self._interconnector.set_led_channel_mute(hardware_channel, status)
+
+    def set_led_channel_select(self, channel, status):
+        hardware_channel = self._hardware_channels[channel]
+        if hardware_channel is not None:
+            self._interconnector.set_led_channel_select(hardware_channel, status)
+
+    def set_led_channel_vselect(self, channel, status):
+        hardware_channel = self._hardware_channels[channel]
+        if hardware_channel is not None:
+            self._interconnector.set_led_channel_vselect(hardware_channel, status)
+
+    def set_lcd(self, position, hex_codes):
+        if self._is_identity:
+            self._interconnector.set_lcd(position, hex_codes)
+            return
+
+        # forward characters strip by strip
+        offset = 0
+        while offset < len(hex_codes):
+            (line, column) = divmod((position + offset) % (2 * self._LCD_LINE_LENGTH), self._LCD_LINE_LENGTH)
+            (strip, strip_column) = divmod(column, self._LCD_STRIP_LENGTH)
+            length = min(self._LCD_STRIP_LENGTH - strip_column, len(hex_codes) - offset)
+
+            hardware_channel = self._hardware_channels[strip]
+            if hardware_channel is not None and hardware_channel < self.NUMBER_OF_CHANNELS:
+                hardware_position = line * self._LCD_LINE_LENGTH + \
+                    hardware_channel * self._LCD_STRIP_LENGTH + strip_column
+                self._interconnector.set_lcd(hardware_position, hex_codes[offset:offset + length])
+
+            offset += length
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+"""
+PythonMcu
+=========
+Mackie Host Controller written in Python
+Copyright (c) 2011 Martin Zuther (http://www.mzuther.de/)
+Copyright (c) 2021 Raphaël Doursenaud <rdoursenaud@free.fr>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Thank you for using free software!
+
+"""
+
+
+import array
+import time
+
+
+class McuVpotAggregator:
+    __module__ = __name__
+    __doc__ = 'Aggregation of relative V-Pot ticks sent to the host'
+
+    NUMBER_OF_VPOTS = 8
+
+    # ticks within this window (in seconds) are sent as one message
+    DEFAULT_WINDOW = 0.02
+
+    # a V-Pot message holds up to 63 ticks (bit 6 holds the direction)
+    MAXIMUM_TICKS = 0x3F
+    _COUNTER_CLOCKWISE = 0x40
+
+    def __init__(self, callback_move_vpot, window=DEFAULT_WINDOW, acceleration=0.0):
+        """
+        callback_move_vpot(vpot_id, vpot_movement) is called with raw
+        V-Pot movements (number of ticks, plus 0x40 when turned
+        counter-clockwise); "update()" has to be called every "window"
+        seconds
+
+        acceleration: ticks that are aggregated into one message are
+        multiplied by (1 + acceleration * (ticks - 1)), so that fast
+        spins cover more ground (0 disables acceleration)
+        """
+        self._callback_move_vpot = callback_move_vpot
+        self._window = window
+        self._acceleration = acceleration
+
+        # largest number of ticks that fits into one message after
+        # acceleration; remaining ticks are sent in the next window
+        self._maximum_ticks = self.MAXIMUM_TICKS
+        while self._accelerate(self._maximum_ticks) > self.MAXIMUM_TICKS:
+            self._maximum_ticks -= 1
+
+        self._send_times = array.array('d', [float('-inf')] * self.NUMBER_OF_VPOTS)
+
+        # signed sum of pending ticks (negative: counter-clockwise)
+        self._pending_ticks = array.array('i', [0] * self.NUMBER_OF_VPOTS)
+
+    def get_window(self):
+        return self._window
+
+    def reset(self):
+        for vpot_id in range(self.NUMBER_OF_VPOTS):
+            self._send_times[vpot_id] = float('-inf')
+            self._pending_ticks[vpot_id] = 0
+
+    def move_vpot_raw(self, vpot_id, vpot_movement, now=None):
+        number_of_ticks = vpot_movement & self.MAXIMUM_TICKS
+        if vpot_movement & self._COUNTER_CLOCKWISE:
+            number_of_ticks = -number_of_ticks
+
+        self._add_ticks(vpot_id, number_of_ticks, now)
+
+    def move_vpot(self, vpot_id, counter_clockwise, number_of_ticks, now=None):
+        if counter_clockwise:
+            number_of_ticks = -number_of_ticks
+
+        self._add_ticks(vpot_id, number_of_ticks, now)
+
+    def _add_ticks(self, vpot_id, number_of_ticks, now):
+        if now is None:
+            now = time.perf_counter()
+
+        self._pending_ticks[vpot_id] += number_of_ticks
+
+        # the first tick after a pause is sent right away
+        if now - self._send_times[vpot_id] >= self._window:
+            self._send(vpot_id, now)
+
+    def update(self, now=None):
+        """
+        send ticks that have been aggregated during the last window
+        """
+        pending_ticks = self._pending_ticks
+        if not any(pending_ticks):
+            return
+
+        if now is None:
+            now = time.perf_counter()
+
+        for vpot_id in range(self.NUMBER_OF_VPOTS):
+            if pending_ticks[vpot_id] and now - self._send_times[vpot_id] >= self._window:
+                self._send(vpot_id, now)
+
+    def _accelerate(self, number_of_ticks):
+        if not self._acceleration:
+            return number_of_ticks
+
+        return round(number_of_ticks * (1.0 + self._acceleration * (number_of_ticks - 1)))
+
+    def _send(self, vpot_id, now):
+        number_of_ticks = self._pending_ticks[vpot_id]
+
+        # ticks in opposite directions may have cancelled out
+        if not number_of_ticks:
+            return
+
+        self._send_times[vpot_id] = now
+
+        # ticks that do not fit into one message are carried over to
+        # the next window
+        sent_ticks = min(abs(number_of_ticks), self._maximum_ticks)
+        if number_of_ticks < 0:
+            self._pending_ticks[vpot_id] = number_of_ticks + sent_ticks
+        else:
+            self._pending_ticks[vpot_id] = number_of_ticks - sent_ticks
+
+        vpot_movement = self._accelerate(sent_ticks)
+        if number_of_ticks < 0:
+            vpot_movement |= self._COUNTER_CLOCKWISE
+
+        self._callback_move_vpot(vpot_id, vpot_movement)
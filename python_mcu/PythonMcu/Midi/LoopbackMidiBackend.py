@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+"""
+PythonMcu
+=========
+Mackie Host Controller written in Python
+Copyright (c) 2011 Martin Zuther (http://www.mzuther.de/)
+Copyright (c) 2021 Raphaël Doursenaud <rdoursenaud@free.fr>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Thank you for using free software!
+
+"""
+
+
+import collections
+import threading
+import time
+
+from PythonMcu.Midi.MidiBackend import MidiBackend, MidiInputPort, MidiOutputPort
+
+
+class LoopbackMidiInputPort(MidiInputPort):
+    __module__ = __name__
+    __doc__ = 'Reading end of an in-process MIDI cable'
+
+    def __init__(self, events, input_event):
+        self._events = events
+        self.input_event = input_event
+
+    def poll(self):
+        return bool(self._events)
+
+    def read(self, max_events):
+        events = []
+        pop_event = self._events.popleft
+
+        while self._events and len(events) < max_events:
+            events.append(pop_event())
+
+        return events
+
+    def close(self):
+        pass
+
+
+class LoopbackMidiOutputPort(MidiOutputPort):
+    __module__ = __name__
+    __doc__ = 'Writing end of an in-process MIDI cable'
+
+    def __init__(self, events, input_event):
+        self._events = events
+        self._input_event = input_event
+
+    def write_short(self, status, data_1, data_2):
+        self._events.append(((status, data_1, data_2), time.perf_counter()))
+        self._input_event.set()
+
+    def write(self, messages):
+        timestamp = time.perf_counter()
+        self._events.extend((message, timestamp) for message in messages)
+        self._input_event.set()
+
+    def write_sysex(self, sysex):
+        self._events.append((bytes(sysex), time.perf_counter()))
+        self._input_event.set()
+
+    def close(self):
+        pass
+
+
+class LoopbackMidiBackend(MidiBackend):
+    __module__ = __name__
+    __doc__ = 'MIDI backend with in-process MIDI cables (for testing and benchmarking)'
+
+    NAME = 'loopback'
+
+    DEFAULT_CABLES = ('Loopback 1', 'Loopback 2')
+
+    def __init__(self):
+        # every cable appears as one MIDI input and one MIDI output
+        # of the same name; messages sent to the output can be read
+        # from the input; (events, input_event) tuples
+        self._cable_names = []
+        self._cables = []
+
+        for cable_name in self.DEFAULT_CABLES:
+            self.add_cable(cable_name)
+
+    def get_version(self):
+        return 'loopback'
+
+    def add_cable(self, cable_name):
+        if cable_name not in self._cable_names:
+            self._cable_names.append(cable_name)
+            self._cables.append((collections.deque(), threading.Event()))
+
+        return self._cable_names.index(cable_name)
+
+    # --- enumeration ---
+    def get_devices(self):
+        devices = []
+
+        for (device_id, cable_name) in enumerate(self._cable_names):
+            devices.append((device_id, cable_name, True, True))
+
+        return devices
+
+    def get_device_count(self):
+        return len(self._cable_names)
+
+    def get_device(self, device_id):
+        if not 0 <= device_id < len(self._cable_names):
+            return None
+
+        return (self._cable_names[device_id], True, True)
+
+    def get_default_input_id(self):
+        return 0
+
+    def get_default_output_id(self):
+        return 0
+
+    # --- MIDI ports ---
+    def open_input(self, device_id):
+        return LoopbackMidiInputPort(*self._cables[device_id])
+
+    def open_output(self, device_id):
+        return LoopbackMidiOutputPort(*self._cables[device_id])
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+"""
+PythonMcu
+=========
+Mackie Host Controller written in Python
+Copyright (c) 2011 Martin Zuther (http://www.mzuther.de/)
+Copyright (c) 2021 Raphaël Doursenaud <rdoursenaud@free.fr>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Thank you for using free software!
+
+"""
+
+import abc
+
+
+class MidiInputPort(abc.ABC):
+    __module__ = __name__
+    __doc__ = 'Interface of MIDI input ports opened by a MIDI backend'
+
+    # convert timestamps returned by "read()" to seconds of
+    # "time.perf_counter()": scale * timestamp + offset
+    timestamp_scale = 1.0
+    timestamp_offset = 0.0
+
+    # "threading.Event" that is set whenever MIDI input arrives (for
+    # backends that are called back on MIDI input); ports without an
+    # input event (such as PortMidi's) are polled instead
+    input_event = None
+
+    @abc.abstractmethod
+    def poll(self):
+        """
+        return whether MIDI input is pending
+        """
+
+    @abc.abstractmethod
+    def read(self, max_events):
+        """
+        return a list of up to "max_events" (data, timestamp) tuples
+        (timestamp in units of the port, see "timestamp_scale")
+
+        data holds either a complete MIDI message or (like PortMidi
+        events) four bytes of which SysEx messages may span several
+        """
+
+    @abc.abstractmethod
+    def close(self):
+        pass
+
+
+class MidiOutputPort(abc.ABC):
+    __module__ = __name__
+    __doc__ = 'Interface of MIDI output ports opened by a MIDI backend'
+
+    @abc.abstractmethod
+    def write_short(self, status, data_1, data_2):
+        pass
+
+    @abc.abstractmethod
+    def write(self, messages):
+        """
+        send a list of (status, data_1, data_2) tuples at once
+        """
+
+    @abc.abstractmethod
+    def write_sysex(self, sysex):
+        """
+        send a complete SysEx message (including 0xF0 and 0xF7)
+        """
+
+    @abc.abstractmethod
+    def close(self):
+        pass
+
+
+class MidiBackend(abc.ABC):
+    __module__ = __name__
+    __doc__ = 'Interface of MIDI backends'
+
+    NAME = None
+
+    @abc.abstractmethod
+    def get_version(self):
+        pass
+
+    def shutdown(self):
+        pass
+
+    # --- enumeration ---
+    @abc.abstractmethod
+    def get_devices(self):
+        """
+        return a list of (device_id, device_name, is_input, is_output)
+        tuples
+        """
+
+    def refresh_devices(self):
+        """
+        make devices visible that have been plugged in or removed since
+        the backend has been initialised (only called while no MIDI
+        ports are open)
+        """
+
+    def get_device_count(self):
+        """
+        return the number of devices (used for detecting hot-plugged
+        devices, so backends should implement this cheaply)
+        """
+        return len(self.get_devices())
+
+    def get_device(self, device_id):
+        """
+        return (device_name, is_input, is_output) of a single device or
+        "None" if it does not exist
+        """
+        for (current_id, device_name, is_input, is_output) in self.get_devices():
+            if current_id == device_id:
+                return (device_name, is_input, is_output)
+
+        return None
+
+    def get_default_input_id(self):
+        return None
+
+    def get_default_output_id(self):
+        return None
+
+    # --- MIDI ports ---
+    @abc.abstractmethod
+    def open_input(self, device_id):
+        pass
+
+    @abc.abstractmethod
+    def open_output(self, device_id):
+        pass
@@ -24,9 +24,15 @@ Thank you for using free software!
 
 """
 
-import pygame.midi
+import contextlib
+import itertools
+import threading
 
-pygame.midi.init()
+from PythonMcu.Midi.LoopbackMidiBackend import LoopbackMidiBackend
+from PythonMcu.Midi.MidiDeviceRegistry import MidiDeviceRegistry
+from PythonMcu.Midi.MidiParser import MidiParser
+from PythonMcu.Midi.PygameMidiBackend import PygameMidiBackend
+from PythonMcu.Midi.RtMidiBackend import RtMidiBackend
 
 
 class MidiConnection:
@@ -42,18 +48,61 @@ class MidiConnection:
     PITCH_WHEEL_CHANGE = 0xE0
     SYSTEM_MESSAGE = 0xF0
 
+    # maximum number of PortMidi events drained by a single "read()"
+    DEFAULT_READ_BATCH_SIZE = 64
+
+    DEFAULT_BACKEND = PygameMidiBackend.NAME
+
+    _BACKEND_CLASSES = {
+        PygameMidiBackend.NAME: PygameMidiBackend,
+        RtMidiBackend.NAME: RtMidiBackend,
+        LoopbackMidiBackend.NAME: LoopbackMidiBackend
+    }
+
+    # MIDI backend shared by all MIDI connections; it is initialised
+    # on first use, so that importing this module stays cheap
+    _backend_name = DEFAULT_BACKEND
+    _backend = None
+    _device_registry = None
+    _backend_lock = threading.Lock()
+
+    # PortMidi can only look for new devices while no ports are open
+    _open_ports = 0
+
+    # arrival timestamp of the MIDI message that is currently being
+    # processed by a thread (see "get_event_timestamp()")
+    _event_context = threading.local()
+
     # --- initialisation ---
 
     def __init__(self, callback_log, callback):
         self._callback_log = callback_log
         self._callback = callback
 
+        self._read_batch_size = self.DEFAULT_READ_BATCH_SIZE
+
+        # SysEx messages may span several batches
+        self._parser = MidiParser()
+
         self._midi_input_name = None
         self._midi_output_name = None
 
         self._midi_input = None
         self._midi_output = None
 
+        # optional output stage: messages are queued and sent by
+        # "flush_output()"; channel messages with equal keys are
+        # coalesced so that only their latest value is sent
+        self._coalesce_output = False
+        self._output_queue = {}
+        self._output_lock = threading.Lock()
+        self._output_sequence = itertools.count()
+
+        # messages sent within a burst are collected in a buffer of
+        # the sending thread and sent in one go when the (outermost)
+        # burst ends; other threads keep sending (or queueing) as usual
+        self._burst_context = threading.local()
+
     def connect(self, midi_input_name=None, midi_output_name=None):
         self._midi_input_name = midi_input_name
         if self._midi_input_name:
@@ -64,13 +113,19 @@ class MidiConnection:
             self._midi_output = self._init_output(self._midi_output_name)
 
     def disconnect(self):
+        self.flush_output()
+
         if self._midi_input:
             self._log('Closing MIDI input "%s"...' % self._midi_input_name)
             self._midi_input.close()
+            self._midi_input = None
+            self._port_closed()
 
         if self._midi_output:
             self._log('Closing MIDI output "%s"...' % self._midi_output_name)
             self._midi_output.close()
+            self._midi_output = None
+            self._port_closed()
 
     def _log(self, message):
         self._callback_log('[MIDI Connection      ]  ' + message, True)
@@ -79,78 +134,174 @@ class MidiConnection:
         if device_name is None:
             return None
 
-        for device_id in range(pygame.midi.get_count()):
-            device = pygame.midi.get_device_info(device_id)
+        self._log('Opening MIDI input "%s"...' % device_name)
+        midi_input = self._open_port(device_name, 'In', self._open_input)
 
-            # noinspection PyUnresolvedReferences
-            if device[1].decode('utf-8') == device_name and (device[2] == 1):
-                self._log('Opening MIDI input "%s"...' % device_name)
-                return pygame.midi.Input(device_id)
+        if midi_input is None:
+            self._log('MIDI In \'%s\' not found.\n' % device_name)
 
-        self._log('MIDI In \'%s\' not found.\n' % device_name)
-        return None
+        return midi_input
 
     def _init_output(self, device_name):
         if device_name is None:
             return None
 
-        for device_id in range(pygame.midi.get_count()):
-            device = pygame.midi.get_device_info(device_id)
+        self._log('Opening MIDI output "%s"...' % device_name)
+        midi_output = self._open_port(device_name, 'Out', self._open_output)
+
+        if midi_output is None:
+            self._log('MIDI Out \'%s\' not found.\n' % device_name)
+
+        return midi_output
+
+    def _open_port(self, device_name, direction, open_function):
+        """
+        open MIDI port; devices may have been plugged in, removed or
+        replaced since they were last scanned, so rescan and try again
+        if the device cannot be found or opened
+        """
+        try:
+            port = open_function(device_name)
+            if port is not None:
+                return port
+        except Exception as e:
+            self._log('Could not open MIDI %s \'%s\' (%s).' % (direction, device_name, e))
+
+        if not self.rescan_devices():
+            return None
+
+        try:
+            return open_function(device_name)
+        except Exception as e:
+            self._log('Could not open MIDI %s \'%s\' (%s).' % (direction, device_name, e))
+            return None
+
+    def _open_input(self, device_name):
+        device_registry = self.get_device_registry()
+        device_id = device_registry.find_input(device_name)
+
+        if device_id is None:
+            return None
+
+        midi_input = self.get_backend().open_input(device_id)
+        self._port_opened()
+        device_registry.remember_input(device_name, device_id)
 
-            # noinspection PyUnresolvedReferences
-            if device[1].decode('utf-8') == device_name and (device[3] == 1):
-                self._log('Opening MIDI output "%s"...' % device_name)
-                return pygame.midi.Output(device_id, latency=0)
+        return midi_input
 
-        self._log('MIDI Out \'%s\' not found.\n' % device_name)
-        return None
+    def _open_output(self, device_name):
+        device_registry = self.get_device_registry()
+        device_id = device_registry.find_output(device_name)
+
+        if device_id is None:
+            return None
+
+        midi_output = self.get_backend().open_output(device_id)
+        self._port_opened()
+        device_registry.remember_output(device_name, device_id)
+
+        return midi_output
+
+    @staticmethod
+    def _port_opened():
+        with MidiConnection._backend_lock:
+            MidiConnection._open_ports += 1
+
+    @staticmethod
+    def _port_closed():
+        with MidiConnection._backend_lock:
+            MidiConnection._open_ports = max(0, MidiConnection._open_ports - 1)
 
     # --- static methods ---
     @staticmethod
-    def get_midi_inputs():
-        midi_inputs = []
+    def get_backend_names():
+        return sorted(MidiConnection._BACKEND_CLASSES.keys())
+
+    @staticmethod
+    def set_backend(backend_name):
+        if backend_name not in MidiConnection._BACKEND_CLASSES:
+            raise KeyError('Unknown MIDI backend "%s".' % backend_name)
 
-        for dev_id in range(pygame.midi.get_count()):
-            device = pygame.midi.get_device_info(dev_id)
-            if device[2] == 1:
-                # noinspection PyUnresolvedReferences
-                midi_inputs.append(device[1].decode('utf8'))
+        with MidiConnection._backend_lock:
+            if backend_name == MidiConnection._backend_name:
+                return
 
-        return midi_inputs
+            MidiConnection._backend_name = backend_name
+
+        # the new backend is initialised on first use
+        MidiConnection.shutdown()
 
     @staticmethod
-    def get_midi_outputs():
-        midi_outputs = []
+    def get_backend():
+        with MidiConnection._backend_lock:
+            if not MidiConnection._backend:
+                backend_class = MidiConnection._BACKEND_CLASSES[MidiConnection._backend_name]
 
-        for dev_id in range(pygame.midi.get_count()):
-            device = pygame.midi.get_device_info(dev_id)
-            if device[3] == 1:
-                # noinspection PyUnresolvedReferences
-                midi_outputs.append(device[1].decode('utf8'))
+                MidiConnection._backend = backend_class()
+                MidiConnection._device_registry = MidiDeviceRegistry(MidiConnection._backend)
 
-        return midi_outputs
+            return MidiConnection._backend
 
     @staticmethod
-    def get_default_midi_input():
-        device_id = pygame.midi.get_default_input_id()
+    def get_device_registry():
+        MidiConnection.get_backend()
+        return MidiConnection._device_registry
 
-        if device_id < 0:
-            return None
+    @staticmethod
+    def shutdown():
+        """
+        shut down the MIDI backend (it will be initialised again when
+        needed); all MIDI connections must be closed beforehand
+        """
+        with MidiConnection._backend_lock:
+            if MidiConnection._backend:
+                MidiConnection._backend.shutdown()
+
+            MidiConnection._backend = None
+            MidiConnection._device_registry = None
 
-        device = pygame.midi.get_device_info(device_id)
-        return device[1]
+    @staticmethod
+    def rescan_devices():
+        """
+        look for devices that have been plugged in, removed or replaced;
+        returns True if the list of devices has changed
+        """
+        backend = MidiConnection.get_backend()
+
+        with MidiConnection._backend_lock:
+            # re-initialising PortMidi would invalidate open ports
+            if MidiConnection._open_ports == 0:
+                backend.refresh_devices()
+
+        return MidiConnection.get_device_registry().rescan()
 
     @staticmethod
-    def get_default_midi_output():
-        device_id = pygame.midi.get_default_output_id()
+    def get_midi_inputs():
+        return MidiConnection.get_device_registry().get_input_names()
 
-        if device_id < 0:
-            return None
+    @staticmethod
+    def get_midi_outputs():
+        return MidiConnection.get_device_registry().get_output_names()
+
+    @staticmethod
+    def _get_device_name(device_id):
+        return MidiConnection.get_device_registry().get_device_name(device_id)
 
-        device = pygame.midi.get_device_info(device_id)
-        return device[1]
+    @staticmethod
+    def get_default_midi_input():
+        return MidiConnection._get_device_name(MidiConnection.get_backend().get_default_input_id())
+
+    @staticmethod
+    def get_default_midi_output():
+        return MidiConnection._get_device_name(MidiConnection.get_backend().get_default_output_id())
 
     # --- MIDI processing ---
+    def set_read_batch_size(self, batch_size):
+        self._read_batch_size = max(1, int(batch_size))
+
+    def get_read_batch_size(self):
+        return self._read_batch_size
+
     def buffer_is_empty(self):
         return not self._midi_input.poll()
 
@@ -160,54 +311,212 @@ class MidiConnection:
             return
 
         while self._midi_input.poll():
-            (status, message) = self._receive_message()
+            messages = self._receive_messages()
 
             if use_callback:
-                self._callback(status, message)
-
-    def _receive_message(self):
-        message = self._midi_input.read(1)[0][0]
-        status_byte = message[0] & 0xF0
-
-        if message[0] == 0xF0:
-            while 0xF7 not in message:
-                message.extend(self._midi_input.read(1)[0][0])
-            while message[-1] != 0xF7:
-                del message[-1]
-
-        status = None
-        if status_byte == self.NOTE_OFF_EVENT:
-            status = self.NOTE_OFF_EVENT
-            del message[3]
-        elif status_byte == self.NOTE_ON_EVENT:
-            status = self.NOTE_ON_EVENT
-            del message[3]
-        elif status_byte == self.POLYPHONIC_KEY_PRESSURE:
-            status = self.POLYPHONIC_KEY_PRESSURE
-            del message[3]
-        elif status_byte == self.CONTROL_CHANGE:
-            status = self.CONTROL_CHANGE
-            del message[3]
-        elif status_byte == self.PROGRAM_CHANGE:
-            status = self.PROGRAM_CHANGE
-            del message[2:3]
-        elif status_byte == self.CHANNEL_PRESSURE:
-            status = self.CHANNEL_PRESSURE
-            del message[2:3]
-        elif status_byte == self.PITCH_WHEEL_CHANGE:
-            status = self.PITCH_WHEEL_CHANGE
-            del message[3]
-        elif status_byte == self.SYSTEM_MESSAGE:
-            status = self.SYSTEM_MESSAGE
-
-        return status, message
+                self.dispatch_messages(messages)
+
+    def read_input_buffer(self):
+        """
+        read and decode pending MIDI input without calling back
+
+        used by reader threads; the returned messages are handed to
+        "dispatch_messages()" later on
+        """
+        if not self._midi_input or not self._midi_input.poll():
+            return []
+
+        return self._receive_messages()
+
+    def get_input_event(self):
+        """
+        return the "threading.Event" that is set on MIDI input or "None"
+        if the MIDI input has to be polled
+        """
+        if not self._midi_input:
+            return None
+
+        return self._midi_input.input_event
+
+    def dispatch_messages(self, messages):
+        event_context = self._event_context
+
+        try:
+            for (status, message, timestamp) in messages:
+                event_context.timestamp = timestamp
+                self._callback(status, message, timestamp)
+        finally:
+            event_context.timestamp = None
+
+    @staticmethod
+    def get_event_timestamp():
+        """
+        return the arrival time (in seconds of "time.perf_counter()") of
+        the MIDI message that is being processed by the current thread,
+        so that anything sent in response can be related to it; returns
+        "None" outside of MIDI callbacks
+        """
+        return getattr(MidiConnection._event_context, 'timestamp', None)
+
+    def _receive_messages(self):
+        """
+        drain up to "read batch size" events from the MIDI input and
+        decode them in one pass
+        """
+        midi_input = self._midi_input
+
+        messages = []
+        self._parser.parse(midi_input.read(self._read_batch_size), messages,
+                           midi_input.timestamp_scale, midi_input.timestamp_offset)
+
+        return messages
+
+    def set_output_coalescing(self, enabled):
+        if not enabled:
+            self.flush_output()
+
+        self._coalesce_output = enabled
+
+    def is_output_coalescing(self):
+        return self._coalesce_output
+
+    @contextlib.contextmanager
+    def burst(self):
+        """
+        context manager that collects all messages sent within and
+        submits them using as few backend calls as possible
+
+        with midi_connection.burst():
+            midi_connection.send_control_change(0, 0x10, 0x7F)
+            ...
+        """
+        burst_context = self._burst_context
+
+        if self._get_burst_messages() is None:
+            burst_context.messages = {}
+            burst_context.depth = 0
+
+        burst_context.depth += 1
+
+        try:
+            yield
+        finally:
+            burst_context.depth -= 1
+
+            if not burst_context.depth:
+                messages = burst_context.messages
+                burst_context.messages = None
+
+                self._end_burst(messages)
+
+    def _get_burst_messages(self):
+        """
+        return the burst buffer of the calling thread ("None" outside
+        of bursts)
+        """
+        return getattr(self._burst_context, 'messages', None)
+
+    def _end_burst(self, messages):
+        if not messages:
+            return
+
+        if self._coalesce_output:
+            # queued messages have been superseded by the burst
+            with self._output_lock:
+                for key in messages:
+                    self._output_queue.pop(key, None)
+
+        self._write_messages(list(messages.values()))
+
+    def flush_output(self):
+        with self._output_lock:
+            if not self._output_queue:
+                return
+
+            messages = list(self._output_queue.values())
+            self._output_queue.clear()
+
+        self._write_messages(messages)
+
+    def send_bulk(self, messages):
+        """
+        send a list of short messages -- (status, data_1, data_2)
+        tuples -- and complete SysEx messages in order
+        """
+        if not self._midi_output:
+            self._log('MIDI output not connected.')
+            return
+
+        burst_messages = self._get_burst_messages()
+
+        if burst_messages is not None:
+            for message in messages:
+                burst_messages[next(self._output_sequence)] = message
+        elif self._coalesce_output:
+            with self._output_lock:
+                for message in messages:
+                    self._output_queue[next(self._output_sequence)] = message
+        else:
+            self._write_messages(messages)
+
+    def _write_messages(self, messages):
+        if not self._midi_output:
+            return
+
+        # submit consecutive short messages in one call
+        short_messages = []
+
+        for message in messages:
+            if message[0] == self.SYSTEM_MESSAGE:
+                if short_messages:
+                    self._midi_output.write(short_messages)
+                    short_messages = []
+
+                self._midi_output.write_sysex(message)
+            else:
+                short_messages.append(message)
+
+        if short_messages:
+            self._midi_output.write(short_messages)
+
+    def _write_short(self, key, status, data_1, data_2):
+        """
+        key: messages with equal keys are coalesced when output
+        coalescing is enabled; "None" makes sure that a message is
+        sent (in order)
+        """
+        burst_messages = self._get_burst_messages()
+
+        if burst_messages is None and not self._coalesce_output:
+            self._midi_output.write_short(status, data_1, data_2)
+            return
+
+        if key is None or not self._coalesce_output:
+            key = next(self._output_sequence)
+
+        if burst_messages is not None:
+            burst_messages[key] = (status, data_1, data_2)
+        else:
+            with self._output_lock:
+                self._output_queue[key] = (status, data_1, data_2)
+
+    def _write_sysex(self, sysex):
+        burst_messages = self._get_burst_messages()
+
+        if burst_messages is not None:
+            burst_messages[next(self._output_sequence)] = sysex
+        elif self._coalesce_output:
+            with self._output_lock:
+                self._output_queue[next(self._output_sequence)] = sysex
+        else:
+            self._midi_output.write_sysex(sysex)
 
     def send(self, status, data_1, data_2):
         if not self._midi_output:
             self._log('MIDI output not connected.')
             return
 
-        self._midi_output.write_short(status, data_1, data_2)
+        self._write_short(None, status, data_1, data_2)
 
     def send_note_on(self, key, velocity):
         if not self._midi_output:
@@ -215,7 +524,7 @@ class MidiConnection:
             return
 
         #        self._log('%02X %02X %02X' % (self.NOTE_ON_EVENT, key, velocity))
-        self._midi_output.write_short(self.NOTE_ON_EVENT, key, velocity)
+        self._write_short(None, self.NOTE_ON_EVENT, key, velocity)
 
     def send_note_off(self, key, velocity):
         if not self._midi_output:
@@ -223,7 +532,7 @@ class MidiConnection:
             return
 
         #        self._log('%02X %02X %02X' % (self.NOTE_OFF_EVENT, key, velocity))
-        self._midi_output.write_short(self.NOTE_OFF_EVENT, key, velocity)
+        self._write_short(None, self.NOTE_OFF_EVENT, key, velocity)
 
     def send_control_change(self, channel, cc_number, cc_value):
         if not self._midi_output:
@@ -231,7 +540,8 @@ class MidiConnection:
             return
 
         #         self._log('%02X %02X %02X' % (self.CONTROL_CHANGE + channel, cc_number, cc_value))
-        self._midi_output.write_short(self.CONTROL_CHANGE + channel, cc_number, cc_value)
+        status = self.CONTROL_CHANGE + channel
+        self._write_short((status, cc_number), status, cc_number, cc_value)
 
     def send_pitch_wheel_change(self, channel, pitch):
         if not self._midi_output:
@@ -241,7 +551,10 @@ class MidiConnection:
         pitch_high = pitch >> 7
         pitch_low = pitch & 0x7F
         #         self._log('%02X %02X %02X' % (self.PITCH_WHEEL_CHANGE + channel, pitch_low, pitch_high))
-        self._midi_output.write_short(self.PITCH_WHEEL_CHANGE + channel, pitch_low, pitch_high)
+        # the first data byte holds the pitch's LSB, so pitch wheel
+        # changes are coalesced per channel only
+        status = self.PITCH_WHEEL_CHANGE + channel
+        self._write_short((status, None), status, pitch_low, pitch_high)
 
     def send_pitch_wheel_change_7bit(self, channel, pitch):
         if not self._midi_output:
@@ -249,7 +562,8 @@ class MidiConnection:
             return
 
         #         self._log('%02X %02X %02X' % (self.PITCH_WHEEL_CHANGE + channel, pitch, pitch))
-        self._midi_output.write_short(self.PITCH_WHEEL_CHANGE + channel, pitch, pitch)
+        status = self.PITCH_WHEEL_CHANGE + channel
+        self._write_short((status, None), status, pitch, pitch)
 
     def send_sysex(self, header, data):
         if not self._midi_output:
@@ -264,7 +578,7 @@ class MidiConnection:
         sysex.extend(data)
         sysex.append(0xF7)
 
-        self._midi_output.write_sys_ex(0, sysex)
+        self._write_sysex(sysex)
 
 
 if __name__ == "__main__":
@@ -273,7 +587,7 @@ if __name__ == "__main__":
     def log_callback(message):
         print(message)
 
-    def midi_in_callback(status_byte, message):
+    def midi_in_callback(status_byte, message, _timestamp):
         print('status %02X: ' % status_byte, )
         for byte in message:
             print('%02X' % byte, )
@@ -297,3 +611,4 @@ if __name__ == "__main__":
         pass
 
     midi_connection.disconnect()
+    MidiConnection.shutdown()
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+"""
+PythonMcu
+=========
+Mackie Host Controller written in Python
+Copyright (c) 2011 Martin Zuther (http://www.mzuther.de/)
+Copyright (c) 2021 Raphaël Doursenaud <rdoursenaud@free.fr>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Thank you for using free software!
+
+"""
+
+
+
+class MidiDeviceRegistry:
+    __module__ = __name__
+    __doc__ = 'Cached lookup of the MIDI devices of a MIDI backend'
+
+    def __init__(self, backend):
+        self._backend = backend
+
+        # device name --> device ID
+        self._input_ids = {}
+        self._output_ids = {}
+        self._device_names = {}
+
+        # devices found by the last scan ("None" if the devices have
+        # not been scanned yet)
+        self._devices = None
+
+        # IDs of MIDI ports that have been opened successfully; these
+        # survive rescans and may be restored after a restart
+        self._last_good_input_ids = {}
+        self._last_good_output_ids = {}
+
+    # --- scanning ---
+    def rescan(self):
+        """
+        scan all devices; returns "True" if devices have been added,
+        removed or replaced since the last scan
+        """
+        devices = tuple(self._backend.get_devices())
+
+        # compare names as well, so that swapped devices are noticed
+        if devices == self._devices:
+            return False
+
+        # clear in place, as lookups may hold references to these
+        self._input_ids.clear()
+        self._output_ids.clear()
+        self._device_names.clear()
+
+        for (device_id, device_name, is_input, is_output) in devices:
+            self._device_names[device_id] = device_name
+
+            # in case of duplicate names, the first device wins
+            if is_input:
+                self._input_ids.setdefault(device_name, device_id)
+            if is_output:
+                self._output_ids.setdefault(device_name, device_id)
+
+        self._devices = devices
+        return True
+
+    def refresh(self):
+        """
+        rescan devices if they have not been scanned yet or the number
+        of devices has changed; this check is cheap, but misses swapped
+        devices (call "rescan()" when in doubt)
+        """
+        if self._devices is None or self._backend.get_device_count() != len(self._devices):
+            self.rescan()
+
+    # --- lookup ---
+    def get_input_names(self):
+        self.refresh()
+        return list(self._input_ids)
+
+    def get_output_names(self):
+        self.refresh()
+        return list(self._output_ids)
+
+    def get_device_name(self, device_id):
+        if device_id is None:
+            return None
+
+        self.refresh()
+        return self._device_names.get(device_id)
+
+    def find_input(self, device_name):
+        return self._find_device(device_name, self._input_ids, self._last_good_input_ids, True)
+
+    def find_output(self, device_name):
+        return self._find_device(device_name, self._output_ids, self._last_good_output_ids, False)
+
+    def _find_device(self, device_name, device_ids, last_good_ids, is_input):
+        if device_name in device_ids:
+            return device_ids[device_name]
+
+        # try last known device ID before scanning all devices
+        if self._devices is None and device_name in last_good_ids:
+            device_id = last_good_ids[device_name]
+            device = self._backend.get_device(device_id)
+
+            if device and device[0] == device_name and device[1 if is_input else 2]:
+                device_ids[device_name] = device_id
+                return device_id
+
+        self.refresh()
+        return device_ids.get(device_name)
+
+    # --- last good device IDs ---
+    def remember_input(self, device_name, device_id):
+        self._last_good_input_ids[device_name] = device_id
+
+    def remember_output(self, device_name, device_id):
+        self._last_good_output_ids[device_name] = device_id
+
+    def get_last_good_input_id(self, device_name):
+        return self._last_good_input_ids.get(device_name)
+
+    def get_last_good_output_id(self, device_name):
+        return self._last_good_output_ids.get(device_name)
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+
+"""
+PythonMcu
+=========
+Mackie Host Controller written in Python
+Copyright (c) 2011 Martin Zuther (http://www.mzuther.de/)
+Copyright (c) 2021 Raphaël Doursenaud <rdoursenaud@free.fr>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Thank you for using free software!
+
+"""
+
+import queue
+import threading
+import time
+import traceback
+
+
+class MidiIoEngine:
+    __module__ = __name__
+    __doc__ = 'MIDI I/O engine running one reader thread per MIDI connection'
+
+    # time in seconds a reader thread waits for the input event of its
+    # MIDI connection before checking whether it should stop
+    INPUT_EVENT_TIMEOUT = 0.1
+
+    # --- initialisation ---
+
+    def __init__(self, callback_log, poll_interval=0.001):
+        """
+        poll_interval: time in seconds a reader thread sleeps when its
+        MIDI input buffer is empty
+
+        reader threads of MIDI inputs that call back on MIDI input (such
+        as RtMidi's) wait for the input event instead; inputs without an
+        input event (such as PortMidi's) are polled every
+        "poll_interval" seconds
+        """
+        self._callback_log = callback_log
+        self._poll_interval = poll_interval
+
+        self._midi_connections = []
+        self._reader_threads = []
+        self._dispatch_thread = None
+
+        # decoded MIDI messages are handed from the reader threads to
+        # the dispatch thread, so that all callbacks are executed on a
+        # single thread
+        self._queue = queue.Queue()
+        self._running = False
+
+        # timers are run on the dispatch thread as well:
+        # [interval, callback, next_time]
+        self._timers = []
+
+    def _log(self, message, repaint=False):
+        self._callback_log('[MIDI I/O Engine      ]  ' + message, repaint)
+
+    def add_connection(self, midi_connection):
+        assert not self._running
+
+        self._midi_connections.append(midi_connection)
+
+    def add_timer(self, interval, callback):
+        """
+        call "callback(now)" every "interval" seconds on the dispatch
+        thread ("now" is taken from "time.perf_counter()")
+        """
+        self._timers.append([interval, callback, time.perf_counter() + interval])
+
+    def start(self):
+        if self._running:
+            return
+
+        self._log('Starting MIDI threads...')
+        self._running = True
+
+        self._dispatch_thread = threading.Thread(
+            target=self._dispatch_loop, name='MIDI dispatch', daemon=True)
+        self._dispatch_thread.start()
+
+        for midi_connection in self._midi_connections:
+            reader_thread = threading.Thread(
+                target=self._read_loop, args=(midi_connection,),
+                name='MIDI reader', daemon=True)
+            reader_thread.start()
+
+            self._reader_threads.append(reader_thread)
+
+    def stop(self):
+        if not self._running:
+            return
+
+        self._log('Stopping MIDI threads...')
+        self._running = False
+
+        # wake up reader threads that are waiting for MIDI input
+        for midi_connection in self._midi_connections:
+            input_event = midi_connection.get_input_event()
+
+            if input_event:
+                input_event.set()
+
+        for reader_thread in self._reader_threads:
+            reader_thread.join()
+        self._reader_threads = []
+
+        # dispatch all pending messages before stopping
+        self._queue.put(None)
+        self._dispatch_thread.join()
+        self._dispatch_thread = None
+
+    def is_running(self):
+        return self._running
+
+    # --- threads ---
+    def _read_loop(self, midi_connection):
+        while self._running:
+            input_event = midi_connection.get_input_event()
+
+            # clear the event before reading, so that input arriving
+            # after the read is not missed
+            if input_event:
+                input_event.clear()
+
+            messages = midi_connection.read_input_buffer()
+
+            if messages:
+                self._queue.put((midi_connection, messages))
+            elif input_event:
+                input_event.wait(self.INPUT_EVENT_TIMEOUT)
+            else:
+                time.sleep(self._poll_interval)
+
+    def _run_timers(self):
+        """
+        run all timers that are due and return the time in seconds
+        until the next timer is due (or "None" if there are no timers)
+        """
+        if not self._timers:
+            return None
+
+        now = time.perf_counter()
+        next_time = None
+
+        for timer in self._timers:
+            (interval, callback, timer_time) = timer
+
+            if now >= timer_time:
+                try:
+                    callback(now)
+                except Exception:  # pylint: disable=broad-except
+                    self._log(traceback.format_exc().strip())
+
+                timer_time += interval
+
+                # skip ticks that have been missed
+                if timer_time <= now:
+                    timer_time = now + interval
+
+                timer[2] = timer_time
+
+            if next_time is None or timer_time < next_time:
+                next_time = timer_time
+
+        return max(next_time - now, 0.0)
+
+    def _dispatch_loop(self):
+        while True:
+            try:
+                item = self._queue.get(timeout=self._run_timers())
+            except queue.Empty:
+                continue
+
+            if item is None:
+                return
+
+            (midi_connection, messages) = item
+
+            # never let a single faulty message stop MIDI processing
+            try:
+                midi_connection.dispatch_messages(messages)
+            except Exception:  # pylint: disable=broad-except
+                self._log(traceback.format_exc().strip())
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+"""
+PythonMcu
+=========
+Mackie Host Controller written in Python
+Copyright (c) 2011 Martin Zuther (http://www.mzuther.de/)
+Copyright (c) 2021 Raphaël Doursenaud <rdoursenaud@free.fr>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Thank you for using free software!
+
+"""
+
+
+import sys
+import time
+
+if __name__ == "__main__":
+    # allow "PythonMcu" package imports when executing this module
+    sys.path.append('../../')
+
+from PythonMcu.Midi.MidiConnection import MidiConnection
+from PythonMcu.Tools.LatencyHistogram import LatencyHistogram
+
+
+class MidiLatencyMonitor:
+    __module__ = __name__
+    __doc__ = 'Latency statistics of MIDI messages passing through Python MCU'
+
+    # controller --> host: fader, vpot, key
+    # host --> controller: led, lcd
+    PATHS = ('fader', 'vpot', 'key', 'led', 'lcd')
+
+    REPORT_PERCENTILES = (50, 95, 99)
+
+    def __init__(self):
+        self._histograms = {}
+
+        for path in self.PATHS:
+            self._histograms[path] = LatencyHistogram()
+
+    def reset(self):
+        for histogram in self._histograms.values():
+            histogram.reset()
+
+    def record(self, path, timestamp=None):
+        """
+        record the time that has passed since the arrival of the MIDI
+        message that is currently being processed (or "timestamp" in
+        seconds of "time.perf_counter()")
+
+        When output coalescing is enabled, the time a message waits
+        for the next flush is not included.
+        """
+        if timestamp is None:
+            timestamp = MidiConnection.get_event_timestamp()
+
+            # not called from within a MIDI callback
+            if timestamp is None:
+                return
+
+        self._histograms[path].record(time.perf_counter() - timestamp)
+
+    def get_histogram(self, path):
+        return self._histograms[path]
+
+    def get_report(self):
+        """
+        return latency statistics (in milliseconds) as list of lines
+        """
+        header = 'Path       count'
+        for percentile in self.REPORT_PERCENTILES:
+            header += '     p%-3d' % percentile
+        header += '      max'
+
+        report = [header]
+
+        for path in self.PATHS:
+            histogram = self._histograms[path]
+            line = '%-5s  %9d' % (path, histogram.get_count())
+
+            if histogram.get_count():
+                for percentile in self.REPORT_PERCENTILES:
+                    line += '  %7.3f' % (histogram.get_percentile(percentile) * 1000.0)
+                line += '  %7.3f' % (histogram.get_maximum() * 1000.0)
+
+            report.append(line)
+
+        return report
+
+
+if __name__ == "__main__":
+    # measure the latency of the MIDI loopback backend
+    def midi_in_callback(_status, _message, _timestamp):
+        latency_monitor.record('fader')
+
+    MidiConnection.set_backend('loopback')
+
+    latency_monitor = MidiLatencyMonitor()
+
+    midi_connection = MidiConnection(lambda message, repaint=False: print(message), midi_in_callback)
+    midi_connection.connect('Loopback 1', 'Loopback 1')
+
+    for fader_position in range(10000):
+        midi_connection.send_pitch_wheel_change_7bit(0, fader_position & 0x7F)
+        midi_connection.process_input_buffer()
+
+    midi_connection.disconnect()
+    MidiConnection.shutdown()
+
+    print()
+    print('\n'.join(latency_monitor.get_report()))
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+"""
+PythonMcu
+=========
+Mackie Host Controller written in Python
+Copyright (c) 2011 Martin Zuther (http://www.mzuther.de/)
+Copyright (c) 2021 Raphaël Doursenaud <rdoursenaud@free.fr>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Thank you for using free software!
+
+"""
+
+
+def _get_message_lengths():
+    message_lengths = [0] * 0x80
+
+    for status_byte in range(0x80, 0x100):
+        if status_byte < 0xC0 or 0xE0 <= status_byte < 0xF0 or status_byte == 0xF2:
+            message_lengths.append(3)
+        elif status_byte < 0xE0 or status_byte in (0xF1, 0xF3):
+            message_lengths.append(2)
+        else:
+            message_lengths.append(1)
+
+    return tuple(message_lengths)
+
+
+class MidiParser:
+    __module__ = __name__
+    __doc__ = 'Incremental parser for MIDI events'
+
+    # initial size of SysEx buffer (grows on demand)
+    SYSEX_BUFFER_SIZE = 1024
+
+    # number of bytes of a MIDI message, indexed by status byte
+    _MESSAGE_LENGTHS = _get_message_lengths()
+
+    def __init__(self):
+        self._sysex_buffer = bytearray(self.SYSEX_BUFFER_SIZE)
+        self._sysex_length = 0
+        self._in_sysex = False
+
+        # status byte of the last channel message (running status)
+        self._running_status = None
+
+    def reset(self):
+        self._sysex_length = 0
+        self._in_sysex = False
+
+    def parse(self, events, messages, timestamp_scale=1.0, timestamp_offset=0.0):
+        """
+        parse MIDI events and append complete messages to "messages"
+        as (status, message, timestamp) tuples (message as "bytes")
+
+        events: list of (data, timestamp) as returned by the input
+        ports of MIDI backends
+
+        Timestamps are converted to seconds of "time.perf_counter()"
+        using "timestamp_scale" and "timestamp_offset".  SysEx messages
+        carry the timestamp of the event that completed them.
+
+        Every event holds a complete channel message (which may omit
+        its status byte, see "running status"), a real-time message or
+        a (partial) SysEx message.  PortMidi splits SysEx
+        messages into events of four bytes, so they may span several
+        events (and calls of this method) and may have real-time
+        messages interleaved.
+        """
+        for (data, timestamp) in events:
+            status_byte = data[0]
+            timestamp = timestamp * timestamp_scale + timestamp_offset
+
+            if self._in_sysex:
+                if status_byte < 0x80 or status_byte == 0xF7:
+                    self._parse_sysex_data(data, timestamp, messages)
+                    continue
+
+                # any other status byte except real-time messages
+                # aborts the current SysEx message
+                if status_byte < 0xF8:
+                    self.reset()
+
+            self._parse_message(data, timestamp, messages)
+
+    def _parse_message(self, data, timestamp, messages):
+        status_byte = data[0]
+
+        if status_byte == 0xF0:
+            self._running_status = None
+            self._in_sysex = True
+            self._sysex_length = 0
+            self._parse_sysex_data(data, timestamp, messages)
+        elif status_byte >= 0x80:
+            # real-time messages keep the running status
+            if status_byte < 0xF0:
+                self._running_status = status_byte
+            elif status_byte < 0xF8:
+                self._running_status = None
+
+            messages.append((status_byte & 0xF0, bytes(data[:self._MESSAGE_LENGTHS[status_byte]]), timestamp))
+        elif self._running_status:
+            # running status: the status byte of the last channel
+            # message has been omitted
+            running_status = self._running_status
+            message = bytes((running_status,)) + bytes(data[:self._MESSAGE_LENGTHS[running_status] - 1])
+
+            if max(message[1:]) < 0x80:
+                messages.append((running_status & 0xF0, message, timestamp))
+
+        # otherwise, ignore stray data bytes
+
+    def _parse_sysex_data(self, data, timestamp, messages):
+        sysex_buffer = self._sysex_buffer
+        sysex_length = self._sysex_length
+
+        for byte in data:
+            if byte >= 0xF8:
+                # real-time message embedded in SysEx data
+                messages.append((0xF0, bytes((byte,)), timestamp))
+                continue
+
+            if sysex_length == len(sysex_buffer):
+                sysex_buffer.extend(bytes(len(sysex_buffer)))
+
+            sysex_buffer[sysex_length] = byte
+            sysex_length += 1
+
+            if byte == 0xF7:
+                messages.append((0xF0, bytes(memoryview(sysex_buffer)[:sysex_length]), timestamp))
+                self.reset()
+                return
+
+        self._sysex_length = sysex_length
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+
+"""
+PythonMcu
+=========
+Mackie Host Controller written in Python
+Copyright (c) 2011 Martin Zuther (http://www.mzuther.de/)
+Copyright (c) 2021 Raphaël Doursenaud <rdoursenaud@free.fr>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Thank you for using free software!
+
+"""
+
+import time
+
+from PythonMcu.Midi.MidiBackend import MidiBackend, MidiInputPort, MidiOutputPort
+
+# pygame is imported when the backend is initialised, as importing it
+# is rather slow
+pygame = None
+
+
+def _import_pygame():
+    global pygame  # pylint: disable=global-statement,invalid-name
+
+    import pygame.midi  # pylint: disable=import-outside-toplevel,redefined-outer-name
+    import pygame.version  # pylint: disable=import-outside-toplevel
+
+
+class PygameMidiInputPort(MidiInputPort):
+    __module__ = __name__
+    __doc__ = 'MIDI input port using pygame (PortMidi)'
+
+    # PortMidi timestamps are given in milliseconds
+    timestamp_scale = 0.001
+
+    def __init__(self, device_id):
+        self._midi_input = pygame.midi.Input(device_id)
+
+        # offset between PortMidi's timer and "time.perf_counter()"
+        self.timestamp_offset = time.perf_counter() - pygame.midi.time() * self.timestamp_scale
+
+        # skip wrapping of time-critical methods
+        self.poll = self._midi_input.poll
+        self.read = self._midi_input.read
+
+    def poll(self):
+        return self._midi_input.poll()
+
+    def read(self, max_events):
+        return self._midi_input.read(max_events)
+
+    def close(self):
+        self._midi_input.close()
+
+
+class PygameMidiOutputPort(MidiOutputPort):
+    __module__ = __name__
+    __doc__ = 'MIDI output port using pygame (PortMidi)'
+
+    # PortMidi sends at most 1024 events per call
+    _MAX_EVENTS_PER_WRITE = 1024
+
+    def __init__(self, device_id):
+        self._midi_output = pygame.midi.Output(device_id, latency=0)
+
+        # skip wrapping of time-critical methods
+        self.write_short = self._midi_output.write_short
+
+    def write_short(self, status, data_1, data_2):
+        self._midi_output.write_short(status, data_1, data_2)
+
+    def write(self, messages):
+        events = [[list(message), 0] for message in messages]
+
+        for index in range(0, len(events), self._MAX_EVENTS_PER_WRITE):
+            self._midi_output.write(events[index:index + self._MAX_EVENTS_PER_WRITE])
+
+    def write_sysex(self, sysex):
+        self._midi_output.write_sys_ex(0, sysex)
+
+    def close(self):
+        self._midi_output.close()
+
+
+class PygameMidiBackend(MidiBackend):
+    __module__ = __name__
+    __doc__ = 'MIDI backend using pygame (PortMidi)'
+
+    NAME = 'pygame'
+
+    def __init__(self):
+        _import_pygame()
+        pygame.midi.init()
+
+    def get_version(self):
+        return 'pygame %s' % pygame.version.ver
+
+    def shutdown(self):
+        pygame.midi.quit()
+
+    # --- enumeration ---
+    def get_devices(self):
+        devices = []
+
+        for device_id in range(pygame.midi.get_count()):
+            device = pygame.midi.get_device_info(device_id)
+
+            # noinspection PyUnresolvedReferences
+            devices.append((device_id, device[1].decode('utf-8'), device[2] == 1, device[3] == 1))
+
+        return devices
+
+    def refresh_devices(self):
+        # PortMidi only scans devices on initialisation
+        pygame.midi.quit()
+        pygame.midi.init()
+
+    def get_device_count(self):
+        return pygame.midi.get_count()
+
+    def get_device(self, device_id):
+        if not 0 <= device_id < pygame.midi.get_count():
+            return None
+
+        device = pygame.midi.get_device_info(device_id)
+
+        # noinspection PyUnresolvedReferences
+        return (device[1].decode('utf-8'), device[2] == 1, device[3] == 1)
+
+    def get_default_input_id(self):
+        device_id = pygame.midi.get_default_input_id()
+
+        if device_id < 0:
+            return None
+
+        return device_id
+
+    def get_default_output_id(self):
+        device_id = pygame.midi.get_default_output_id()
+
+        if device_id < 0:
+            return None
+
+        return device_id
+
+    # --- MIDI ports ---
+    def open_input(self, device_id):
+        return PygameMidiInputPort(device_id)
+
+    def open_output(self, device_id):
+        return PygameMidiOutputPort(device_id)
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+
+"""
+PythonMcu
+=========
+Mackie Host Controller written in Python
+Copyright (c) 2011 Martin Zuther (http://www.mzuther.de/)
+Copyright (c) 2021 Raphaël Doursenaud <rdoursenaud@free.fr>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Thank you for using free software!
+
+"""
+
+
+import collections
+import threading
+import time
+
+from PythonMcu.Midi.MidiBackend import MidiBackend, MidiInputPort, MidiOutputPort
+
+# python-rtmidi is optional and imported when the backend is
+# initialised
+rtmidi = None
+
+
+def _import_rtmidi():
+    global rtmidi  # pylint: disable=global-statement,invalid-name
+
+    try:
+        import rtmidi  # pylint: disable=import-outside-toplevel,redefined-outer-name
+    except ImportError:
+        rtmidi = None
+
+
+class RtMidiInputPort(MidiInputPort):
+    __module__ = __name__
+    __doc__ = 'MIDI input port using python-rtmidi'
+
+    def __init__(self, port_number):
+        # incoming messages are queued by RtMidi's callback thread
+        self._events = collections.deque()
+        self.input_event = threading.Event()
+
+        self._midi_input = rtmidi.MidiIn()
+        self._midi_input.ignore_types(sysex=False)
+        self._midi_input.set_callback(self._on_midi_message)
+        self._midi_input.open_port(port_number)
+
+    def _on_midi_message(self, event, _data=None):
+        self._events.append((event[0], time.perf_counter()))
+        self.input_event.set()
+
+    def poll(self):
+        return bool(self._events)
+
+    def read(self, max_events):
+        events = []
+        pop_event = self._events.popleft
+
+        while self._events and len(events) < max_events:
+            events.append(pop_event())
+
+        return events
+
+    def close(self):
+        self._midi_input.cancel_callback()
+        self._midi_input.close_port()
+
+
+class RtMidiOutputPort(MidiOutputPort):
+    __module__ = __name__
+    __doc__ = 'MIDI output port using python-rtmidi'
+
+    def __init__(self, port_number):
+        self._midi_output = rtmidi.MidiOut()
+        self._midi_output.open_port(port_number)
+
+        self._send_message = self._midi_output.send_message
+
+    def write_short(self, status, data_1, data_2):
+        self._send_message((status, data_1, data_2))
+
+    def write(self, messages):
+        send_message = self._send_message
+
+        for message in messages:
+            send_message(message)
+
+    def write_sysex(self, sysex):
+        self._send_message(sysex)
+
+    def close(self):
+        self._midi_output.close_port()
+
+
+class RtMidiBackend(MidiBackend):
+    __module__ = __name__
+    __doc__ = 'MIDI backend using python-rtmidi'
+
+    NAME = 'python-rtmidi'
+
+    def __init__(self):
+        _import_rtmidi()
+
+        if rtmidi is None:
+            raise ImportError('MIDI backend "%s" needs the "python-rtmidi" package.' % self.NAME)
+
+        # used for enumerating MIDI ports only
+        self._midi_input_probe = rtmidi.MidiIn()
+        self._midi_output_probe = rtmidi.MidiOut()
+
+    def get_version(self):
+        return 'RtMidi %s' % rtmidi.get_rtmidi_version()
+
+    def shutdown(self):
+        self._midi_input_probe.delete()
+        self._midi_output_probe.delete()
+
+    # --- enumeration ---
+    def get_devices(self):
+        # inputs and outputs are numbered separately by RtMidi, so
+        # device IDs number inputs first and outputs afterwards
+        input_ports = self._midi_input_probe.get_ports()
+        output_ports = self._midi_output_probe.get_ports()
+
+        devices = []
+        for (port_number, port_name) in enumerate(input_ports):
+            devices.append((port_number, port_name, True, False))
+
+        for (port_number, port_name) in enumerate(output_ports):
+            devices.append((len(input_ports) + port_number, port_name, False, True))
+
+        return devices
+
+    def get_device_count(self):
+        return self._midi_input_probe.get_port_count() + self._midi_output_probe.get_port_count()
+
+    def get_device(self, device_id):
+        input_count = self._midi_input_probe.get_port_count()
+
+        if 0 <= device_id < input_count:
+            return (self._midi_input_probe.get_port_name(device_id), True, False)
+
+        port_number = device_id - input_count
+        if 0 <= port_number < self._midi_output_probe.get_port_count():
+            return (self._midi_output_probe.get_port_name(port_number), False, True)
+
+        return None
+
+    def get_default_input_id(self):
+        if not self._midi_input_probe.get_port_count():
+            return None
+
+        return 0
+
+    def get_default_output_id(self):
+        if not self._midi_output_probe.get_port_count():
+            return None
+
+        return self._midi_input_probe.get_port_count()
+
+    # --- MIDI ports ---
+    def open_input(self, device_id):
+        return RtMidiInputPort(device_id)
+
+    def open_output(self, device_id):
+        return RtMidiOutputPort(device_id - self._midi_input_probe.get_port_count())
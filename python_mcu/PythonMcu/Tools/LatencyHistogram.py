@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+"""
+PythonMcu
+=========
+Mackie Host Controller written in Python
+Copyright (c) 2011 Martin Zuther (http://www.mzuther.de/)
+Copyright (c) 2021 Raphaël Doursenaud <rdoursenaud@free.fr>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Thank you for using free software!
+
+"""
+
+
+import bisect
+
+
+class LatencyHistogram:
+    __module__ = __name__
+    __doc__ = 'Histogram of latencies with fixed buckets'
+
+    # upper limits of buckets in seconds (10 us to 1 s); latencies
+    # above the last limit go into an overflow bucket
+    BUCKET_LIMITS = (
+        0.00001, 0.00002, 0.00005,
+        0.0001, 0.0002, 0.0005,
+        0.001, 0.002, 0.005,
+        0.01, 0.02, 0.05,
+        0.1, 0.2, 0.5,
+        1.0
+    )
+
+    def __init__(self):
+        self._counts = [0] * (len(self.BUCKET_LIMITS) + 1)
+        self._count = 0
+        self._total = 0.0
+        self._maximum = 0.0
+
+    def reset(self):
+        self.__init__()
+
+    def record(self, latency):
+        self._counts[bisect.bisect_left(self.BUCKET_LIMITS, latency)] += 1
+        self._count += 1
+        self._total += latency
+
+        if latency > self._maximum:
+            self._maximum = latency
+
+    def get_count(self):
+        return self._count
+
+    def get_mean(self):
+        if not self._count:
+            return None
+
+        return self._total / self._count
+
+    def get_maximum(self):
+        if not self._count:
+            return None
+
+        return self._maximum
+
+    def get_percentile(self, percentile):
+        """
+        return the upper limit of the bucket holding the given
+        percentile (0 - 100) in seconds, or "None" if nothing has been
+        recorded yet
+        """
+        if not self._count:
+            return None
+
+        threshold = self._count * percentile / 100.0
+        accumulated = 0
+
+        for (index, count) in enumerate(self._counts):
+            accumulated += count
+
+            if count and accumulated >= threshold:
+                if index < len(self.BUCKET_LIMITS):
+                    return min(self.BUCKET_LIMITS[index], self._maximum)
+
+                break
+
+        return self._maximum
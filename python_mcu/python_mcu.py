@@ -29,8 +29,7 @@ import platform
 import sys
 
 import PySide2
-import pygame.version
-from PySide2.QtCore import QTimer, Qt
+from PySide2.QtCore import Qt, Signal
 from PySide2.QtGui import QFont, QFontMetrics, QTextCharFormat, QTextCursor
 from PySide2.QtWidgets import QFrame, QApplication, QPlainTextEdit, QStyle, QHBoxLayout, QVBoxLayout, QGridLayout, \
     QLabel, QComboBox, QPushButton
@@ -38,7 +37,9 @@ from PySide2.QtWidgets import QFrame, QApplication, QPlainTextEdit, QStyle, QHBo
 # noinspection PyUnresolvedReferences
 from PythonMcu.Hardware import *
 from PythonMcu.MackieControl.MackieHostControl import MackieHostControl
+from PythonMcu.McuInterconnector.McuFaderRateLimiter import McuFaderRateLimiter
 from PythonMcu.McuInterconnector.McuInterconnector import McuInterconnector
+from PythonMcu.McuInterconnector.McuUnitProxy import McuUnitProxy
 from PythonMcu.Midi.MidiConnection import MidiConnection
 from PythonMcu.Tools.AboutDialog import AboutDialog
 from PythonMcu.Tools.ApplicationConfiguration import ApplicationConfiguration
@@ -48,6 +49,10 @@ configuration = ApplicationConfiguration()
 
 # noinspection PyArgumentList
 class PythonMcuApp(QFrame):
+    # log messages may be sent from the MIDI threads, so they are
+    # passed to the GUI thread using a (queued) signal
+    log_message = Signal(str, bool)
+
     # noinspection PyUnresolvedReferences
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -61,6 +66,8 @@ class PythonMcuApp(QFrame):
         self._mcu_midi_input = None
         self._mcu_midi_output = None
         self._mcu_model_id = None
+        self._extender_midi_ports = []
+        self._mcu_channel_map = ''
 
         font = QFont()
         font.setStyleHint(QFont.TypeWriter, QFont.PreferAntialias)
@@ -75,6 +82,7 @@ class PythonMcuApp(QFrame):
         self._edit_logger.setCurrentCharFormat(char_format)
         self._edit_logger.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
         self._edit_logger.setFixedWidth(text_width)
+        self.log_message.connect(self._append_log_message)
 
         # must be defined before reading the configuration file!
         self._edit_usage_hint = QPlainTextEdit()
@@ -89,16 +97,12 @@ class PythonMcuApp(QFrame):
         self.callback_log('===============')
         self.callback_log('Python:  %s (%s)' % (platform.python_version(), platform.python_implementation()))
         self.callback_log('PySide:  %s' % PySide2.__version__)
-        self.callback_log('pygame:  %s' % pygame.version.ver)
-        self.callback_log('')
-        self.callback_log('')
 
         # auto-scroll log window by setting cursor to end of document
         self._edit_logger.moveCursor(QTextCursor.End, QTextCursor.MoveAnchor)
 
         self._read_configuration()
 
-        self._timer = None
         self._interconnector = None
 
         icon = self.style().standardIcon(QStyle.SP_TitleBarMenuButton)
@@ -153,6 +157,9 @@ class PythonMcuApp(QFrame):
             'Connection:', connection_types
         )
 
+        # list devices that have been plugged in since start-up
+        MidiConnection.rescan_devices()
+
         self._combo_mcu_midi_input = self._create_combo_box(
             self.grid_layout_mcu, self._mcu_midi_input,
             'MIDI In:', MidiConnection.get_midi_inputs()
@@ -198,21 +205,29 @@ class PythonMcuApp(QFrame):
         self.bottom_layout.addWidget(self.button_close)
         self.button_close.clicked.connect(self.close_application)
 
+        self.button_latency = QPushButton('&Latency')
+        self.bottom_layout.addWidget(self.button_latency)
+        self.button_latency.clicked.connect(self.display_latency)
+
         self.button_about = QPushButton('A&bout')
         self.bottom_layout.addWidget(self.button_about)
         self.button_about.clicked.connect(self.display_about)
 
         self._enable_controls(True)
 
-        self._timer = QTimer(self)
-        self._timer.setInterval(int(self._midi_latency))
-        self._timer.timeout.connect(self.process_midi_input)
-
     def _read_configuration(self):
         # initialise defaults for MCU and hardware controller
         mcu_emulated_model_default = MackieHostControl.get_preferred_mcu_model()
         hardware_controller_default = 'Novation ZeRO SL MkII'
         midi_latency_default = '1'
+        midi_batch_size_default = str(MidiConnection.DEFAULT_READ_BATCH_SIZE)
+        midi_backend_default = MidiConnection.DEFAULT_BACKEND
+        midi_output_interval_default = '0'
+        fader_output_interval_default = '0'
+        fader_maximum_rate_default = str(McuFaderRateLimiter.DEFAULT_MAXIMUM_RATE)
+        vpot_window_default = '20'
+        vpot_acceleration_default = '0'
+        lcd_maximum_rate_default = '30'
 
         # retrieve user configuration for MCU and hardware controller
         self._mcu_emulated_model = configuration.get_option(
@@ -221,6 +236,36 @@ class PythonMcuApp(QFrame):
             'Python MCU', 'controller_hardware', hardware_controller_default)
         self._midi_latency = configuration.get_option(
             'Python MCU', 'midi_latency', midi_latency_default)
+        self._midi_batch_size = configuration.get_option(
+            'Python MCU', 'midi_batch_size', midi_batch_size_default)
+        self._midi_backend = configuration.get_option(
+            'Python MCU', 'midi_backend', midi_backend_default)
+        self._midi_output_interval = configuration.get_option(
+            'Python MCU', 'midi_output_interval', midi_output_interval_default)
+        self._fader_output_interval = configuration.get_option(
+            'Python MCU', 'fader_output_interval', fader_output_interval_default)
+        self._fader_maximum_rate = configuration.get_option(
+            'Python MCU', 'fader_maximum_rate', fader_maximum_rate_default)
+        self._vpot_window = configuration.get_option(
+            'Python MCU', 'vpot_window', vpot_window_default)
+        self._vpot_acceleration = configuration.get_option(
+            'Python MCU', 'vpot_acceleration', vpot_acceleration_default)
+        self._lcd_maximum_rate = configuration.get_option(
+            'Python MCU', 'lcd_maximum_rate', lcd_maximum_rate_default)
+
+        # the MIDI backend is needed for looking up MIDI ports
+        try:
+            MidiConnection.set_backend(self._midi_backend)
+            MidiConnection.get_backend()
+        except (KeyError, ImportError) as e:
+            self.callback_log('%s  Using MIDI backend "%s" instead.' % (e.args[0], MidiConnection.DEFAULT_BACKEND))
+
+            self._midi_backend = MidiConnection.DEFAULT_BACKEND
+            MidiConnection.set_backend(self._midi_backend)
+
+        self.callback_log('MIDI:    %s (%s)' % (MidiConnection.get_backend().get_version(), self._midi_backend))
+        self.callback_log('')
+        self.callback_log('')
 
         # calculate MCU model ID from its name
         self._mcu_model_id = MackieHostControl.get_mcu_id_from_model(self._mcu_emulated_model)
@@ -264,6 +309,126 @@ class PythonMcuApp(QFrame):
             controller_midi_output_default
         )
 
+        # retrieve user configuration for emulated extenders (XT
+        # units) and their MIDI ports
+        number_of_extenders = min(
+            int(configuration.get_option('Python MCU', 'mcu_extenders', '0')),
+            McuInterconnector.MAXIMUM_EXTENDERS
+        )
+
+        self._extender_midi_ports = []
+        for extender in range(1, number_of_extenders + 1):
+            self._extender_midi_ports.append((
+                configuration.get_option('Python MCU', 'xt%d_midi_input' % extender, ''),
+                configuration.get_option('Python MCU', 'xt%d_midi_output' % extender, '')
+            ))
+
+        # channel map: "unit:channel" for each hardware channel,
+        # separated by commas (empty for the main unit's channels)
+        self._mcu_channel_map = configuration.get_option('Python MCU', 'mcu_channel_map', '')
+
+        # MIDI ports that have been opened before can be re-opened
+        # without scanning all MIDI devices
+        device_registry = MidiConnection.get_device_registry()
+
+        for (option_name, midi_input) in self._get_midi_input_options():
+            device_id = configuration.get_option('Python MCU', option_name + '_id', '')
+            if device_id:
+                device_registry.remember_input(midi_input, int(device_id))
+
+        for (option_name, midi_output) in self._get_midi_output_options():
+            device_id = configuration.get_option('Python MCU', option_name + '_id', '')
+            if device_id:
+                device_registry.remember_output(midi_output, int(device_id))
+
+    def _get_midi_input_options(self):
+        midi_input_options = [('mcu_midi_input', self._mcu_midi_input),
+                              ('controller_midi_input', self._controller_midi_input)]
+
+        for (extender, (midi_input, _)) in enumerate(self._extender_midi_ports, 1):
+            midi_input_options.append(('xt%d_midi_input' % extender, midi_input))
+
+        return midi_input_options
+
+    def _get_midi_output_options(self):
+        midi_output_options = [('mcu_midi_output', self._mcu_midi_output),
+                               ('controller_midi_output', self._controller_midi_output)]
+
+        for (extender, (_, midi_output)) in enumerate(self._extender_midi_ports, 1):
+            midi_output_options.append(('xt%d_midi_output' % extender, midi_output))
+
+        return midi_output_options
+
+    def _get_channel_map(self):
+        """
+        parse channel map; invalid channel maps are logged and ignored,
+        so that the channels of the main unit are used
+        """
+        if not self._mcu_channel_map.strip():
+            return None
+
+        number_of_units = 1 + len(self._extender_midi_ports)
+
+        channel_map = []
+        for channel_target in self._mcu_channel_map.split(','):
+            channel_target = channel_target.strip()
+
+            # unmapped hardware channel
+            if channel_target in ('', '-'):
+                channel_map.append(None)
+                continue
+
+            try:
+                (unit, channel) = (int(value) for value in channel_target.split(':'))
+            except ValueError:
+                return self._reject_channel_map('"%s" is not "unit:channel"' % channel_target)
+
+            if not 0 <= unit < number_of_units:
+                return self._reject_channel_map('unit %d has not been configured' % unit)
+
+            if not 0 <= channel < McuUnitProxy.NUMBER_OF_CHANNELS:
+                return self._reject_channel_map('channel %d does not exist' % channel)
+
+            if (unit, channel) in channel_map:
+                return self._reject_channel_map('"%s" has been mapped twice' % channel_target)
+
+            channel_map.append((unit, channel))
+
+        if len(channel_map) != McuUnitProxy.NUMBER_OF_CHANNELS:
+            return self._reject_channel_map('%d channels instead of %d' % (
+                len(channel_map), McuUnitProxy.NUMBER_OF_CHANNELS))
+
+        return channel_map
+
+    def _reject_channel_map(self, reason):
+        self.callback_log('Ignoring channel map: %s.' % reason)
+        self.callback_log('')
+        return None
+
+    def _store_midi_device_ids(self):
+        device_registry = MidiConnection.get_device_registry()
+
+        for (option_name, midi_input) in self._get_midi_input_options():
+            device_id = device_registry.get_last_good_input_id(midi_input)
+            if device_id is not None:
+                self._set_midi_device_id_option(option_name, device_id)
+
+        for (option_name, midi_output) in self._get_midi_output_options():
+            device_id = device_registry.get_last_good_output_id(midi_output)
+            if device_id is not None:
+                self._set_midi_device_id_option(option_name, device_id)
+
+        if configuration.has_changed():
+            configuration.save_configuration()
+
+    @staticmethod
+    def _set_midi_device_id_option(option_name, device_id):
+        option_name += '_id'
+
+        # do not save the configuration file when nothing has changed
+        if configuration.get_option('Python MCU', option_name, '') != str(device_id):
+            configuration.set_option('Python MCU', option_name, str(device_id))
+
     def _create_combo_box(self, layout, selection, label_text, choices):
         row = layout.rowCount()
 
@@ -311,10 +476,16 @@ class PythonMcuApp(QFrame):
         return controller_midi_input_default, controller_midi_output_default
 
     def callback_log(self, message, repaint=False):
+        # the log is printed right away, so that it also reaches the
+        # console while the log window is closing (e.g. the latency
+        # report on exit)
+        print(message)
+        self.log_message.emit(message, repaint)
+
+    def _append_log_message(self, message, repaint):
         if repaint:
             self._edit_logger.repaint()
 
-        print(message)
         self._edit_logger.appendPlainText(message)
 
     def combobox_item_selected(self):
@@ -383,12 +554,15 @@ class PythonMcuApp(QFrame):
         else:
             self.callback_log('QComboBox not handled ("%s").' % selected_text)
 
-    def process_midi_input(self):
-        self._interconnector.process_midi_input()
-
     def display_about(self):
         AboutDialog(self).show()
 
+    def display_latency(self):
+        if self._interconnector:
+            self._interconnector.log_latency_report()
+        else:
+            self.callback_log('MCU emulation is not running.', True)
+
     def interconnector_start_stop(self):
         if not self._interconnector:
             self._enable_controls(False)
@@ -401,11 +575,30 @@ class PythonMcuApp(QFrame):
             self.callback_log('MIDI input:     %s' % self._mcu_midi_input)
             self.callback_log('MIDI output:    %s' % self._mcu_midi_output)
             self.callback_log('')
+
+            for (extender, (midi_input, midi_output)) in enumerate(self._extender_midi_ports, 1):
+                self.callback_log('Extender:       XT %d' % extender)
+                self.callback_log('MIDI input:     %s' % midi_input)
+                self.callback_log('MIDI output:    %s' % midi_output)
+                self.callback_log('')
+
+            if self._mcu_channel_map:
+                self.callback_log('Channel map:    %s' % self._mcu_channel_map)
+                self.callback_log('')
+
             self.callback_log('Controller:     %s' % self._hardware_controller)
             self.callback_log('MIDI input:     %s' % self._controller_midi_input)
             self.callback_log('MIDI output:    %s' % self._controller_midi_output)
             self.callback_log('')
+            self.callback_log('MIDI backend:   %s' % self._midi_backend)
             self.callback_log('MIDI latency:   %s ms' % self._midi_latency)
+            self.callback_log('MIDI batch:     %s events' % self._midi_batch_size)
+            self.callback_log('Output period:  %s ms' % self._midi_output_interval)
+            self.callback_log('Fader output:   %s ms' % self._fader_output_interval)
+            self.callback_log('Fader rate:     %s Hz' % self._fader_maximum_rate)
+            self.callback_log('V-Pot window:   %s ms' % self._vpot_window)
+            self.callback_log('V-Pot accel.:   %s' % self._vpot_acceleration)
+            self.callback_log('LCD rate:       %s Hz' % self._lcd_maximum_rate)
             self.callback_log('')
             self.callback_log('')
 
@@ -428,19 +621,26 @@ class PythonMcuApp(QFrame):
                 self._hardware_controller_class,
                 self._controller_midi_input,
                 self._controller_midi_output,
-                self.callback_log
+                self.callback_log,
+                midi_batch_size=int(self._midi_batch_size),
+                midi_latency=float(self._midi_latency),
+                midi_output_interval=float(self._midi_output_interval),
+                fader_output_interval=float(self._fader_output_interval),
+                fader_maximum_rate=float(self._fader_maximum_rate),
+                vpot_window=float(self._vpot_window),
+                vpot_acceleration=float(self._vpot_acceleration),
+                lcd_maximum_rate=float(self._lcd_maximum_rate),
+                extender_midi_ports=self._extender_midi_ports,
+                channel_map=self._get_channel_map()
             )
             self._interconnector.connect()
-
-            self._timer.start()
+            self._store_midi_device_ids()
         else:
             self._enable_controls(True)
             self.button_start_stop.setText('&Start')
             self._interconnector_stop()
 
     def _interconnector_stop(self):
-        self._timer.stop()
-
         self.callback_log('')
         self.callback_log('Stopping MCU emulation...')
         self.callback_log('')
@@ -457,6 +657,8 @@ class PythonMcuApp(QFrame):
         if self._interconnector:
             self._interconnector_stop()
 
+        MidiConnection.shutdown()
+
         self.callback_log('Exiting application...')
         self.callback_log('', True)
 
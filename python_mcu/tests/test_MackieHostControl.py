@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+
+"""
+PythonMcu
+=========
+Mackie Host Controller written in Python
+Copyright (c) 2011 Martin Zuther (http://www.mzuther.de/)
+Copyright (c) 2021 Raphaël Doursenaud <rdoursenaud@free.fr>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Thank you for using free software!
+
+"""
+
+
+import time
+
+import pytest
+
+from PythonMcu.MackieControl.MackieHostControl import MackieHostControl
+from PythonMcu.MackieControl.McuSurfaceState import McuSurfaceState
+from PythonMcu.Midi.MidiConnection import MidiConnection
+
+
+def _log(message, repaint=False):
+    pass
+
+
+class _Host:
+    __module__ = __name__
+    __doc__ = 'Host (DAW) end of the loopback cables'
+
+    def __init__(self):
+        # the host reads from "Loopback 1" and writes to "Loopback 2"
+        self.midi = MidiConnection(_log, None)
+        self.midi.connect('Loopback 1', 'Loopback 2')
+
+    def receive(self):
+        return [message for (_, message, _) in self.midi.read_input_buffer()]
+
+    def receive_sysex_commands(self):
+        return [message[5] for message in self.receive() if message[0] == 0xF0]
+
+
+@pytest.fixture
+def host():
+    MidiConnection.set_backend('loopback')
+
+    host = _Host()
+    yield host
+
+    host.midi.disconnect()
+    MidiConnection.shutdown()
+
+
+class _HardwareController:
+    __module__ = __name__
+    __doc__ = 'Hardware controller that records all calls'
+
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        def record(*args):
+            self.calls.append((name,) + args)
+
+            # the controller has all capabilities
+            return name.startswith('has_')
+
+        return record
+
+
+def _connect(mcu_connection, callback_log=_log):
+    host_control = MackieHostControl(
+        0x14, mcu_connection, '1.0', 'Loopback 2', 'Loopback 1', callback_log)
+    host_control.connect()
+
+    return host_control
+
+
+def _process_input(host_control):
+    host_control._midi.process_input_buffer()
+
+
+def test_key_presses_use_switch_table():
+    host_control = MackieHostControl.__new__(MackieHostControl)
+    key_presses = []
+    host_control.keypress_switch = lambda switch_id, status: key_presses.append((switch_id, status))
+
+    for (mcu_command, switch_id) in MackieHostControl._SWITCH_IDS.items():
+        getattr(host_control, 'keypress_' + mcu_command)(MackieHostControl.SWITCH_PRESSED)
+
+        assert key_presses.pop() == (switch_id, MackieHostControl.SWITCH_PRESSED)
+        assert MackieHostControl.get_switch_id(mcu_command) == switch_id
+
+
+def test_channel_key_presses_use_switch_table():
+    host_control = MackieHostControl.__new__(MackieHostControl)
+    key_presses = []
+    host_control.keypress_switch = lambda switch_id, status: key_presses.append(switch_id)
+
+    host_control.keypress_solo_channel(3, MackieHostControl.SWITCH_PRESSED)
+    host_control.keypress_fader_touch_channel(8, MackieHostControl.SWITCH_PRESSED)
+    host_control.keypress_user_switch(2, MackieHostControl.SWITCH_PRESSED)
+
+    assert key_presses == [
+        MackieHostControl.get_switch_id('solo_channel_3'),
+        MackieHostControl.get_switch_id('fader_touch_channel_8'),
+        MackieHostControl.get_switch_id('user_switch_2')]
+
+
+def test_host_connection_query_is_repeated(host):
+    host_control = _connect(MackieHostControl.CHALLENGE_RESPONSE)
+    now = time.perf_counter()
+
+    assert host.receive_sysex_commands() == [0x01]
+
+    # nothing happens before the time-out
+    host_control.update_connection(now)
+    assert not host.receive()
+
+    for _ in range(MackieHostControl.CONNECTION_RETRIES):
+        now += MackieHostControl.CONNECTION_RETRY_INTERVAL
+        host_control.update_connection(now)
+
+        assert host.receive_sysex_commands() == [0x01]
+
+    # afterwards, the host has to send a "Device Query"
+    now += MackieHostControl.CONNECTION_RETRY_INTERVAL
+    host_control.update_connection(now)
+    host_control.update_connection(now + 60.0)
+
+    assert not host.receive()
+    assert host_control.is_offline()
+
+    host_control.disconnect()
+
+
+def test_host_connection_reply_completes_connection(host):
+    host_control = _connect(MackieHostControl.CHALLENGE_RESPONSE)
+    host.receive()
+
+    host.midi.send_sysex([0x00, 0x00, 0x66, 0x14, 0x02], list(host_control._host_connection_reply))
+    _process_input(host_control)
+
+    assert not host_control.is_offline()
+    assert host.receive_sysex_commands() == [0x03]
+
+    # time-outs do not apply once online
+    host_control.update_connection(time.perf_counter() + 60.0)
+    assert not host.receive()
+
+    host_control.disconnect()
+
+
+def test_wrong_host_connection_reply_is_rejected(host):
+    host_control = _connect(MackieHostControl.CHALLENGE_RESPONSE)
+    host.receive()
+
+    host.midi.send_sysex([0x00, 0x00, 0x66, 0x14, 0x02], list(b'_pyMCU_xxxx'))
+    _process_input(host_control)
+
+    assert host_control.is_offline()
+    assert host.receive_sysex_commands() == [0x04, 0x01]
+
+    host_control.disconnect()
+
+
+def test_first_midi_data_completes_connection(host):
+    host_control = _connect(MackieHostControl.WAIT_FOR_MIDI_DATA)
+
+    # reminders are logged, but nothing is sent to the host
+    host_control.update_connection(time.perf_counter() + MackieHostControl.CONNECTION_WAIT_INTERVAL)
+    assert host_control.is_offline()
+    assert not host.receive()
+
+    host.midi.send_note_on(0x5E, 0x7F)
+    _process_input(host_control)
+
+    assert not host_control.is_offline()
+
+    host_control.disconnect()
+
+
+def test_connection_may_be_assumed(host):
+    host_control = _connect(MackieHostControl.ASSUME_SUCCESSFUL_CONNECTION)
+
+    assert not host_control.is_offline()
+    assert not host.receive()
+
+    host_control.disconnect()
+
+
+def test_surface_state_follows_the_host(host):
+    host_control = _connect(MackieHostControl.ASSUME_SUCCESSFUL_CONNECTION)
+
+    host.midi.send_note_on(0x5E, 0x7F)
+    host.midi.send_pitch_wheel_change(8, 0x3FF0)
+    host.midi.send_sysex([0x00, 0x00, 0x66, 0x14, 0x12], [0x00] + list(b'Track'))
+    _process_input(host_control)
+
+    surface_state = host_control.get_surface_state()
+    assert surface_state.get_leds()[0x5E] == 1
+    assert surface_state.get_faders()[8] == 0x3FF
+    assert surface_state.get_lcd()[:5] == b'Track'
+
+    host_control.disconnect()
+
+
+def test_repaint_sends_surface_state_to_controller(host):
+    host_control = _connect(MackieHostControl.ASSUME_SUCCESSFUL_CONNECTION)
+
+    host.midi.send_note_on(0x5E, 0x7F)
+    host.midi.send_pitch_wheel_change(8, 0x3FF0)
+    _process_input(host_control)
+
+    controller = _HardwareController()
+    host_control.set_hardware_controller(controller)
+    controller.calls.clear()
+    host_control.repaint_hardware_controller()
+
+    assert ('set_led_play', 1) in controller.calls
+    assert ('fader_moved', 8, 0x3FF) in controller.calls
+    assert controller.calls[0][0] == 'set_lcd'
+
+    # values the host has not sent are left alone
+    assert ('set_led_stop', 0) not in controller.calls
+
+    host_control.unset_hardware_controller()
+    host_control.disconnect()
+
+
+def test_channel_messages_are_ignored_while_offline(host):
+    host_control = _connect(MackieHostControl.CHALLENGE_RESPONSE)
+
+    host.midi.send_note_on(0x5E, 0x7F)
+    _process_input(host_control)
+
+    assert host_control.get_surface_state().get_leds()[0x5E] == McuSurfaceState.UNKNOWN
+
+    host_control.disconnect()
+
+
+def test_sysex_commands_are_handled_while_offline(host):
+    host_control = _connect(MackieHostControl.CHALLENGE_RESPONSE)
+    host.receive()
+
+    # "Version Request" and "Device Query"
+    host.midi.send_sysex([0x00, 0x00, 0x66, 0x14], [0x13, 0x00])
+    host.midi.send_sysex([0x00, 0x00, 0x66, 0x14], [0x00])
+    _process_input(host_control)
+
+    assert host.receive_sysex_commands() == [0x14, 0x01]
+
+    host_control.disconnect()
+
+
+def test_unhandled_messages_are_logged(host):
+    messages = []
+    host_control = _connect(MackieHostControl.ASSUME_SUCCESSFUL_CONNECTION,
+                            lambda message, repaint=False: messages.append(message))
+    messages.clear()
+
+    host.midi.send(0xA0, 0x10, 0x20)
+    _process_input(host_control)
+
+    assert messages[-1].endswith('status A0: A0 10 20')
+
+    host_control.disconnect()
+
+
+def test_model_change_updates_dispatch_tables(host):
+    host_control = _connect(MackieHostControl.ASSUME_SUCCESSFUL_CONNECTION)
+    host_control.set_mcu_model_id(0x10)
+
+    host.midi.send_sysex([0x00, 0x00, 0x66, 0x10, 0x12], [0x00] + list(b'Logic'))
+    _process_input(host_control)
+
+    assert host_control.get_surface_state().get_lcd()[:5] == b'Logic'
+
+    host_control.disconnect()
+
+
+def test_sysex_of_other_devices_is_ignored(host):
+    host_control = _connect(MackieHostControl.ASSUME_SUCCESSFUL_CONNECTION)
+
+    # Mackie Control XT, Novation and a truncated message
+    host.midi.send_sysex([0x00, 0x00, 0x66, 0x15, 0x12], [0x00] + list(b'Other'))
+    host.midi.send_sysex([0x00, 0x20, 0x29, 0x14, 0x12], [0x00] + list(b'Other'))
+    host.midi.send_sysex([0x00, 0x00, 0x66, 0x14], [])
+    _process_input(host_control)
+
+    assert host_control.get_surface_state().get_lcd() == b' ' * McuSurfaceState.LCD_SIZE
+
+    host_control.disconnect()
+
+
+def test_lcd_characters_are_passed_without_copying(host):
+    host_control = _connect(MackieHostControl.ASSUME_SUCCESSFUL_CONNECTION)
+    controller = _HardwareController()
+    host_control.set_hardware_controller(controller)
+    controller.calls.clear()
+
+    host.midi.send_sysex([0x00, 0x00, 0x66, 0x14, 0x12], [0x38] + list(b'Track'))
+    _process_input(host_control)
+
+    [(name, position, hex_codes)] = controller.calls
+    assert (name, position) == ('set_lcd', 0x38)
+    assert isinstance(hex_codes, memoryview)
+    assert hex_codes == b'Track'
+
+    host_control.unset_hardware_controller()
+    host_control.disconnect()
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+"""
+PythonMcu
+=========
+Mackie Host Controller written in Python
+Copyright (c) 2011 Martin Zuther (http://www.mzuther.de/)
+Copyright (c) 2021 Raphaël Doursenaud <rdoursenaud@free.fr>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Thank you for using free software!
+
+"""
+
+
+from PythonMcu.McuInterconnector.McuFaderProcessor import McuFaderProcessor
+
+
+def _create_fader_processor():
+    sent = []
+    fader_processor = McuFaderProcessor(lambda fader_id, fader_position: sent.append((fader_id, fader_position)))
+
+    return (fader_processor, sent)
+
+
+def test_first_value_is_sent_right_away():
+    (fader_processor, sent) = _create_fader_processor()
+    fader_processor.move_fader_7bit(0, 0x40, timestamp=1.0)
+
+    assert sent == [(0, 0x2040)]
+    assert fader_processor.get_position(0) == 0x2040
+
+
+def test_values_far_apart_are_sent_right_away():
+    (fader_processor, sent) = _create_fader_processor()
+    fader_processor.move_fader_7bit(0, 0x00, timestamp=1.0)
+    fader_processor.move_fader_7bit(0, 0x7F, timestamp=1.0 + 2 * McuFaderProcessor.MAXIMUM_RAMP_TIME)
+
+    assert sent == [(0, 0x0000), (0, 0x3FFF)]
+
+
+def test_close_values_are_ramped():
+    (fader_processor, sent) = _create_fader_processor()
+    fader_processor.move_fader_7bit(8, 0x00, timestamp=1.0)
+    fader_processor.move_fader_7bit(8, 0x05, timestamp=1.05)
+
+    # ramped over the time between both values
+    assert sent == [(8, 0x0000)]
+
+    for _ in range(5):
+        fader_processor.update()
+
+    positions = [fader_position for (_, fader_position) in sent]
+    assert positions == sorted(positions)
+    assert len(positions) == 6
+    assert positions[-1] == 0x0285
+
+    # the ramp has ended
+    fader_processor.update()
+    assert len(sent) == 6
+
+
+def test_unchanged_positions_are_not_sent():
+    (fader_processor, sent) = _create_fader_processor()
+    fader_processor.move_fader(0, 0x1000)
+    fader_processor.move_fader(0, 0x1000)
+    fader_processor.move_fader_7bit(1, 0x20, timestamp=1.0)
+    fader_processor.move_fader_7bit(1, 0x20, timestamp=1.01)
+    fader_processor.update()
+
+    assert sent == [(0, 0x1000), (1, 0x1020)]
+
+
+def test_14bit_position_cancels_ramp():
+    (fader_processor, sent) = _create_fader_processor()
+    fader_processor.move_fader_7bit(0, 0x00, timestamp=1.0)
+    fader_processor.move_fader_7bit(0, 0x7F, timestamp=1.05)
+    fader_processor.move_fader(0, 0x2000)
+
+    for _ in range(5):
+        fader_processor.update()
+
+    assert sent == [(0, 0x0000), (0, 0x2000)]
+
+
+def test_reset_forgets_positions():
+    (fader_processor, sent) = _create_fader_processor()
+    fader_processor.move_fader(0, 0x1000)
+    fader_processor.reset()
+    fader_processor.move_fader(0, 0x1000)
+
+    assert sent == [(0, 0x1000), (0, 0x1000)]
+    assert fader_processor.get_position(1) == -1
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+"""
+PythonMcu
+=========
+Mackie Host Controller written in Python
+Copyright (c) 2011 Martin Zuther (http://www.mzuther.de/)
+Copyright (c) 2021 Raphaël Doursenaud <rdoursenaud@free.fr>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Thank you for using free software!
+
+"""
+
+
+from PythonMcu.McuInterconnector.McuFaderRateLimiter import McuFaderRateLimiter
+
+
+def _create_rate_limiter(maximum_rate=50):
+    sent = []
+    rate_limiter = McuFaderRateLimiter(lambda fader_id, fader_position: sent.append((fader_id, fader_position)),
+                                       maximum_rate)
+
+    return (rate_limiter, sent)
+
+
+def test_leading_edge_is_sent_right_away():
+    (rate_limiter, sent) = _create_rate_limiter()
+    rate_limiter.move_fader(0, 100, now=1.0)
+
+    assert sent == [(0, 100)]
+
+
+def test_positions_within_interval_are_held_back():
+    (rate_limiter, sent) = _create_rate_limiter()
+    rate_limiter.move_fader(0, 100, now=1.0)
+    rate_limiter.move_fader(0, 200, now=1.005)
+    rate_limiter.move_fader(0, 300, now=1.01)
+
+    assert sent == [(0, 100)]
+
+    # too early for the trailing edge
+    rate_limiter.update(now=1.015)
+    assert sent == [(0, 100)]
+
+
+def test_trailing_edge_sends_last_position():
+    (rate_limiter, sent) = _create_rate_limiter()
+    rate_limiter.move_fader(0, 100, now=1.0)
+    rate_limiter.move_fader(0, 200, now=1.005)
+    rate_limiter.move_fader(0, 300, now=1.01)
+    rate_limiter.update(now=1.02)
+
+    assert sent == [(0, 100), (0, 300)]
+
+    # nothing is pending anymore
+    rate_limiter.update(now=1.1)
+    assert sent == [(0, 100), (0, 300)]
+
+
+def test_positions_after_interval_are_sent_right_away():
+    (rate_limiter, sent) = _create_rate_limiter()
+    rate_limiter.move_fader(0, 100, now=1.0)
+    rate_limiter.move_fader(0, 200, now=1.02)
+
+    assert sent == [(0, 100), (0, 200)]
+
+
+def test_faders_are_limited_separately():
+    (rate_limiter, sent) = _create_rate_limiter()
+    rate_limiter.move_fader(0, 100, now=1.0)
+    rate_limiter.move_fader(8, 200, now=1.001)
+    rate_limiter.move_fader(0, 300, now=1.002)
+
+    assert sent == [(0, 100), (8, 200)]
+
+    rate_limiter.update(now=1.021)
+    assert sent == [(0, 100), (8, 200), (0, 300)]
+
+
+def test_update_interval():
+    (rate_limiter, _) = _create_rate_limiter(maximum_rate=50)
+
+    assert rate_limiter.get_update_interval() == 0.01
+
+
+def test_reset():
+    (rate_limiter, sent) = _create_rate_limiter()
+    rate_limiter.move_fader(0, 100, now=1.0)
+    rate_limiter.move_fader(0, 200, now=1.005)
+    rate_limiter.reset()
+    rate_limiter.update(now=1.1)
+
+    assert sent == [(0, 100)]
+
+    rate_limiter.move_fader(0, 300, now=1.101)
+    assert sent == [(0, 100), (0, 300)]
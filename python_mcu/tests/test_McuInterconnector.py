@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+"""
+PythonMcu
+=========
+Mackie Host Controller written in Python
+Copyright (c) 2011 Martin Zuther (http://www.mzuther.de/)
+Copyright (c) 2021 Raphaël Doursenaud <rdoursenaud@free.fr>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Thank you for using free software!
+
+"""
+
+
+import contextlib
+
+import pytest
+
+from PythonMcu.MackieControl.MackieHostControl import MackieHostControl
+from PythonMcu.McuInterconnector.McuInterconnector import McuInterconnector
+from PythonMcu.Midi.MidiConnection import MidiConnection
+
+
+class _HardwareController:
+    __module__ = __name__
+    __doc__ = 'Hardware controller that records its LEDs'
+
+    def __init__(self):
+        self.leds = []
+
+    def set_led(self, midi_led, led_status):
+        self.leds.append((midi_led, led_status))
+
+    @contextlib.contextmanager
+    def burst(self):
+        yield
+
+
+@pytest.fixture
+def interconnector():
+    MidiConnection.set_backend('loopback')
+
+    interconnector = McuInterconnector(
+        None, MackieHostControl.get_mcu_id_from_model('Mackie Control'),
+        MackieHostControl.ASSUME_SUCCESSFUL_CONNECTION, 'Loopback 1', 'Loopback 1',
+        'NovationZeROSLMkII', 'Loopback 2', 'Loopback 2', lambda message, repaint=False: None)
+    interconnector._hardware_controller = _HardwareController()
+
+    yield interconnector
+
+    MidiConnection.shutdown()
+
+
+def _get_leds(interconnector):
+    leds = sorted(interconnector._hardware_controller.leds)
+    interconnector._hardware_controller.leds.clear()
+
+    return leds
+
+
+def test_new_controls_send_their_leds(interconnector):
+    interconnector.set_led_channel_mute(0, 127)
+    interconnector.register_controls([
+        ('mute_channel_1', 'cc24', 'cc24'),
+        ('mute_channel_2', 'cc25', 'cc25')
+    ])
+
+    # LEDs of unassigned controls are in an unknown state
+    assert _get_leds(interconnector) == [('cc24', 127), ('cc25', 0)]
+
+
+def test_unchanged_leds_are_not_sent(interconnector):
+    interconnector.set_led_channel_mute(0, 127)
+    interconnector.set_led_channel_solo(0, 127)
+    interconnector.register_controls([
+        ('mute_channel_1', 'cc24', 'cc24'),
+        ('mute_channel_2', 'cc25', 'cc25')
+    ])
+    _get_leds(interconnector)
+
+    # "cc24" stays lit and "cc25" stays off
+    interconnector.register_controls([
+        ('solo_channel_1', 'cc24', 'cc24'),
+        ('solo_channel_2', 'cc25', 'cc25')
+    ])
+
+    assert not _get_leds(interconnector)
+
+
+def test_changed_leds_are_sent(interconnector):
+    interconnector.set_led_channel_mute(0, 127)
+    interconnector.set_led_channel_solo(1, 127)
+    interconnector.register_controls([
+        ('mute_channel_1', 'cc24', 'cc24'),
+        ('mute_channel_2', 'cc25', 'cc25')
+    ])
+    _get_leds(interconnector)
+
+    interconnector.register_controls([
+        ('solo_channel_1', 'cc24', 'cc24'),
+        ('solo_channel_2', 'cc25', 'cc25')
+    ])
+
+    assert _get_leds(interconnector) == [('cc24', 0), ('cc25', 127)]
+
+
+def test_withdrawn_controls_switch_off_their_leds(interconnector):
+    interconnector.set_led_channel_mute(0, 127)
+    interconnector.register_controls([
+        ('mute_channel_1', 'cc24', 'cc24'),
+        ('mute_channel_2', 'cc25', 'cc25')
+    ])
+    _get_leds(interconnector)
+
+    interconnector.register_controls([
+        (None, 'cc24', None),
+        (None, 'cc25', None)
+    ])
+
+    # only lit LEDs are switched off
+    assert _get_leds(interconnector) == [('cc24', 0)]
+    assert interconnector._led__mcu_to_hardware['mute_channel_1']['midi_switch'] is None
+
+
+def test_registered_leds_follow_the_host(interconnector):
+    interconnector.register_controls([('mute_channel_1', 'cc24', 'cc24')])
+    _get_leds(interconnector)
+
+    interconnector.set_led_channel_mute(0, 127)
+    interconnector.set_led_channel_mute(1, 127)
+
+    assert _get_leds(interconnector) == [('cc24', 127)]
+
+
+def test_repaint_sends_leds_again(interconnector):
+    interconnector.register_controls([
+        ('mute_channel_1', 'cc24', 'cc24'),
+        ('mute_channel_2', 'cc25', 'cc25')
+    ])
+    interconnector.set_led_channel_mute(0, 127)
+    _get_leds(interconnector)
+
+    interconnector.repaint_hardware_controller()
+
+    assert _get_leds(interconnector) == [('cc24', 127), ('cc25', 0)]
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+"""
+PythonMcu
+=========
+Mackie Host Controller written in Python
+Copyright (c) 2011 Martin Zuther (http://www.mzuther.de/)
+Copyright (c) 2021 Raphaël Doursenaud <rdoursenaud@free.fr>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Thank you for using free software!
+
+"""
+
+
+from PythonMcu.MackieControl.McuMeterEngine import McuMeterEngine
+
+
+def _create_meter_engine():
+    levels = []
+    peaks = []
+    meter_engine = McuMeterEngine(8, lambda meter_id, meter_level: levels.append((meter_id, meter_level)),
+                                  lambda meter_id, peak_level: peaks.append((meter_id, peak_level)))
+
+    return (meter_engine, levels, peaks)
+
+
+def test_levels_decay_by_one_step():
+    (meter_engine, levels, _) = _create_meter_engine()
+    meter_engine.set_level(0, 0x03)
+
+    for _ in range(4):
+        meter_engine.decay()
+
+    assert levels == [(0, 0x03), (0, 0x02), (0, 0x01), (0, 0x00)]
+
+
+def test_peaks_are_held():
+    (meter_engine, _, peaks) = _create_meter_engine()
+    meter_engine.set_level(1, 0x08)
+
+    for _ in range(McuMeterEngine.PEAK_HOLD_TICKS):
+        meter_engine.decay()
+
+    assert peaks == [(1, 0x08)]
+    assert meter_engine.get_peak(1) == 0x08
+
+    meter_engine.decay()
+
+    assert peaks == [(1, 0x08), (1, 0x07)]
+
+
+def test_levels_are_limited():
+    (meter_engine, levels, _) = _create_meter_engine()
+    meter_engine.set_level(2, 0x0D)
+
+    assert levels == [(2, McuMeterEngine.MAXIMUM_LEVEL)]
+
+
+def test_overload_is_passed_on_when_changed():
+    (meter_engine, levels, _) = _create_meter_engine()
+    meter_engine.set_level(3, McuMeterEngine.SET_OVERLOAD)
+    meter_engine.set_level(3, McuMeterEngine.SET_OVERLOAD)
+    meter_engine.set_level(3, McuMeterEngine.CLEAR_OVERLOAD)
+
+    assert levels == [(3, McuMeterEngine.SET_OVERLOAD), (3, McuMeterEngine.CLEAR_OVERLOAD)]
+    assert meter_engine.get_level(3) == 0
+
+
+def test_unchanged_levels_are_not_passed_on():
+    (meter_engine, levels, peaks) = _create_meter_engine()
+    meter_engine.set_level(4, 0x05)
+    meter_engine.set_level(4, 0x05)
+
+    assert levels == [(4, 0x05)]
+    assert peaks == [(4, 0x05)]
+
+    # silent meters are not decayed
+    meter_engine.reset()
+    levels.clear()
+    peaks.clear()
+    meter_engine.decay()
+
+    assert not levels
+    assert not peaks
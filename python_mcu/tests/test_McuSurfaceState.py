@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+"""
+PythonMcu
+=========
+Mackie Host Controller written in Python
+Copyright (c) 2011 Martin Zuther (http://www.mzuther.de/)
+Copyright (c) 2021 Raphaël Doursenaud <rdoursenaud@free.fr>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Thank you for using free software!
+
+"""
+
+
+from PythonMcu.MackieControl.McuSurfaceState import McuSurfaceState
+
+
+def test_initial_state_is_unknown():
+    surface_state = McuSurfaceState()
+
+    assert surface_state.get_lcd() == b' ' * McuSurfaceState.LCD_SIZE
+    assert set(surface_state.get_leds()) == {McuSurfaceState.UNKNOWN}
+    assert set(surface_state.get_vpot_rings()) == {McuSurfaceState.UNKNOWN}
+    assert list(surface_state.get_faders()) == [-1] * McuSurfaceState.NUMBER_OF_FADERS
+
+
+def test_lcd_wraps_around():
+    surface_state = McuSurfaceState()
+    surface_state.set_lcd(110, b'abcd')
+
+    assert surface_state.get_lcd()[110:] == b'ab'
+    assert surface_state.get_lcd()[:2] == b'cd'
+
+
+def test_updates_are_stored_in_place():
+    surface_state = McuSurfaceState()
+    leds = surface_state.get_leds()
+
+    surface_state.set_led(0x5E, 1)
+    surface_state.set_fader(8, 0x3FF)
+    surface_state.set_digit(11, 0x31)
+
+    assert leds[0x5E] == 1
+    assert surface_state.get_faders()[8] == 0x3FF
+    assert surface_state.get_digits()[11] == 0x31
+
+    surface_state.reset()
+
+    assert leds[0x5E] == McuSurfaceState.UNKNOWN
+    assert surface_state.get_faders()[8] == -1
+
+
+def test_leds_off_and_faders_to_minimum():
+    surface_state = McuSurfaceState()
+    surface_state.all_leds_off()
+    surface_state.faders_to_minimum()
+
+    assert set(surface_state.get_leds()) == {0}
+    assert set(surface_state.get_faders()) == {0}
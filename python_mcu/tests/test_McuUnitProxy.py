@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+"""
+PythonMcu
+=========
+Mackie Host Controller written in Python
+Copyright (c) 2011 Martin Zuther (http://www.mzuther.de/)
+Copyright (c) 2021 Raphaël Doursenaud <rdoursenaud@free.fr>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Thank you for using free software!
+
+"""
+
+
+from PythonMcu.McuInterconnector.McuUnitProxy import McuUnitProxy
+
+
+class _Interconnector:
+    __module__ = __name__
+    __doc__ = 'Interconnector that records all calls'
+
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        def record(*args):
+            self.calls.append((name,) + tuple(bytes(arg) if isinstance(arg, memoryview) else arg for arg in args))
+            return True
+
+        return record
+
+
+def _create_unit_proxy(unit_index, hardware_channels):
+    interconnector = _Interconnector()
+
+    return (McuUnitProxy(interconnector, unit_index, hardware_channels), interconnector.calls)
+
+
+def test_main_unit_forwards_everything():
+    (unit_proxy, calls) = _create_unit_proxy(0, range(8))
+
+    unit_proxy.set_led_play(1)
+    unit_proxy.fader_moved(8, 0x200)
+    unit_proxy.set_led_channel_solo(2, 1)
+    unit_proxy.set_lcd(60, b'Track')
+
+    assert calls == [
+        ('set_led_play', 1),
+        ('fader_moved', 8, 0x200),
+        ('set_led_channel_solo', 2, 1),
+        ('set_lcd', 60, b'Track')
+    ]
+
+
+def test_extenders_drive_mapped_channels_only():
+    (unit_proxy, calls) = _create_unit_proxy(1, [4, 5, 6, 7, None, None, None, None])
+
+    unit_proxy.set_led_play(1)
+    unit_proxy.fader_moved(8, 0x200)
+    unit_proxy.fader_moved(4, 0x100)
+    unit_proxy.fader_moved(1, 0x100)
+    unit_proxy.set_led_channel_mute(3, 1)
+    unit_proxy.set_peak_level(0, 0x05)
+    unit_proxy.set_vpot_led_ring(2, 0, 1, 6)
+
+    assert calls == [
+        ('fader_moved', 5, 0x100),
+        ('set_led_channel_mute', 7, 1),
+        ('set_peak_level', 4, 0x05),
+        ('set_vpot_led_ring', 6, 0, 1, 6)
+    ]
+
+    # capabilities are those of the hardware controller
+    assert unit_proxy.has_display_lcd()
+    assert unit_proxy.get_hardware_channel(0) == 4
+    assert unit_proxy.get_hardware_channel(8) is None
+
+
+def test_lcd_is_remapped_strip_by_strip():
+    (unit_proxy, calls) = _create_unit_proxy(1, [4, None, None, None, None, None, None, 0])
+
+    # channel strips 0 and 1 of the upper line, strip 7 of the lower
+    unit_proxy.set_lcd(3, b'abcdefgh')
+    unit_proxy.set_lcd(56 + 49, b'1234567')
+
+    assert calls == [
+        ('set_lcd', 31, b'abcd'),
+        ('set_lcd', 56, b'1234567')
+    ]
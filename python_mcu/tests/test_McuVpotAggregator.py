@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+"""
+PythonMcu
+=========
+Mackie Host Controller written in Python
+Copyright (c) 2011 Martin Zuther (http://www.mzuther.de/)
+Copyright (c) 2021 Raphaël Doursenaud <rdoursenaud@free.fr>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Thank you for using free software!
+
+"""
+
+
+from PythonMcu.McuInterconnector.McuVpotAggregator import McuVpotAggregator
+
+
+def _create_aggregator(window=0.02, acceleration=0.0):
+    sent = []
+    aggregator = McuVpotAggregator(lambda vpot_id, vpot_movement: sent.append((vpot_id, vpot_movement)),
+                                   window, acceleration)
+
+    return (aggregator, sent)
+
+
+def test_first_tick_is_sent_right_away():
+    (aggregator, sent) = _create_aggregator()
+    aggregator.move_vpot(0, False, 1, now=1.0)
+
+    assert sent == [(0, 0x01)]
+
+
+def test_ticks_within_window_are_aggregated():
+    (aggregator, sent) = _create_aggregator()
+    aggregator.move_vpot(0, False, 1, now=1.0)
+    aggregator.move_vpot(0, False, 1, now=1.005)
+    aggregator.move_vpot(0, False, 2, now=1.01)
+
+    assert sent == [(0, 0x01)]
+
+    # too early
+    aggregator.update(now=1.015)
+    assert sent == [(0, 0x01)]
+
+    aggregator.update(now=1.02)
+    assert sent == [(0, 0x01), (0, 0x03)]
+
+
+def test_counter_clockwise_ticks():
+    (aggregator, sent) = _create_aggregator()
+    aggregator.move_vpot(3, True, 2, now=1.0)
+    aggregator.move_vpot_raw(3, 0x41, now=1.005)
+    aggregator.update(now=1.02)
+
+    assert sent == [(3, 0x42), (3, 0x41)]
+
+
+def test_opposite_ticks_cancel_out():
+    (aggregator, sent) = _create_aggregator()
+    aggregator.move_vpot(0, False, 1, now=1.0)
+    aggregator.move_vpot_raw(0, 0x02, now=1.005)
+    aggregator.move_vpot_raw(0, 0x42, now=1.01)
+    aggregator.update(now=1.02)
+
+    assert sent == [(0, 0x01)]
+
+
+def test_vpots_are_aggregated_separately():
+    (aggregator, sent) = _create_aggregator()
+    aggregator.move_vpot(0, False, 1, now=1.0)
+    aggregator.move_vpot(7, False, 1, now=1.001)
+    aggregator.move_vpot(0, False, 1, now=1.002)
+    aggregator.move_vpot(7, True, 2, now=1.003)
+    aggregator.update(now=1.021)
+
+    assert sent == [(0, 0x01), (7, 0x01), (0, 0x01), (7, 0x42)]
+
+
+def test_ticks_beyond_limit_are_carried_over():
+    (aggregator, sent) = _create_aggregator()
+    aggregator.move_vpot(0, False, 1, now=1.0)
+
+    for _ in range(100):
+        aggregator.move_vpot(0, True, 1, now=1.01)
+
+    aggregator.update(now=1.02)
+    assert sent == [(0, 0x01), (0, 0x40 | McuVpotAggregator.MAXIMUM_TICKS)]
+
+    # too early for the remaining ticks
+    aggregator.update(now=1.03)
+    assert len(sent) == 2
+
+    aggregator.update(now=1.04)
+    assert sent[2:] == [(0, 0x40 | (100 - McuVpotAggregator.MAXIMUM_TICKS))]
+
+    aggregator.update(now=1.1)
+    assert len(sent) == 3
+
+
+def test_accelerated_ticks_are_carried_over():
+    (aggregator, sent) = _create_aggregator(acceleration=0.5)
+    aggregator.move_vpot(0, False, 1, now=1.0)
+    aggregator.move_vpot(0, False, 12, now=1.01)
+    aggregator.update(now=1.02)
+    aggregator.update(now=1.04)
+
+    # 10 * (1 + 0.5 * 9) = 55 fits into a message, 11 ticks do not;
+    # the remaining 2 ticks are accelerated to 3
+    assert sent == [(0, 0x01), (0, 55), (0, 3)]
+
+
+def test_acceleration():
+    (aggregator, sent) = _create_aggregator(acceleration=0.5)
+    aggregator.move_vpot(0, False, 1, now=1.0)
+    aggregator.move_vpot(0, False, 4, now=1.01)
+    aggregator.update(now=1.02)
+
+    # single ticks are not accelerated; 4 * (1 + 0.5 * 3) = 10
+    assert sent == [(0, 0x01), (0, 10)]
+
+
+def test_window_of_zero_sends_every_tick():
+    (aggregator, sent) = _create_aggregator(window=0.0)
+    aggregator.move_vpot(0, False, 1, now=1.0)
+    aggregator.move_vpot(0, False, 1, now=1.0)
+
+    assert sent == [(0, 0x01), (0, 0x01)]
@@ -0,0 +1,347 @@
+# -*- coding: utf-8 -*-
+
+"""
+PythonMcu
+=========
+Mackie Host Controller written in Python
+Copyright (c) 2011 Martin Zuther (http://www.mzuther.de/)
+Copyright (c) 2021 Raphaël Doursenaud <rdoursenaud@free.fr>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Thank you for using free software!
+
+"""
+
+
+import sys
+import threading
+import time
+
+import pytest
+
+from PythonMcu.Midi.LoopbackMidiBackend import LoopbackMidiBackend
+from PythonMcu.Midi.MidiBackend import MidiInputPort
+from PythonMcu.Midi.MidiConnection import MidiConnection
+
+
+class _CountingOutputPort:
+    __module__ = __name__
+    __doc__ = 'Wrapper of MIDI output ports that records backend calls'
+
+    def __init__(self, midi_output):
+        self._midi_output = midi_output
+        self.calls = []
+
+    def write_short(self, status, data_1, data_2):
+        self.calls.append('write_short')
+        self._midi_output.write_short(status, data_1, data_2)
+
+    def write(self, messages):
+        self.calls.append('write')
+        self._midi_output.write(messages)
+
+    def write_sysex(self, sysex):
+        self.calls.append('write_sysex')
+        self._midi_output.write_sysex(sysex)
+
+    def close(self):
+        self._midi_output.close()
+
+
+@pytest.fixture
+def midi_connection():
+    MidiConnection.set_backend('loopback')
+
+    midi_connection = MidiConnection(lambda message, repaint=False: None, None)
+    midi_connection.connect('Loopback 1', 'Loopback 1')
+    midi_connection._midi_output = _CountingOutputPort(midi_connection._midi_output)
+
+    yield midi_connection
+
+    midi_connection.disconnect()
+    MidiConnection.shutdown()
+
+
+def _receive(midi_connection):
+    return [message for (_, message, _) in midi_connection.read_input_buffer()]
+
+
+def _get_calls(midi_connection):
+    calls = list(midi_connection._midi_output.calls)
+    midi_connection._midi_output.calls.clear()
+
+    return calls
+
+
+def test_burst_is_sent_in_one_go(midi_connection):
+    with midi_connection.burst():
+        midi_connection.send_control_change(0, 0x10, 0x01)
+        midi_connection.send_note_on(0x5E, 0x7F)
+        assert not _receive(midi_connection)
+
+    assert _get_calls(midi_connection) == ['write']
+    assert _receive(midi_connection) == [bytes([0xB0, 0x10, 0x01]), bytes([0x90, 0x5E, 0x7F])]
+
+
+def test_nested_bursts_are_sent_when_outermost_burst_ends(midi_connection):
+    with midi_connection.burst():
+        midi_connection.send_control_change(0, 0x10, 0x01)
+
+        with midi_connection.burst():
+            midi_connection.send_control_change(0, 0x11, 0x01)
+
+        assert not _get_calls(midi_connection)
+
+    assert _get_calls(midi_connection) == ['write']
+    assert len(_receive(midi_connection)) == 2
+
+
+def test_burst_keeps_sysex_in_order(midi_connection):
+    with midi_connection.burst():
+        midi_connection.send_control_change(0, 0x10, 0x01)
+        midi_connection.send_sysex([0x00, 0x20, 0x29], [0x01])
+        midi_connection.send_control_change(0, 0x11, 0x01)
+
+    assert _get_calls(midi_connection) == ['write', 'write_sysex', 'write']
+    assert _receive(midi_connection) == [
+        bytes([0xB0, 0x10, 0x01]),
+        bytes([0xF0, 0x00, 0x20, 0x29, 0x01, 0xF7]),
+        bytes([0xB0, 0x11, 0x01])
+    ]
+
+
+def test_burst_does_not_hold_back_other_threads(midi_connection):
+    with midi_connection.burst():
+        midi_connection.send_control_change(0, 0x10, 0x01)
+
+        thread = threading.Thread(target=midi_connection.send_note_on, args=(0x5E, 0x7F))
+        thread.start()
+        thread.join()
+
+        assert _receive(midi_connection) == [bytes([0x90, 0x5E, 0x7F])]
+
+    assert _receive(midi_connection) == [bytes([0xB0, 0x10, 0x01])]
+
+
+def test_burst_does_not_flush_coalesced_messages(midi_connection):
+    midi_connection.set_output_coalescing(True)
+    midi_connection.send_note_on(0x5E, 0x7F)
+
+    with midi_connection.burst():
+        midi_connection.send_control_change(0, 0x10, 0x01)
+
+    # the queued message waits for "flush_output()"
+    assert _receive(midi_connection) == [bytes([0xB0, 0x10, 0x01])]
+
+    midi_connection.flush_output()
+    assert _receive(midi_connection) == [bytes([0x90, 0x5E, 0x7F])]
+
+
+def test_burst_supersedes_coalesced_messages(midi_connection):
+    midi_connection.set_output_coalescing(True)
+    midi_connection.send_control_change(0, 0x10, 0x01)
+
+    with midi_connection.burst():
+        midi_connection.send_control_change(0, 0x10, 0x02)
+
+    midi_connection.flush_output()
+    assert _receive(midi_connection) == [bytes([0xB0, 0x10, 0x02])]
+
+
+def test_backends_can_be_selected_by_name():
+    assert MidiConnection.get_backend_names() == ['loopback', 'pygame', 'python-rtmidi']
+
+    MidiConnection.set_backend('loopback')
+    backend = MidiConnection.get_backend()
+
+    assert isinstance(backend, LoopbackMidiBackend)
+    assert MidiConnection.get_backend() is backend
+    assert MidiConnection.get_midi_inputs() == ['Loopback 1', 'Loopback 2']
+
+    MidiConnection.shutdown()
+
+
+def test_unknown_backend_is_rejected():
+    MidiConnection.set_backend('loopback')
+
+    with pytest.raises(KeyError):
+        MidiConnection.set_backend('unknown')
+
+    assert isinstance(MidiConnection.get_backend(), LoopbackMidiBackend)
+
+    MidiConnection.shutdown()
+
+
+def test_backend_is_initialised_again_after_shutdown():
+    MidiConnection.set_backend('loopback')
+    backend = MidiConnection.get_backend()
+
+    MidiConnection.shutdown()
+
+    assert MidiConnection.get_backend() is not backend
+
+    MidiConnection.shutdown()
+
+
+def test_loopback_cables_connect_midi_connections():
+    MidiConnection.set_backend('loopback')
+
+    received = []
+    midi_input = MidiConnection(lambda message, repaint=False: None,
+                                lambda status, message, timestamp: received.append(bytes(message)))
+    midi_input.connect('Loopback 2', 'Loopback 1')
+    midi_output = MidiConnection(lambda message, repaint=False: None, None)
+    midi_output.connect(None, 'Loopback 2')
+
+    midi_output.send_note_on(0x5E, 0x7F)
+    midi_input.process_input_buffer()
+
+    midi_input.disconnect()
+    midi_output.disconnect()
+    MidiConnection.shutdown()
+
+    assert received == [bytes([0x90, 0x5E, 0x7F])]
+
+
+def test_midi_ports_must_implement_backend_interface():
+    class IncompleteInputPort(MidiInputPort):
+        def poll(self):
+            return False
+
+    with pytest.raises(TypeError):
+        IncompleteInputPort()
+
+
+def test_coalesced_messages_are_sent_on_flush(midi_connection):
+    midi_connection.set_output_coalescing(True)
+    midi_connection.send_control_change(0, 0x10, 0x01)
+
+    assert not _get_calls(midi_connection)
+    assert not _receive(midi_connection)
+
+    midi_connection.flush_output()
+
+    assert _get_calls(midi_connection) == ['write']
+    assert _receive(midi_connection) == [bytes([0xB0, 0x10, 0x01])]
+
+    midi_connection.flush_output()
+    assert not _get_calls(midi_connection)
+
+
+def test_only_latest_controller_value_is_sent(midi_connection):
+    midi_connection.set_output_coalescing(True)
+
+    midi_connection.send_control_change(0, 0x10, 0x01)
+    midi_connection.send_control_change(0, 0x11, 0x01)
+    midi_connection.send_control_change(0, 0x10, 0x02)
+    midi_connection.send_control_change(1, 0x10, 0x03)
+    midi_connection.send_pitch_wheel_change(0, 0x0000)
+    midi_connection.send_pitch_wheel_change(0, 0x3FFF)
+    midi_connection.flush_output()
+
+    assert _receive(midi_connection) == [
+        bytes([0xB0, 0x10, 0x02]),
+        bytes([0xB0, 0x11, 0x01]),
+        bytes([0xB1, 0x10, 0x03]),
+        bytes([0xE0, 0x7F, 0x7F])
+    ]
+
+
+def test_notes_and_sysex_are_not_coalesced(midi_connection):
+    midi_connection.set_output_coalescing(True)
+
+    midi_connection.send_note_on(0x5E, 0x7F)
+    midi_connection.send_sysex([0x00, 0x20, 0x29], [0x01])
+    midi_connection.send_note_on(0x5E, 0x00)
+    midi_connection.send_sysex([0x00, 0x20, 0x29], [0x01])
+    midi_connection.flush_output()
+
+    assert _receive(midi_connection) == [
+        bytes([0x90, 0x5E, 0x7F]),
+        bytes([0xF0, 0x00, 0x20, 0x29, 0x01, 0xF7]),
+        bytes([0x90, 0x5E, 0x00]),
+        bytes([0xF0, 0x00, 0x20, 0x29, 0x01, 0xF7])
+    ]
+
+
+def test_disabling_coalescing_flushes_output(midi_connection):
+    midi_connection.set_output_coalescing(True)
+    midi_connection.send_control_change(0, 0x10, 0x01)
+
+    midi_connection.set_output_coalescing(False)
+    assert _receive(midi_connection) == [bytes([0xB0, 0x10, 0x01])]
+
+    midi_connection.send_control_change(0, 0x10, 0x02)
+    assert _get_calls(midi_connection) == ['write', 'write_short']
+    assert _receive(midi_connection) == [bytes([0xB0, 0x10, 0x02])]
+
+
+def test_input_is_read_in_batches(midi_connection):
+    midi_connection.set_read_batch_size(4)
+
+    for cc_value in range(10):
+        midi_connection.send_control_change(0, 0x10, cc_value)
+
+    assert len(_receive(midi_connection)) == 4
+    assert len(_receive(midi_connection)) == 4
+    assert len(_receive(midi_connection)) == 2
+    assert not _receive(midi_connection)
+
+
+def test_processing_input_drains_all_batches(midi_connection):
+    received = []
+    midi_connection._callback = lambda status, message, timestamp: received.append(message[2])
+    midi_connection.set_read_batch_size(4)
+
+    for cc_value in range(10):
+        midi_connection.send_control_change(0, 0x10, cc_value)
+
+    midi_connection.process_input_buffer()
+
+    assert received == list(range(10))
+    assert midi_connection.buffer_is_empty()
+
+
+def test_backends_are_initialised_on_first_use():
+    MidiConnection.shutdown()
+    MidiConnection.set_backend('loopback')
+
+    assert MidiConnection._backend is None
+
+    MidiConnection.get_midi_outputs()
+    assert MidiConnection._backend is not None
+
+    MidiConnection.shutdown()
+
+
+def test_optional_backends_are_not_imported():
+    # neither pygame nor python-rtmidi is needed to use other backends
+    assert 'pygame' not in sys.modules
+    assert 'rtmidi' not in sys.modules
+
+
+def test_arrival_timestamps_reach_callbacks(midi_connection):
+    received = []
+    midi_connection._callback = lambda status, message, timestamp: received.append(
+        (timestamp, MidiConnection.get_event_timestamp()))
+
+    start_time = time.perf_counter()
+    midi_connection.send_note_on(0x5E, 0x7F)
+    midi_connection.process_input_buffer()
+
+    [(timestamp, event_timestamp)] = received
+    assert start_time <= timestamp <= time.perf_counter()
+    assert event_timestamp == timestamp
+    assert MidiConnection.get_event_timestamp() is None
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+"""
+PythonMcu
+=========
+Mackie Host Controller written in Python
+Copyright (c) 2011 Martin Zuther (http://www.mzuther.de/)
+Copyright (c) 2021 Raphaël Doursenaud <rdoursenaud@free.fr>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Thank you for using free software!
+
+"""
+
+
+from PythonMcu.Midi.LoopbackMidiBackend import LoopbackMidiBackend
+from PythonMcu.Midi.MidiDeviceRegistry import MidiDeviceRegistry
+
+
+class _CountingBackend(LoopbackMidiBackend):
+    __module__ = __name__
+    __doc__ = 'Loopback MIDI backend that counts full device scans'
+
+    def __init__(self):
+        super().__init__()
+        self.scans = 0
+
+    def get_devices(self):
+        self.scans += 1
+        return super().get_devices()
+
+
+def test_devices_are_looked_up_by_name():
+    registry = MidiDeviceRegistry(_CountingBackend())
+
+    assert registry.get_input_names() == ['Loopback 1', 'Loopback 2']
+    assert registry.get_output_names() == ['Loopback 1', 'Loopback 2']
+    assert registry.find_input('Loopback 2') == 1
+    assert registry.find_output('Loopback 1') == 0
+    assert registry.find_input('Unknown') is None
+    assert registry.get_device_name(1) == 'Loopback 2'
+
+
+def test_devices_are_scanned_once():
+    backend = _CountingBackend()
+    registry = MidiDeviceRegistry(backend)
+
+    registry.get_input_names()
+    registry.find_input('Loopback 1')
+    registry.find_output('Loopback 2')
+
+    assert backend.scans == 1
+
+
+def test_added_devices_are_found():
+    backend = _CountingBackend()
+    registry = MidiDeviceRegistry(backend)
+    registry.rescan()
+
+    backend.add_cable('Loopback 3')
+
+    assert registry.find_input('Loopback 3') == 2
+
+
+def test_rescan_notices_swapped_devices():
+    backend = _CountingBackend()
+    registry = MidiDeviceRegistry(backend)
+
+    assert registry.rescan()
+    assert not registry.rescan()
+
+    # same number of devices, so only a full scan notices
+    backend._cable_names.reverse()
+    assert registry.find_input('Loopback 1') == 0
+
+    assert registry.rescan()
+    assert registry.find_input('Loopback 1') == 1
+    assert registry.find_input('Loopback 2') == 0
+
+
+def test_last_good_device_ids_spare_a_scan():
+    backend = _CountingBackend()
+    registry = MidiDeviceRegistry(backend)
+
+    registry.remember_input('Loopback 2', 1)
+    registry.remember_output('Loopback 2', 1)
+
+    assert registry.find_input('Loopback 2') == 1
+    assert registry.find_output('Loopback 2') == 1
+    assert backend.scans == 0
+
+
+def test_outdated_last_good_device_ids_are_ignored():
+    backend = _CountingBackend()
+    registry = MidiDeviceRegistry(backend)
+
+    registry.remember_input('Loopback 2', 0)
+
+    assert registry.find_input('Loopback 2') == 1
+    assert backend.scans == 1
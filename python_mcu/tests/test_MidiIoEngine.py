@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+"""
+PythonMcu
+=========
+Mackie Host Controller written in Python
+Copyright (c) 2011 Martin Zuther (http://www.mzuther.de/)
+Copyright (c) 2021 Raphaël Doursenaud <rdoursenaud@free.fr>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Thank you for using free software!
+
+"""
+
+
+import threading
+import time
+
+import pytest
+
+from PythonMcu.Midi.MidiConnection import MidiConnection
+from PythonMcu.Midi.MidiIoEngine import MidiIoEngine
+
+
+class _Receiver:
+    __module__ = __name__
+    __doc__ = 'MIDI callback that records received messages'
+
+    def __init__(self):
+        self.messages = []
+        self.received = threading.Event()
+
+    def __call__(self, status, message, timestamp):
+        self.messages.append(bytes(message))
+        self.received.set()
+
+
+@pytest.fixture
+def receiver():
+    MidiConnection.set_backend('loopback')
+
+    receiver = _Receiver()
+    midi_connection = MidiConnection(lambda message, repaint=False: None, receiver)
+    midi_connection.connect('Loopback 1', 'Loopback 1')
+    receiver.midi_connection = midi_connection
+
+    yield receiver
+
+    midi_connection.disconnect()
+    MidiConnection.shutdown()
+
+
+def _start_engine(midi_connection, poll_interval):
+    io_engine = MidiIoEngine(lambda message, repaint=False: None, poll_interval)
+    io_engine.add_connection(midi_connection)
+    io_engine.start()
+
+    return io_engine
+
+
+def test_input_event_wakes_reader_thread(receiver):
+    # reader threads that poll would not see the message in time
+    io_engine = _start_engine(receiver.midi_connection, poll_interval=60.0)
+
+    try:
+        time.sleep(0.05)
+        receiver.midi_connection.send_note_on(0x5E, 0x7F)
+
+        assert receiver.received.wait(5.0)
+        assert receiver.messages == [bytes([0x90, 0x5E, 0x7F])]
+    finally:
+        io_engine.stop()
+
+
+def test_inputs_without_input_event_are_polled(receiver):
+    receiver.midi_connection._midi_input.input_event = None
+    io_engine = _start_engine(receiver.midi_connection, poll_interval=0.001)
+
+    try:
+        receiver.midi_connection.send_control_change(0, 0x10, 0x41)
+
+        assert receiver.received.wait(5.0)
+        assert receiver.messages == [bytes([0xB0, 0x10, 0x41])]
+    finally:
+        io_engine.stop()
+
+
+def test_stop_wakes_waiting_reader_threads(receiver):
+    io_engine = MidiIoEngine(lambda message, repaint=False: None, 60.0)
+    io_engine.INPUT_EVENT_TIMEOUT = 60.0
+    io_engine.add_connection(receiver.midi_connection)
+    io_engine.start()
+    time.sleep(0.05)
+
+    start_time = time.perf_counter()
+    io_engine.stop()
+
+    assert time.perf_counter() - start_time < 5.0
+    assert not io_engine.is_running()
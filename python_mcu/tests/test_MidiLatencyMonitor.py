@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+"""
+PythonMcu
+=========
+Mackie Host Controller written in Python
+Copyright (c) 2011 Martin Zuther (http://www.mzuther.de/)
+Copyright (c) 2021 Raphaël Doursenaud <rdoursenaud@free.fr>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Thank you for using free software!
+
+"""
+
+
+import time
+
+import pytest
+
+from PythonMcu.Midi.MidiConnection import MidiConnection
+from PythonMcu.Midi.MidiLatencyMonitor import MidiLatencyMonitor
+from PythonMcu.Tools.LatencyHistogram import LatencyHistogram
+
+
+def test_empty_histogram():
+    histogram = LatencyHistogram()
+
+    assert histogram.get_count() == 0
+    assert histogram.get_mean() is None
+    assert histogram.get_maximum() is None
+    assert histogram.get_percentile(50) is None
+
+
+def test_percentiles_are_bucket_limits():
+    histogram = LatencyHistogram()
+
+    for _ in range(90):
+        histogram.record(0.0004)
+    for _ in range(10):
+        histogram.record(0.003)
+
+    assert histogram.get_count() == 100
+    assert histogram.get_mean() == pytest.approx(0.00066)
+    assert histogram.get_percentile(50) == 0.0005
+    assert histogram.get_percentile(95) == 0.003
+    assert histogram.get_maximum() == 0.003
+
+    histogram.reset()
+    assert histogram.get_count() == 0
+
+
+def test_overflow_bucket_reports_maximum():
+    histogram = LatencyHistogram()
+    histogram.record(2.5)
+
+    assert histogram.get_percentile(99) == 2.5
+
+
+def test_monitor_records_time_since_arrival():
+    latency_monitor = MidiLatencyMonitor()
+    latency_monitor.record('fader', time.perf_counter() - 0.002)
+
+    histogram = latency_monitor.get_histogram('fader')
+    assert histogram.get_count() == 1
+    assert 0.002 <= histogram.get_maximum() < 1.0
+
+
+def test_monitor_ignores_calls_outside_midi_callbacks():
+    latency_monitor = MidiLatencyMonitor()
+    latency_monitor.record('led')
+
+    assert MidiConnection.get_event_timestamp() is None
+    assert latency_monitor.get_histogram('led').get_count() == 0
+
+
+def test_report_lists_all_paths():
+    latency_monitor = MidiLatencyMonitor()
+    latency_monitor.record('key', time.perf_counter())
+
+    report = latency_monitor.get_report()
+
+    assert len(report) == 1 + len(MidiLatencyMonitor.PATHS)
+    assert report[0].split() == ['Path', 'count', 'p50', 'p95', 'p99', 'max']
+    assert report[3].split()[:2] == ['key', '1']
+    assert report[1].split() == ['fader', '0']
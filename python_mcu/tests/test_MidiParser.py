@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+"""
+PythonMcu
+=========
+Mackie Host Controller written in Python
+Copyright (c) 2011 Martin Zuther (http://www.mzuther.de/)
+Copyright (c) 2021 Raphaël Doursenaud <rdoursenaud@free.fr>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Thank you for using free software!
+
+"""
+
+
+from PythonMcu.Midi.MidiParser import MidiParser
+
+
+def _parse(parser, events):
+    messages = []
+    parser.parse(events, messages)
+    return messages
+
+
+def test_channel_messages():
+    parser = MidiParser()
+    messages = _parse(parser, [([0x90, 0x3C, 0x64, 0x00], 1), ([0xC1, 0x05, 0x00, 0x00], 2)])
+
+    assert messages == [
+        (0x90, bytes([0x90, 0x3C, 0x64]), 1.0),
+        (0xC0, bytes([0xC1, 0x05]), 2.0)
+    ]
+
+
+def test_timestamps_are_converted():
+    parser = MidiParser()
+    messages = []
+    parser.parse([([0xB0, 0x10, 0x01, 0x00], 1500)], messages, timestamp_scale=0.001, timestamp_offset=10.0)
+
+    assert messages[0][2] == 11.5
+
+
+def test_running_status():
+    parser = MidiParser()
+    messages = _parse(parser, [
+        ([0x90, 0x3C, 0x64, 0x00], 1),
+        ([0x3D, 0x64, 0x00, 0x00], 2),
+        ([0x3E, 0x00, 0x00, 0x00], 3)
+    ])
+
+    assert messages == [
+        (0x90, bytes([0x90, 0x3C, 0x64]), 1.0),
+        (0x90, bytes([0x90, 0x3D, 0x64]), 2.0),
+        (0x90, bytes([0x90, 0x3E, 0x00]), 3.0)
+    ]
+
+
+def test_running_status_survives_realtime_messages():
+    parser = MidiParser()
+    messages = _parse(parser, [
+        ([0xE0, 0x00, 0x40, 0x00], 1),
+        ([0xF8, 0x00, 0x00, 0x00], 2),
+        ([0x7F, 0x7F, 0x00, 0x00], 3)
+    ])
+
+    assert messages == [
+        (0xE0, bytes([0xE0, 0x00, 0x40]), 1.0),
+        (0xF0, bytes([0xF8]), 2.0),
+        (0xE0, bytes([0xE0, 0x7F, 0x7F]), 3.0)
+    ]
+
+
+def test_running_status_is_cancelled_by_sysex():
+    parser = MidiParser()
+    messages = _parse(parser, [
+        ([0x90, 0x3C, 0x64, 0x00], 1),
+        ([0xF0, 0x7E, 0xF7, 0x00], 2),
+        ([0x3D, 0x64, 0x00, 0x00], 3)
+    ])
+
+    assert messages == [
+        (0x90, bytes([0x90, 0x3C, 0x64]), 1.0),
+        (0xF0, bytes([0xF0, 0x7E, 0xF7]), 2.0)
+    ]
+
+
+def test_stray_data_bytes_are_ignored():
+    parser = MidiParser()
+
+    assert not _parse(parser, [([0x3C, 0x64, 0x00, 0x00], 1)])
+
+
+def test_sysex_across_events():
+    parser = MidiParser()
+    messages = _parse(parser, [
+        ([0xF0, 0x00, 0x20, 0x29], 1),
+        ([0x02, 0x03, 0x04, 0x05], 2),
+        ([0x06, 0xF7, 0x00, 0x00], 3)
+    ])
+
+    # SysEx messages carry the timestamp of their last event
+    assert messages == [
+        (0xF0, bytes([0xF0, 0x00, 0x20, 0x29, 0x02, 0x03, 0x04, 0x05, 0x06, 0xF7]), 3.0)
+    ]
+
+
+def test_sysex_across_calls():
+    parser = MidiParser()
+
+    assert not _parse(parser, [([0xF0, 0x01, 0x02, 0x03], 1)])
+    assert _parse(parser, [([0x04, 0xF7, 0x00, 0x00], 2)]) == [
+        (0xF0, bytes([0xF0, 0x01, 0x02, 0x03, 0x04, 0xF7]), 2.0)
+    ]
+
+
+def test_sysex_grows_buffer():
+    parser = MidiParser()
+    data = list(range(0x80)) * ((MidiParser.SYSEX_BUFFER_SIZE // 0x80) + 1)
+
+    events = [([0xF0] + data[:3], 0)]
+    for index in range(3, len(data), 4):
+        events.append((data[index:index + 4], 1))
+    events.append(([0xF7, 0x00, 0x00, 0x00], 2))
+
+    messages = _parse(parser, events)
+
+    assert len(messages) == 1
+    assert messages[0][1] == bytes([0xF0] + data + [0xF7])
+
+
+def test_realtime_messages_within_sysex():
+    parser = MidiParser()
+    messages = _parse(parser, [
+        ([0xF0, 0x01, 0xF8, 0x02], 1),
+        ([0xFE, 0x00, 0x00, 0x00], 2),
+        ([0x03, 0xF7, 0x00, 0x00], 3)
+    ])
+
+    assert messages == [
+        (0xF0, bytes([0xF8]), 1.0),
+        (0xF0, bytes([0xFE]), 2.0),
+        (0xF0, bytes([0xF0, 0x01, 0x02, 0x03, 0xF7]), 3.0)
+    ]
+
+
+def test_sysex_is_aborted_by_status_byte():
+    parser = MidiParser()
+    messages = _parse(parser, [
+        ([0xF0, 0x01, 0x02, 0x03], 1),
+        ([0x90, 0x3C, 0x64, 0x00], 2),
+        ([0x04, 0xF7, 0x00, 0x00], 3)
+    ])
+
+    assert messages == [(0x90, bytes([0x90, 0x3C, 0x64]), 2.0)]
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+"""
+PythonMcu
+=========
+Mackie Host Controller written in Python
+Copyright (c) 2011 Martin Zuther (http://www.mzuther.de/)
+Copyright (c) 2021 Raphaël Doursenaud <rdoursenaud@free.fr>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+Thank you for using free software!
+
+"""
+
+
+import pytest
+
+from PythonMcu.Hardware.NovationZeROSLMkII import NovationZeROSLMkII
+from PythonMcu.Midi.MidiConnection import MidiConnection
+
+
+@pytest.fixture
+def controller():
+    MidiConnection.set_backend('loopback')
+
+    controller = NovationZeROSLMkII('Loopback 1', 'Loopback 1', lambda message, repaint=False: None)
+    controller.sent_sysex = []
+    controller.send_midi_sysex = lambda data: controller.sent_sysex.append(list(data))
+
+    controller.sent_cc = []
+    controller.midi.send_control_change = \
+        lambda channel, cc_number, cc_value: controller.sent_cc.append((cc_number, cc_value))
+
+    yield controller
+
+    controller.midi.disconnect()
+    MidiConnection.shutdown()
+
+
+def _get_lcd_updates(controller):
+    # (third byte, which is always 0x00, display line, characters)
+    lcd_updates = [(data[2], data[3], bytes(data[5:])) for data in controller.sent_sysex]
+    controller.sent_sysex.clear()
+
+    return lcd_updates
+
+
+def _replace(lcd_block, index, characters):
+    return lcd_block[:index] + characters + lcd_block[index + len(characters):]
+
+
+LCD_BLOCK = b'Track 1  Track 2  Track 3  Track 4  Track 5  Track 6  Track 7  Track 8  '
+
+
+def test_first_update_sends_whole_block(controller):
+    controller._update_lcd_block(1, LCD_BLOCK)
+
+    assert _get_lcd_updates(controller) == [(0, 1, LCD_BLOCK)]
+
+
+def test_unchanged_block_is_not_sent(controller):
+    controller._update_lcd_block(1, LCD_BLOCK)
+    _get_lcd_updates(controller)
+
+    controller._update_lcd_block(1, LCD_BLOCK)
+    assert not _get_lcd_updates(controller)
+
+
+def test_changed_block_is_sent_in_full(controller):
+    controller._update_lcd_block(1, LCD_BLOCK)
+    _get_lcd_updates(controller)
+
+    lcd_block = _replace(LCD_BLOCK, 20, b'X')
+    controller._update_lcd_block(1, lcd_block)
+
+    assert _get_lcd_updates(controller) == [(0, 1, lcd_block)]
+
+
+def test_invalidated_blocks_are_sent_again(controller):
+    controller._update_lcd_block(1, LCD_BLOCK)
+    controller._invalidate_lcd()
+    _get_lcd_updates(controller)
+
+    controller._update_lcd_block(1, LCD_BLOCK)
+    assert _get_lcd_updates(controller) == [(0, 1, LCD_BLOCK)]
+
+
+def test_display_lines_are_tracked_separately(controller):
+    controller._update_lcd_block(1, LCD_BLOCK)
+    controller._update_lcd_block(2, LCD_BLOCK)
+    _get_lcd_updates(controller)
+
+    controller._update_lcd_block(2, _replace(LCD_BLOCK, 0, b'X'))
+    controller._update_lcd_block(4, LCD_BLOCK)
+
+    assert _get_lcd_updates(controller) == [(0, 2, _replace(LCD_BLOCK, 0, b'X')), (0, 4, LCD_BLOCK)]
+
+
+def test_invalid_characters_are_replaced(controller):
+    controller._is_connected = True
+    controller._update_lcd_raw(1, [0x41, 0x1F, 0x80, 0x2013] + [0x20] * 68)
+
+    assert _get_lcd_updates(controller) == [
+        (0, 3, b'A***' + b' ' * 68),
+        (0, 4, b'A***' + b' ' * 68)
+    ]
+
+
+def _get_control_changes(controller):
+    control_changes = list(controller.sent_cc)
+    controller.sent_cc.clear()
+
+    return control_changes
+
+
+def test_unchanged_leds_are_not_sent(controller):
+    controller._is_connected = True
+    controller.set_led('cc24', 1)
+    controller.set_led('cc24', 1)
+
+    assert _get_control_changes(controller) == [(24, 1)]
+
+
+def test_cleared_button_leds_are_not_sent(controller):
+    controller._is_connected = True
+    controller.set_led('cc24', 1)
+    controller.all_leds_off()
+    _get_control_changes(controller)
+
+    controller.set_led('cc24', 0)
+    controller.set_led('cc25', 0)
+    assert not _get_control_changes(controller)
+
+    controller.set_led('cc24', 1)
+    assert _get_control_changes(controller) == [(24, 1)]
+
+
+def test_encoder_rings_are_sent_after_clearing_leds(controller):
+    controller._is_connected = True
+    controller.set_vpot_led_ring(2, False, controller.VPOT_MODE_WRAP, 0)
+    controller.all_leds_off()
+    _get_control_changes(controller)
+
+    # mode 0 ("wrap") and position 0 are not known to be set
+    controller.set_vpot_led_ring(2, False, controller.VPOT_MODE_WRAP, 0)
+    assert _get_control_changes(controller) == [(0x7A, 0x00), (0x72, 0)]
+
+    controller.set_vpot_led_ring(2, False, controller.VPOT_MODE_WRAP, 0)
+    assert not _get_control_changes(controller)